@@ -2,9 +2,18 @@ from .constants import value_constants
 from .datastructure import Object
 from .datastructure import PropertySet, Attribute, Aggregation, UseCase, Phase, Project
 
-from .exporter import desite
 from .util.project import merge_projects
-from .exporter.excel.core import export as export_excel
 
 __version__ = "1.8.1"
 active_project = None
+
+
+def __getattr__(name: str):
+    # exporters pull in lxml and openpyxl, so they are imported on first use
+    if name == "desite":
+        from .exporter import desite
+        return desite
+    if name == "export_excel":
+        from .exporter.excel.core import export as export_excel
+        return export_excel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,14 @@ from uuid import uuid4
 import SOMcreator
 from .base import Hirarchy
 
+# changes of Aggregations that get passed to the aggregation listeners of the Project
+AGGREGATION_ADDED = "added"
+AGGREGATION_REMOVED = "removed"
+AGGREGATION_REPARENTED = "reparented"
+
 
 class Aggregation(Hirarchy):
-    _registry: set[Aggregation] = set()
+    __slots__ = ("object", "_parent_connection")
 
     def __str__(self):
         return self.name
@@ -16,7 +21,6 @@ class Aggregation(Hirarchy):
                  optional: None | bool = None, filter_matrix: list[list[bool]] = None):
 
         super(Aggregation, self).__init__(obj.name, description, optional, obj.project, filter_matrix)
-        self._registry.add(self)
         if uuid is None:
             self.uuid = str(uuid4())
         else:
@@ -46,6 +50,7 @@ class Aggregation(Hirarchy):
     @parent_connection.setter
     def parent_connection(self, value):
         self._parent_connection = value
+        self._notify(AGGREGATION_REPARENTED)
 
     @property
     def parent(self) -> Aggregation:
@@ -56,8 +61,18 @@ class Aggregation(Hirarchy):
             return False
         self._parent = value
         self._parent_connection = connection_type
+        self._notify(AGGREGATION_REPARENTED)
         return True
 
+    def remove_parent(self) -> None:
+        super(Aggregation, self).remove_parent()
+        self._notify(AGGREGATION_REPARENTED)
+
+    def _notify(self, change: str) -> None:
+        project = self.project
+        if project is not None:
+            project.notify_aggregation_change(change, self)
+
     def add_child(self, child: Aggregation, connection_type: int = SOMcreator.value_constants.AGGREGATION) -> bool:
         """returns if adding child is allowed"""
 
@@ -78,7 +93,7 @@ class Aggregation(Hirarchy):
         if not child.set_parent(self, connection_type):
             return False
 
-        self._children.add(child)
+        self._add_child(child)
         child.parent_connection = connection_type
         return True
 
@@ -1,12 +1,32 @@
 from __future__ import annotations
 from uuid import uuid4
 import SOMcreator
-from .base import Hirarchy
+from .base import Hirarchy, intern_text
 import copy as cp
 
 
+def _value_lookup(values: tuple) -> frozenset | None:
+    try:
+        return frozenset(values)
+    except TypeError:  # range values are lists
+        return None
+
+
+def _contains(values: tuple, lookup: frozenset | None, value) -> bool:
+    if lookup is None:
+        return value in values
+    try:
+        return value in lookup
+    except TypeError:
+        return value in values
+
+
 class Attribute(Hirarchy):
-    _registry: set[Attribute] = set()
+    __slots__ = ("_value", "_property_set", "_value_type", "_data_type", "_revit_name", "_child_inherits_values",
+                 "_value_cache")
+    # bumped whenever values, value inheritance or parents of any Attribute change. A resolved value is valid as long
+    # as the version it was created with is the current one
+    _value_version = 0
 
     def __init__(self, property_set: SOMcreator.PropertySet | None = None, name: str = "undef", value: list = None, value_type:str|None=None,
                  data_type: str = SOMcreator.value_constants.LABEL,
@@ -17,14 +37,14 @@ class Attribute(Hirarchy):
 
         super(Attribute, self).__init__(name, description, optional, project, filter_matrix)
         self._value = value
+        self._value_cache: tuple[int, bool, tuple, frozenset | None] | None = None
         self._property_set = property_set
-        self._value_type = value_type
-        self._data_type = data_type
-        self._registry.add(self)
+        self._value_type = intern_text(value_type)
+        self._data_type = intern_text(data_type)
         if revit_mapping is None:
-            self._revit_name = name
+            self._revit_name = self._name
         else:
-            self._revit_name = revit_mapping
+            self._revit_name = intern_text(revit_mapping)
 
         self._child_inherits_values = child_inherits_values
         self.uuid = uuid
@@ -54,7 +74,7 @@ class Attribute(Hirarchy):
                                uuid=str(uuid4()),
                                description=self.description, optional=self.is_optional(ignore_hirarchy=True),
                                revit_mapping=self.revit_name,
-                               project=self.project, filter_matrix=self._filter_matrix)
+                               project=self.project, filter_matrix=self.get_filter_matrix())
 
         if self.parent is not None:
             self.parent.add_child(new_attrib)
@@ -81,6 +101,61 @@ class Attribute(Hirarchy):
     @child_inherits_values.setter
     def child_inherits_values(self, value: bool) -> None:
         self._child_inherits_values = value
+        Attribute._values_changed()
+        self._identifier_changed()
+
+    @property
+    def parent(self) -> Attribute | None:
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent: Attribute | None) -> None:
+        Hirarchy.parent.fset(self, parent)
+        Attribute._values_changed()
+
+    def remove_parent(self) -> None:
+        super(Attribute, self).remove_parent()
+        Attribute._values_changed()
+
+    @classmethod
+    def _values_changed(cls) -> None:
+        cls._value_version += 1
+
+    def _get_resolved_value(self) -> tuple[bool, tuple, frozenset | None]:
+        """
+        returns if the Attribute inherits values, its values including the inherited ones and a set of them for
+        membership tests. The result is cached until the next change of any values or the Attribute hirarchy
+        """
+        cache = self._value_cache
+        if cache is not None and cache[0] == Attribute._value_version:
+            return cache[1], cache[2], cache[3]
+        parent = self.parent
+        is_inheriting = False
+        if parent is not None:
+            parent_is_inheriting, parent_values, parent_lookup = parent._get_resolved_value()
+            is_inheriting = parent_is_inheriting or parent.child_inherits_values
+        if is_inheriting:
+            values = parent_values + tuple(v for v in self._value if not _contains(parent_values, parent_lookup, v))
+        else:
+            values = tuple(self._value)
+        lookup = _value_lookup(values)
+        self._value_cache = (Attribute._value_version, is_inheriting, values, lookup)
+        return is_inheriting, values, lookup
+
+    def is_identifier(self) -> bool:
+        if self.property_set is None or self.property_set.object is None:
+            return False
+        return self.property_set.object.ident_attrib is self
+
+    def _affects_identifier(self) -> bool:
+        if self.is_identifier():
+            return True
+        return any(child._affects_identifier() for child in self.get_children(filter=False))
+
+    def _identifier_changed(self) -> None:
+        """invalidates the identifier index of the project if the values of an identifier Attribute might change"""
+        if self.project is not None and self._affects_identifier():
+            self.project.invalidate_ident_index()
 
     @property
     def name(self) -> str:
@@ -89,7 +164,7 @@ class Attribute(Hirarchy):
     @name.setter
     def name(self, value: str) -> None:
         # ToDo: add request for unlink
-        self._name = value
+        self._name = intern_text(value)
         for child in self.get_children(filter=False):
             child.name = value
 
@@ -97,32 +172,37 @@ class Attribute(Hirarchy):
     def is_inheriting_values(self) -> bool:
         if self.parent is None:
             return False
-        if self.parent.is_inheriting_values or self.parent.child_inherits_values:
-            return True
-        return False
+        return self._get_resolved_value()[0]
 
     def get_own_values(self):
         """returns values without inherited values"""
         if not self.parent:
-            return self._value
-        return [v for v in self._value if v not in self.parent.value]
+            return list(self._value)
+        _, parent_values, parent_lookup = self.parent._get_resolved_value()
+        return [v for v in self._value if not _contains(parent_values, parent_lookup, v)]
 
     @property
     def value(self) -> list:
-        if self.is_inheriting_values:
-            return self.parent.value + self.get_own_values()
-        return self._value
+        """
+        returns a copy, because the resolved values of the children are cached.
+        Changes have to be assigned through the setter
+        """
+        if self.parent is None:
+            return list(self._value)
+        is_inheriting, values, _ = self._get_resolved_value()
+        if is_inheriting:
+            return list(values)
+        return list(self._value)
 
     @value.setter
     def value(self, values: list) -> None:
         if self.is_inheriting_values:
-            own_values = list()
-            for value in values:
-                if value not in self.parent.value:
-                    own_values.append(value)
-            self._value = own_values
+            _, parent_values, parent_lookup = self.parent._get_resolved_value()
+            self._value = [v for v in values if not _contains(parent_values, parent_lookup, v)]
         else:
             self._value = values
+        Attribute._values_changed()
+        self._identifier_changed()
 
     @property
     def value_type(self) -> str:
@@ -130,7 +210,7 @@ class Attribute(Hirarchy):
 
     @value_type.setter
     def value_type(self, value: str):
-
+        value = intern_text(value)
         if not self.is_child:
             self._value_type = value
 
@@ -149,6 +229,7 @@ class Attribute(Hirarchy):
 
     @data_type.setter
     def data_type(self, value: str) -> None:
+        value = intern_text(value)
         if not self.is_child:
             self._data_type = value
 
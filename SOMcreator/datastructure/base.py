@@ -1,16 +1,22 @@
 from __future__ import annotations
 
-import copy
-
 from SOMcreator.constants import value_constants
 import SOMcreator
 from typing import Iterator, Callable
 import logging
+import sys
 import SOMcreator.datastructure.som_json
 
 FILTER_KEYWORD = "filter"
 
 
+def intern_text(value):
+    """names, datatypes and values repeat a lot within a SOM, equal strings share one object"""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
 def filterable(func: Callable):
     """decorator function that filters list output of function by  phase and use_case"""
 
@@ -32,19 +38,41 @@ def filterable(func: Callable):
     return inner
 
 
+def filter_matrix_to_mask(filter_matrix: list[list[bool]]) -> int:
+    """packs a filter matrix [phase][use_case] into an integer. Bit index is phase_index * use_case_count + use_case_index"""
+    mask = 0
+    bit = 1
+    for use_case_list in filter_matrix:
+        for state in use_case_list:
+            if state:
+                mask |= bit
+            bit <<= 1
+    return mask
+
+
+def filter_mask_to_matrix(mask: int, phase_count: int, use_case_count: int) -> list[list[bool]]:
+    return [[bool(mask >> (phase_index * use_case_count + use_case_index) & 1) for use_case_index in
+             range(use_case_count)] for phase_index in range(phase_count)]
+
+
 class IterRegistry(type):
-    _registry = set()
-    """ Helper for Iteration"""
+    """ Helper for Iteration over the items of the active Project. The items are registered in their Project"""
 
     def __iter__(self) -> Iterator[
         SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation]:
-        return iter(sorted(list(self._registry), key=lambda x: x.name))
+        if SOMcreator.active_project is None:
+            return iter([])
+        return iter(sorted(SOMcreator.active_project.get_items(self), key=lambda x: x.name))
 
     def __len__(self) -> int:
-        return len(self._registry)
+        if SOMcreator.active_project is None:
+            return 0
+        return len(list(SOMcreator.active_project.get_items(self)))
 
 
 class Hirarchy(object, metaclass=IterRegistry):
+    __slots__ = ("_project", "_uuid", "_filter_mask", "_parent", "_children", "_name", "_mapping_dict",
+                 "_description", "_optional", "__weakref__")
 
     def __init__(self, name: str, description: str | None = None, optional: bool | None = None,
                  project: SOMcreator.Project | None = None,
@@ -53,19 +81,17 @@ class Hirarchy(object, metaclass=IterRegistry):
             project = SOMcreator.active_project
 
         self._project = project
+        self._uuid = None
         project.add_item(self)
 
         if filter_matrix is None:
-            filter_matrix = project.create_filter_matrix(True)
-
-        self._filter_matrix = copy.deepcopy(filter_matrix)
+            self._filter_mask = project.get_full_filter_mask()
+        else:
+            self._filter_mask = filter_matrix_to_mask(filter_matrix)
         self._parent = None
-        self._children = set()
-        self._name = name
-        self._mapping_dict = {
-            value_constants.SHARED_PARAMETERS:  True,
-            SOMcreator.datastructure.som_json.IFC_MAPPING: True
-        }
+        self._children: set | None = None  # allocated with the first child
+        self._name = intern_text(name)
+        self._mapping_dict: dict[str, bool] | None = None  # default mapping until it gets requested
         self._description = ""
         if description is not None:
             self.description = description
@@ -76,12 +102,29 @@ class Hirarchy(object, metaclass=IterRegistry):
 
     def remove_parent(self) -> None:
         if self.parent is not None:
-            if self in self.parent._children:
+            if self.parent._has_child(self):
                 self.parent.remove_child(self)
         self._parent = None
 
-    def get_filter_matrix(self):
-        return copy.deepcopy(self._filter_matrix)
+    def _has_child(self, child) -> bool:
+        return self._children is not None and child in self._children
+
+    def _add_child(self, child) -> None:
+        if self._children is None:
+            self._children = set()
+        self._children.add(child)
+
+    def get_filter_matrix(self) -> list[list[bool]]:
+        return filter_mask_to_matrix(self._filter_mask, len(self.project.get_phases()),
+                                     len(self.project.get_usecases()))
+
+    def set_filter_matrix(self, filter_matrix: list[list[bool]]) -> None:
+        self._filter_mask = filter_matrix_to_mask(filter_matrix)
+        if self.project:
+            self.project.notify_filter_change()
+
+    def get_filter_mask(self) -> int:
+        return self._filter_mask
 
     def get_filter_state(self, phase: SOMcreator.Phase, use_case: SOMcreator.UseCase) -> bool | None:
         if self.project:
@@ -98,29 +141,45 @@ class Hirarchy(object, metaclass=IterRegistry):
             use_case_index = self.project.get_use_case_index(use_case)
         if phase_index is None or use_case_index is None:
             return None
-        return bool(self._filter_matrix[phase_index][use_case_index])
+        return bool(self._filter_mask & self.project.get_filter_bit(phase_index, use_case_index))
 
     def set_filter_state(self, phase: SOMcreator.Phase, use_case: SOMcreator.UseCase, value: bool) -> None:
         phase_index = self.project.get_phase_index(phase)
         use_case_index = self.project.get_use_case_index(use_case)
-        self._filter_matrix[phase_index][use_case_index] = value
+        bit = self.project.get_filter_bit(phase_index, use_case_index)
+        if value:
+            self._filter_mask |= bit
+        else:
+            self._filter_mask &= ~bit
+        self.project.notify_filter_change()
 
     def remove_phase(self, phase: SOMcreator.Phase) -> None:
         phase_index = self.project.get_phase_index(phase)
-        self.get_filter_matrix().pop(phase_index)
+        filter_matrix = self.get_filter_matrix()
+        filter_matrix.pop(phase_index)
+        self.set_filter_matrix(filter_matrix)
 
     def remove_use_case(self, use_case: SOMcreator.UseCase) -> None:
         use_case_index = self.project.get_use_case_index(use_case)
-        for use_case_list in self._filter_matrix:
+        filter_matrix = self.get_filter_matrix()
+        for use_case_list in filter_matrix:
             use_case_list.pop(use_case_index)
+        self.set_filter_matrix(filter_matrix)
 
     def add_project_phase(self) -> None:
-        use_cases = self.project.get_usecases()
-        self._filter_matrix.append([True for _ in use_cases])
+        """gets called after the phase was added to the project"""
+        use_case_count = len(self.project.get_usecases())
+        phase_index = len(self.project.get_phases()) - 1
+        self._filter_mask |= ((1 << use_case_count) - 1) << (phase_index * use_case_count)
+        self.project.notify_filter_change()
 
     def add_use_case(self) -> None:
-        for use_case_list in self._filter_matrix:
+        """gets called after the use case was added to the project"""
+        use_case_count = len(self.project.get_usecases()) - 1
+        filter_matrix = filter_mask_to_matrix(self._filter_mask, len(self.project.get_phases()), use_case_count)
+        for use_case_list in filter_matrix:
             use_case_list.append(True)
+        self.set_filter_matrix(filter_matrix)
 
     def is_active(self) -> bool:
         """
@@ -129,16 +188,23 @@ class Hirarchy(object, metaclass=IterRegistry):
         """
         if not self.project:
             return True
-        for phase in self.project.active_phases:
-            for usecase in self.project.active_usecases:
-                if self.get_filter_state(phase, usecase):
-                    return True
-        return False
+        return bool(self._filter_mask & self.project.get_active_filter_mask())
 
     @property
     def project(self):
         return self._project
 
+    @property
+    def uuid(self) -> str | None:
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value: str | None) -> None:
+        old_uuid = self._uuid
+        self._uuid = value
+        if self._project is not None:
+            self._project.update_uuid_index(self, old_uuid, value)
+
     def is_optional(self, ignore_hirarchy=False) -> bool:
         if ignore_hirarchy:
             return self._optional
@@ -164,6 +230,11 @@ class Hirarchy(object, metaclass=IterRegistry):
 
     @property
     def mapping_dict(self) -> dict[str, bool]:
+        if self._mapping_dict is None:
+            self._mapping_dict = {
+                value_constants.SHARED_PARAMETERS: True,
+                SOMcreator.datastructure.som_json.IFC_MAPPING: True
+            }
         return self._mapping_dict
 
     @mapping_dict.setter
@@ -176,7 +247,7 @@ class Hirarchy(object, metaclass=IterRegistry):
 
     @name.setter
     def name(self, value: str):
-        self._name = value
+        self._name = intern_text(value)
         for child in self.get_children(filter=False):
             child.name = value
 
@@ -191,7 +262,7 @@ class Hirarchy(object, metaclass=IterRegistry):
             self.parent._children.remove(self)
         self._parent = parent
         if parent is not None:
-            self._parent._children.add(self)
+            self._parent._add_child(self)
 
     @property
     def is_parent(self) -> bool:
@@ -210,16 +281,18 @@ class Hirarchy(object, metaclass=IterRegistry):
     @filterable
     def get_children(self) -> Iterator[
         SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation]:
+        if self._children is None:
+            return iter(())
         return iter(self._children)
 
     def add_child(self,
                   child: SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation) -> None:
-        self._children.add(child)
+        self._add_child(child)
         child.parent = self
 
     def remove_child(self,
                      child: SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation | Hirarchy) -> None:
-        if child in self._children:
+        if self._has_child(child):
             self._children.remove(child)
             child.remove_parent()
 
@@ -228,9 +301,6 @@ class Hirarchy(object, metaclass=IterRegistry):
         if self.parent is not None:
             self.parent.remove_child(self)
 
-        if self in self._registry:
-            self._registry.remove(self)
-
         if recursive:
             for child in list(self.get_children(filter=False)):
                 child.delete(recursive)
@@ -2,12 +2,23 @@ from __future__ import annotations
 import SOMcreator
 from uuid import uuid4
 from typing import Iterator
-from .base import filterable, Hirarchy
+from .base import filterable, Hirarchy, intern_text
 import copy as cp
 
 
+DEFAULT_IFC_MAPPING = frozenset({"IfcBuildingElementProxy"})
+# equal mappings of different Objects share one frozenset, changing a mapping replaces it
+ifc_mapping_cache: dict[frozenset[str], frozenset[str]] = dict()
+
+
+def _shared_ifc_mapping(value: set[str] | frozenset[str]) -> frozenset[str]:
+    value = frozenset(intern_text(item) for item in value)
+    return ifc_mapping_cache.setdefault(value, value)
+
+
 class Object(Hirarchy):
-    _registry: set[Object] = set()
+    __slots__ = ("_property_sets", "_ident_attrib", "_aggregations", "_custom_attributes", "_abbreviation",
+                 "_ifc_mapping")
 
     def __init__(self, name: str, ident_attrib: [SOMcreator.Attribute, str], uuid: str = None,
                  ifc_mapping: set[str] | None = None, description: None | str = None,
@@ -15,19 +26,18 @@ class Object(Hirarchy):
                  project: None | SOMcreator.Project = None,
                  filter_matrix: list[list[bool]] = None) -> None:
         super(Object, self).__init__(name, description, optional, project, filter_matrix)
-        self._registry.add(self)
         self._property_sets: list[SOMcreator.PropertySet] = list()
         self._ident_attrib = ident_attrib
-        self._aggregations: set[SOMcreator.Aggregation] = set()
-        self.custom_attribues = {}
+        self._aggregations: set[SOMcreator.Aggregation] | None = None  # allocated with the first Aggregation
+        self._custom_attributes: dict | None = None
 
         self._abbreviation = abbreviation
         if abbreviation is None:
             self._abbreviation = ""
 
-        self._ifc_mapping = ifc_mapping
-        if ifc_mapping is None:
-            self._ifc_mapping = {"IfcBuildingElementProxy"}
+        self._ifc_mapping = DEFAULT_IFC_MAPPING
+        if ifc_mapping is not None:
+            self._ifc_mapping = _shared_ifc_mapping(ifc_mapping)
 
         self.uuid = uuid
         if uuid is None:
@@ -61,7 +71,7 @@ class Object(Hirarchy):
                             ifc_mapping=self.ifc_mapping,
                             description=self.description, optional=self.is_optional(ignore_hirarchy=True),
                             abbreviation=self.abbreviation,
-                            project=self.project, filter_matrix=self._filter_matrix)
+                            project=self.project, filter_matrix=self.get_filter_matrix())
 
         for pset in new_property_sets:
             new_object.add_property_set(pset)
@@ -75,6 +85,16 @@ class Object(Hirarchy):
     def project(self) -> SOMcreator.Project | None:
         return self._project
 
+    @property
+    def custom_attribues(self) -> dict:
+        if self._custom_attributes is None:
+            self._custom_attributes = dict()
+        return self._custom_attributes
+
+    @custom_attribues.setter
+    def custom_attribues(self, value: dict) -> None:
+        self._custom_attributes = value
+
     @property
     def abbreviation(self) -> str:
         return self._abbreviation
@@ -84,7 +104,7 @@ class Object(Hirarchy):
         self._abbreviation = value
 
     @property
-    def ifc_mapping(self) -> set[str]:
+    def ifc_mapping(self) -> frozenset[str]:
         return self._ifc_mapping
 
     @ifc_mapping.setter
@@ -93,22 +113,30 @@ class Object(Hirarchy):
         for item in value:  # filter empty Inputs
             if not (item == "" or item is None):
                 value_set.add(item)
-        self._ifc_mapping = value_set
+        self._ifc_mapping = _shared_ifc_mapping(value_set)
 
     def add_ifc_map(self, value: str) -> None:
-        self._ifc_mapping.add(value)
+        self._ifc_mapping = _shared_ifc_mapping(self._ifc_mapping | {value})
 
     def remove_ifc_map(self, value: str) -> None:
-        self._ifc_mapping.remove(value)
+        if value not in self._ifc_mapping:
+            raise KeyError(value)
+        self._ifc_mapping = _shared_ifc_mapping(self._ifc_mapping - {value})
 
     @property
     def aggregations(self) -> set[SOMcreator.Aggregation]:
+        if self._aggregations is None:
+            return set()
         return self._aggregations
 
     def add_aggregation(self, node: SOMcreator.Aggregation) -> None:
+        if self._aggregations is None:
+            self._aggregations = set()
         self._aggregations.add(node)
 
     def remove_aggregation(self, node: SOMcreator.Aggregation) -> None:
+        if self._aggregations is None:
+            raise KeyError(node)
         self._aggregations.remove(node)
 
     @property
@@ -146,6 +174,8 @@ class Object(Hirarchy):
     @ident_attrib.setter
     def ident_attrib(self, value: SOMcreator.Attribute) -> None:
         self._ident_attrib = value
+        if self.project is not None:
+            self.project.invalidate_ident_index()
 
     # override name setter because of intheritance
     @property
@@ -154,7 +184,7 @@ class Object(Hirarchy):
 
     @name.setter
     def name(self, value: str):
-        self._name = value
+        self._name = intern_text(value)
 
     def add_property_set(self, property_set: SOMcreator.PropertySet) -> None:
         self._property_sets.append(property_set)
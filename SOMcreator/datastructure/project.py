@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import os
-from typing import Iterator
+from typing import Callable, Iterator
 
 import SOMcreator
 import SOMcreator.exporter.som_json
 import SOMcreator.importer.som_json
 from .base import Hirarchy, filterable
+from .aggregation import AGGREGATION_ADDED, AGGREGATION_REMOVED
 
 
 class Project(object):
@@ -17,10 +18,17 @@ class Project(object):
         """
         SOMcreator.active_project = self
         self._items = set()
+        self._uuid_index: dict[str, Hirarchy] = dict()
+        self._ident_index: dict[str, SOMcreator.Object] | None = None
+        self._type_index: dict[type, set[Hirarchy]] = {item_type: set() for item_type in (
+            SOMcreator.Object, SOMcreator.PropertySet, SOMcreator.Attribute, SOMcreator.Aggregation)}
+        self._aggregation_listeners: list[Callable[[str, SOMcreator.Aggregation], None]] = list()
+        self._filter_listeners: list[Callable[[], None]] = list()
         self._name = ""
         self._author = author
         self._version = "1.0.0"
         self.name = name
+        self._active_filter_mask: int | None = None
         self.aggregation_attribute = ""
         self.aggregation_pset = ""
         self._filter_matrix = filter_matrix
@@ -47,10 +55,86 @@ class Project(object):
 
     def add_item(self, item: Hirarchy):
         self._items.add(item)
+        for item_type, bucket in self._type_index.items():
+            if isinstance(item, item_type):
+                bucket.add(item)
+        if getattr(item, "uuid", None) is not None:
+            self._uuid_index[item.uuid] = item
+        if isinstance(item, SOMcreator.Object):
+            self.invalidate_ident_index()
+        elif isinstance(item, SOMcreator.Aggregation):
+            self.notify_aggregation_change(AGGREGATION_ADDED, item)
 
     def remove_item(self, item: Hirarchy):
         if item in self._items:
             self._items.remove(item)
+        for bucket in self._type_index.values():
+            bucket.discard(item)
+        uuid = getattr(item, "uuid", None)
+        if uuid is not None and self._uuid_index.get(uuid) is item:
+            self._uuid_index.pop(uuid)
+        if isinstance(item, SOMcreator.Object):
+            self.invalidate_ident_index()
+        elif isinstance(item, SOMcreator.Aggregation):
+            self.notify_aggregation_change(AGGREGATION_REMOVED, item)
+
+    def add_aggregation_listener(self, listener: Callable[[str, SOMcreator.Aggregation], None]):
+        """listener gets called with the change and the Aggregation if an Aggregation is added, removed or reparented"""
+        if listener not in self._aggregation_listeners:
+            self._aggregation_listeners.append(listener)
+
+    def remove_aggregation_listener(self, listener: Callable[[str, SOMcreator.Aggregation], None]):
+        if listener in self._aggregation_listeners:
+            self._aggregation_listeners.remove(listener)
+
+    def notify_aggregation_change(self, change: str, aggregation: SOMcreator.Aggregation):
+        for listener in self._aggregation_listeners:
+            listener(change, aggregation)
+
+    def add_filter_listener(self, listener: Callable[[], None]):
+        """listener gets called if the active phases, use cases or the filter of an item change"""
+        if listener not in self._filter_listeners:
+            self._filter_listeners.append(listener)
+
+    def remove_filter_listener(self, listener: Callable[[], None]):
+        if listener in self._filter_listeners:
+            self._filter_listeners.remove(listener)
+
+    def notify_filter_change(self):
+        for listener in self._filter_listeners:
+            listener()
+
+    def update_uuid_index(self, item: Hirarchy, old_uuid: str | None, new_uuid: str | None):
+        """gets called by Hirarchy if the uuid of an item changes"""
+        if old_uuid is not None and self._uuid_index.get(old_uuid) is item:
+            self._uuid_index.pop(old_uuid)
+        if new_uuid is not None and item in self._items:
+            self._uuid_index[new_uuid] = item
+
+    def get_items(self, item_type: type) -> Iterator[Hirarchy]:
+        """returns all items of the given class that belong to this Project"""
+        if item_type in self._type_index:
+            return iter(self._type_index[item_type])
+        return filter(lambda i: isinstance(i, item_type), self._items)
+
+    def close(self):
+        """
+        releases the items of the Project. The items only get registered in their Project,
+        so they can be garbage collected once the Project isn't referenced anymore
+        """
+        self._items = set()
+        for item_type in self._type_index:
+            self._type_index[item_type] = set()
+        self._uuid_index = dict()
+        self._ident_index = None
+        self._aggregation_listeners = list()
+        self._filter_listeners = list()
+        if SOMcreator.active_project is self:
+            SOMcreator.active_project = None
+
+    def invalidate_ident_index(self):
+        """gets called if an Object is added/removed or the value of an identifier Attribute changes"""
+        self._ident_index = None
 
     @filterable
     def get_root_objects(self) -> Iterator[SOMcreator.Object]:
@@ -65,19 +149,19 @@ class Project(object):
 
     @filterable
     def get_objects(self) -> Iterator[SOMcreator.Object]:
-        return filter(lambda item: isinstance(item, SOMcreator.Object), self._items)
+        return iter(self._type_index[SOMcreator.Object])
 
     @filterable
     def get_property_sets(self) -> Iterator[SOMcreator.PropertySet]:
-        return filter(lambda item: isinstance(item, SOMcreator.PropertySet), self._items)
+        return iter(self._type_index[SOMcreator.PropertySet])
 
     @filterable
     def get_attributes(self) -> Iterator[SOMcreator.Attribute]:
-        return filter(lambda item: isinstance(item, SOMcreator.Attribute), self._items)
+        return iter(self._type_index[SOMcreator.Attribute])
 
     @filterable
     def get_aggregations(self) -> Iterator[SOMcreator.Aggregation]:
-        return filter(lambda item: isinstance(item, SOMcreator.Aggregation), self._items)
+        return iter(self._type_index[SOMcreator.Aggregation])
 
     @filterable
     def get_predefined_psets(self) -> Iterator[SOMcreator.PropertySet]:
@@ -105,32 +189,30 @@ class Project(object):
         else:
             return "", ""
 
+    def get_ident_dict(self) -> dict[str, SOMcreator.Object]:
+        """returns the Identifier->Object index. The index gets rebuilt after it was invalidated"""
+        if self._ident_index is None:
+            self._ident_index = {obj.ident_value: obj for obj in self.get_objects(filter=False)}
+        return self._ident_index
+
     def get_object_by_identifier(self, identifier: str) -> SOMcreator.Object | None:
-        return {obj.ident_value: obj for obj in self.get_objects(filter=False)}.get(identifier)
-
-    def get_uuid_dict(self):
-        pset_dict = {pset.uuid: pset for pset in self.get_property_sets(filter=False)}
-        object_dict = {obj.uuid: obj for obj in self.get_objects(filter=False)}
-        attribute_dict = {attribute.uuid: attribute for attribute in self.get_attributes(filter=False)}
-        aggregation_dict = {aggreg.uuid: aggreg for aggreg in self.get_aggregations(filter=False)}
-        full_dict = pset_dict | object_dict | attribute_dict | aggregation_dict
-        if None in full_dict:
-            full_dict.pop(None)
-        return full_dict
+        return self.get_ident_dict().get(identifier)
+
+    def get_uuid_dict(self) -> dict[str, Hirarchy]:
+        return dict(self._uuid_index)
 
     def get_element_by_uuid(self,
                             uuid: str) -> SOMcreator.Attribute | SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Aggregation | None:
-        """warnging: don't use in iterations will slow down code substantially"""
         if uuid is None:
             return None
-        return self.get_uuid_dict().get(uuid)
+        return self._uuid_index.get(uuid)
 
     @classmethod
-    def open(cls, path: str | os.PathLike) -> Project:
-        return SOMcreator.importer.som_json.open_json(cls, path)
+    def open(cls, path: str | os.PathLike, stream: bool | None = None) -> Project:
+        return SOMcreator.importer.som_json.open_json(cls, path, stream)
 
-    def save(self, path: str | os.PathLike) -> dict:
-        json_dict = SOMcreator.exporter.som_json.export_json(self, path)
+    def save(self, path: str | os.PathLike, compact: bool = False) -> dict:
+        json_dict = SOMcreator.exporter.som_json.export_json(self, path, compact)
         return json_dict
 
     @property
@@ -184,6 +266,50 @@ class Project(object):
 
     def set_filter_matrix(self, matrix: list[list[bool]]):
         self._filter_matrix = matrix
+        self.invalidate_active_filter_mask()
+
+    def get_filter_bit(self, phase_index: int, use_case_index: int) -> int:
+        """returns the bit of the phase/use case combination inside the filter mask of an item"""
+        return 1 << (phase_index * len(self._use_cases) + use_case_index)
+
+    def get_full_filter_mask(self) -> int:
+        return (1 << (len(self._phases) * len(self._use_cases))) - 1
+
+    def get_active_filter_mask(self) -> int:
+        """
+        bitmask of all active phase/use case combinations that are enabled in the project filter matrix.
+        An item is active if its filter mask shares at least one bit with this mask
+        """
+        if self._active_filter_mask is None:
+            mask = 0
+            for phase_index in self.active_phases:
+                for use_case_index in self.active_usecases:
+                    if self._filter_matrix[phase_index][use_case_index]:
+                        mask |= self.get_filter_bit(phase_index, use_case_index)
+            self._active_filter_mask = mask
+        return self._active_filter_mask
+
+    def invalidate_active_filter_mask(self):
+        self._active_filter_mask = None
+        self.notify_filter_change()
+
+    @property
+    def active_phases(self) -> list[int]:
+        return self._active_phases
+
+    @active_phases.setter
+    def active_phases(self, value: list[int]):
+        self._active_phases = list(value)
+        self.invalidate_active_filter_mask()
+
+    @property
+    def active_usecases(self) -> list[int]:
+        return self._active_usecases
+
+    @active_usecases.setter
+    def active_usecases(self, value: list[int]):
+        self._active_usecases = list(value)
+        self.invalidate_active_filter_mask()
 
     def get_filter_state(self, phase: SOMcreator.Phase, use_case: SOMcreator.UseCase):
         if phase is None or use_case is None:
@@ -196,6 +322,7 @@ class Project(object):
 
     def set_filter_state(self, phase: SOMcreator.Phase, use_case: SOMcreator.UseCase, value: bool):
         self._filter_matrix[self.get_phase_index(phase)][self.get_use_case_index(use_case)] = value
+        self.invalidate_active_filter_mask()
 
     def get_phase_index(self, phase: SOMcreator.Phase) -> int | None:
         if phase in self._phases:
@@ -219,6 +346,7 @@ class Project(object):
             for item in self.get_hirarchy_items(filter=False):
                 item.add_project_phase()
             self._filter_matrix.append([True for _ in self._use_cases])
+            self.invalidate_active_filter_mask()
         return self._phases.index(phase)
 
     def add_use_case(self, use_case: SOMcreator.UseCase):
@@ -228,6 +356,7 @@ class Project(object):
                 item.add_use_case()
             for use_case_list in self._filter_matrix:
                 use_case_list.append(True)
+            self.invalidate_active_filter_mask()
         return self._use_cases.index(use_case)
 
     def get_phase_by_name(self, name: str):
@@ -8,7 +8,7 @@ import logging
 
 
 class PropertySet(Hirarchy):
-    _registry: set[PropertySet] = set()
+    __slots__ = ("_attributes", "_object")
 
     def __init__(self, name: str, obj: SOMcreator.Object = None, uuid: str = None, description: None | str = None,
                  optional: None | bool = None, project: None | SOMcreator.Project = None,
@@ -18,7 +18,6 @@ class PropertySet(Hirarchy):
         self._object = None
         if obj is not None:
             obj.add_property_set(self)  # adds Pset to Object and sets pset.object = obj
-        self._registry.add(self)
         self.uuid = uuid
         if self.uuid is None:
             self.uuid = str(uuid4())
@@ -35,7 +34,7 @@ class PropertySet(Hirarchy):
     def __copy__(self) -> PropertySet:
         new_pset = PropertySet(name=self.name, obj=None, uuid=str(uuid4()), description=self.description,
                                optional=self.is_optional(ignore_hirarchy=True), project=self.project,
-                               filter_matrix=self._filter_matrix)
+                               filter_matrix=self.get_filter_matrix())
 
         for attribute in self.get_attributes(filter=False):
             new_attribute = cp.copy(attribute)
@@ -139,7 +138,7 @@ class PropertySet(Hirarchy):
 
     def create_child(self, name) -> PropertySet:
         child = PropertySet(name=name, project=self.project)
-        self._children.add(child)
+        self._add_child(child)
         child.parent = self
         for attribute in self.get_attributes(filter=False):
             new_attrib = attribute.create_child()
@@ -21,7 +21,7 @@ def export_boq(project: SOMcreator.Project, path: str, pset_name: str) -> None:
 
     with open(path, "w", ) as file:
         writer = csv.writer(file, delimiter=";")
-        property_sets = [property_set for property_set in SOMcreator.PropertySet if
+        property_sets = [property_set for property_set in project.get_property_sets(filter=False) if
                          property_set.name == pset_name]
         distinct_attribute_names = get_distinct_attributes(property_sets)
         header = ["Ident", "Object"] + [f"{pset_name}:{name}" for name in distinct_attribute_names]
@@ -25,7 +25,7 @@ def _handle_section(id_dict, aggregation: SOMcreator.Aggregation, xml_item: Elem
             _handle_section(id_dict, child, xml_item)
 
 
-def _handle_elementsection(xml_parent: Element):
+def _handle_elementsection(project: SOMcreator.Project, xml_parent: Element):
     xml_elementsection = etree.SubElement(xml_parent, "elementSection")
     xml_root = etree.SubElement(xml_elementsection, "section")
     xml_root.set("ID", str(uuid.uuid4()))
@@ -34,7 +34,7 @@ def _handle_elementsection(xml_parent: Element):
     xml_root.set("type", "typeBsContainer")
     xml_root.set("takt", "")
 
-    root_objects: list[SOMcreator.Aggregation] = [aggreg for aggreg in SOMcreator.Aggregation if
+    root_objects: list[SOMcreator.Aggregation] = [aggreg for aggreg in project.get_aggregations(filter=False) if
                                                aggreg.is_root]
 
     root_objects.sort(key=lambda x: x.name)
@@ -46,13 +46,13 @@ def _handle_elementsection(xml_parent: Element):
     return xml_elementsection, id_dict
 
 
-def _handle_property_type_section(xml_repo) -> dict[str, int]:
+def _handle_property_type_section(project: SOMcreator.Project, xml_repo) -> dict[str, int]:
     xml_property_type_section = etree.SubElement(xml_repo, "propertyTypeSection")
 
     attribute_dict = dict()
 
     i = 1
-    for attribute in SOMcreator.Attribute:
+    for attribute in sorted(project.get_attributes(filter=False), key=lambda a: a.name):
         # use attribute_text instead of attribute to remove duplicates
         attribute_text = f"{attribute.property_set.name}:{attribute.name}"
         if attribute_text not in attribute_dict:
@@ -86,7 +86,8 @@ def _handle_property_section(xml_repo: etree.Element, id_dict: dict, attribute_d
                     xml_property.text = "füllen!"
 
 
-def _handle_repository(xml_parent: Element, id_dict: dict[SOMcreator.Aggregation, str]) -> None:
+def _handle_repository(project: SOMcreator.Project, xml_parent: Element,
+                       id_dict: dict[SOMcreator.Aggregation, str]) -> None:
     xml_repo = etree.SubElement(xml_parent, "repository")
     xml_id_mapping = etree.SubElement(xml_repo, "IDMapping")
 
@@ -95,7 +96,7 @@ def _handle_repository(xml_parent: Element, id_dict: dict[SOMcreator.Aggregation
         xml_id.set("k", str(i + 1))
         xml_id.set("v", str(id_value))
 
-    attribute_dict = _handle_property_type_section(xml_repo)
+    attribute_dict = _handle_property_type_section(project, xml_repo)
     _handle_property_section(xml_repo, id_dict, attribute_dict)
 
 
@@ -110,10 +111,10 @@ def export_bs(project: SOMcreator.Project, path: str) -> None:
     if not path:
         return
     xml_boq_export = handle_header(project.author, "bsExport")
-    xml_elementsection, id_dict = _handle_elementsection(xml_boq_export)
+    xml_elementsection, id_dict = _handle_elementsection(project, xml_boq_export)
 
     etree.SubElement(xml_boq_export, "linkSection")
-    _handle_repository(xml_boq_export, id_dict)
+    _handle_repository(project, xml_boq_export, id_dict)
     _handle_relation_section(xml_boq_export)
 
     tree = etree.ElementTree(xml_boq_export)
@@ -18,17 +18,18 @@ def export(project: SOMcreator.Project, path: str, export_excel: Type[ExportExce
 
     export_excel.set_project(project)
     workbook = export_excel.create_workbook()
-    sheet_main = workbook.active
-    export_excel.fill_main_sheet(sheet_main)
+    export_excel.fill_main_sheet(workbook.create_sheet())
     sheet_dict = export_excel.filter_to_sheets(object_list)
 
     table_counter = 1
     for ident, data_dict in sheet_dict.items():
         obj_name, objects = export_excel.get_object_data(data_dict)
         work_sheet = workbook.create_sheet(f"{obj_name} ({ident})")
+        column_widths = dict()
+        entries = list()
         for counter, obj in enumerate(sorted(objects)):
             column = 1 + counter * (HEADER_COLUMN_COUNT+1)
-            export_excel.create_object_entry(obj, work_sheet, 1, column, table_counter)
+            entries.append(export_excel.create_object_entry(obj, work_sheet, 1, column, table_counter, column_widths))
             table_counter += 1
-        export_excel.autoadjust_column_widths(work_sheet)
+        export_excel.write_object_entries(work_sheet, entries, column_widths)
     workbook.save(path)
@@ -1,7 +1,9 @@
 import SOMcreator
+from openpyxl.styles.cell_style import StyleArray
 
 
 class ExcelProperties:
     project: SOMcreator.Project = None
     ident_pset_name: str = None
     ident_attribute_name: str = None
+    style_arrays: dict[tuple[int, int, int], StyleArray] = dict()
@@ -2,12 +2,14 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Callable
 
 import os.path
+from copy import copy
 
 from openpyxl import Workbook
 from openpyxl import styles
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.worksheet.worksheet import Worksheet
 
 import SOMcreator
 
@@ -16,9 +18,26 @@ IDENT_ATTRIB_NAME = "bauteilKlassifikation"
 NAME = "name"
 OBJECTS = "objects"
 TABLE_STYLE = "TableStyleLight1"
-OPTIONAL_FONT = styles.Font(color="4e6ec0")
 HEADER_ROW_COUNT = 4
 HEADER_COLUMN_COUNT = 5
+GREY_ROW_COUNT = 3
+DEFAULT_COLUMN_WIDTH = 2
+MAIN_SHEET_TITLES = ["bauteilName", "bauteilKlassifikation", "abkuerzung", "IfcMapping"]
+OBJECT_TABLE_TITLES = ["Property", "Propertyset", "Beispiele / Beschreibung", "Datentyp", "Werte"]
+
+# style objects are shared by all cells, openpyxl only stores an index per cell
+OPTIONAL_FONT = styles.Font(color="4e6ec0")
+DEFAULT_FONT = styles.Font()
+GREY_FILL = styles.PatternFill(fill_type="solid", start_color="d9d9d9")
+THICK_SIDE = styles.Side(border_style="thick", color="FF000000")
+NO_SIDE = styles.Side(border_style="none", color="FF000000")
+HEADER_BORDERS = {
+    (row, column): styles.Border(left=THICK_SIDE if column == 0 else NO_SIDE,
+                                 right=THICK_SIDE if column == HEADER_COLUMN_COUNT - 1 else NO_SIDE,
+                                 top=THICK_SIDE if row == 0 else NO_SIDE,
+                                 bottom=THICK_SIDE if row == GREY_ROW_COUNT - 1 else NO_SIDE)
+    for row in range(GREY_ROW_COUNT) for column in range(HEADER_COLUMN_COUNT)
+}
 
 if TYPE_CHECKING:
     from SOMcreator.exporter.excel import ExcelProperties
@@ -61,8 +80,9 @@ class ExportExcel:
         return data_dict[NAME], data_dict[OBJECTS]
 
     @classmethod
-    def create_workbook(cls):
-        return Workbook()
+    def create_workbook(cls) -> Workbook:
+        cls.get_properties().style_arrays = dict()
+        return Workbook(write_only=True)
 
     @classmethod
     def directory_of_path_exists(cls, path):
@@ -85,29 +105,25 @@ class ExportExcel:
         return ";".join(obj.ifc_mapping) or ""
 
     @classmethod
-    def fill_main_sheet(cls, sheet: Worksheet) -> None:
+    def fill_main_sheet(cls, sheet: WriteOnlyWorksheet) -> None:
         project = cls.get_project()
         sheet.title = "Uebersicht"
-        titles = ["bauteilName", "bauteilKlassifikation", "abkuerzung", "IfcMapping"]
         getter_functions: list[Callable] = [cls._get_name, cls._get_identifier, cls._get_abbreviation,
                                             cls._get_ifc_mapping]
-        for column, text in enumerate(titles, start=1):
-            sheet.cell(1, column).value = text
-
-        row = 1
-        for row, obj in enumerate(sorted(project.get_objects(filter=True)), start=2):
-            for column, getter_function in enumerate(getter_functions, start=1):
-                sheet.cell(row, column).value = getter_function(obj)
-                if obj.is_optional(ignore_hirarchy=False):
-                    sheet.cell(row, column).font = OPTIONAL_FONT
-
-        table_range = f"{sheet.cell(1, 1).coordinate}:{sheet.cell(row, len(titles)).coordinate}"
-        table = Table(displayName="Uebersicht", ref=table_range)
-        style = TableStyleInfo(name=TABLE_STYLE, showFirstColumn=False,
-                               showLastColumn=False, showRowStripes=True, showColumnStripes=False)
-        table.tableStyleInfo = style
-        sheet.add_table(table)
-        cls.autoadjust_column_widths(sheet)
+        column_widths = dict()
+        rows = [MAIN_SHEET_TITLES]
+        cls.track_column_widths(column_widths, 1, MAIN_SHEET_TITLES)
+        for obj in sorted(project.get_objects(filter=True)):
+            values = [getter_function(obj) for getter_function in getter_functions]
+            cls.track_column_widths(column_widths, 1, values)
+            if obj.is_optional(ignore_hirarchy=False):
+                values = [cls.create_cell(sheet, value, OPTIONAL_FONT) for value in values]
+            rows.append(values)
+
+        cls.set_column_widths(sheet, column_widths)
+        for row in rows:
+            sheet.append(row)
+        cls.add_table(sheet, "Uebersicht", 1, 1, len(rows), MAIN_SHEET_TITLES)
 
     @classmethod
     def filter_to_sheets(cls,object_list:list[SOMcreator.Object] ) -> dict:
@@ -125,88 +141,109 @@ class ExportExcel:
         return d
 
     @classmethod
-    def create_object_entry(cls, obj: SOMcreator.Object, sheet, start_row, start_column, table_index):
-        if obj.is_optional(ignore_hirarchy=False):
-            font_style = OPTIONAL_FONT
-        else:
-            font_style = styles.Font()
-
-        sheet.cell(start_row, start_column).value = "bauteilName"
-        sheet.cell(start_row, start_column + 1).value = obj.name
-
-        sheet.cell(start_row + 1, start_column).value = "bauteilKlassifikation"
-        sheet.cell(start_row + 1, start_column + 1).value = obj.ident_value
+    def create_object_entry(cls, obj: SOMcreator.Object, sheet: WriteOnlyWorksheet, start_row: int,
+                            start_column: int, table_index: int, column_widths: dict[int, int]) -> list[list]:
+        """
+        returns the rows of the object block. Write-only sheets are filled row by row, so the blocks of all objects
+        of a sheet get merged by write_object_entries
+        """
+        font_style = OPTIONAL_FONT if obj.is_optional(ignore_hirarchy=False) else DEFAULT_FONT
+        header = [["bauteilName", obj.name],
+                  ["bauteilKlassifikation", obj.ident_value],
+                  ["Kürzel", str(obj.abbreviation)],
+                  OBJECT_TABLE_TITLES]
+        rows = list()
+        for row_index, values in enumerate(header):
+            cls.track_column_widths(column_widths, start_column, values)
+            values = values + [None] * (HEADER_COLUMN_COUNT - len(values))
+            row = list()
+            for column_index, value in enumerate(values):
+                if row_index < GREY_ROW_COUNT:
+                    row.append(cls.create_cell(sheet, value, font_style, HEADER_BORDERS[row_index, column_index],
+                                               GREY_FILL))
+                else:
+                    row.append(cls.create_cell(sheet, value, font_style))
+            rows.append(row)
 
-        sheet.cell(start_row + 2, start_column).value = "Kürzel"
-        sheet.cell(start_row + 2, start_column + 1).value = str(obj.abbreviation)
-
-        sheet.cell(start_row + 3, start_column).value = "Property"
-        sheet.cell(start_row + 3, start_column + 1).value = "Propertyset"
-        sheet.cell(start_row + 3, start_column + 2).value = "Beispiele / Beschreibung"
-        sheet.cell(start_row + 3, start_column + 3).value = "Datentyp"
-        sheet.cell(start_row + 3, start_column + 4).value = "Werte"
-
-        for i in range(0, HEADER_ROW_COUNT):
-            for k in range(0, HEADER_COLUMN_COUNT):
-                sheet.cell(start_row + i, start_column + k).font = font_style
-        cls.draw_border(sheet, [start_row, start_row + 2], [start_column, start_column + HEADER_COLUMN_COUNT-1])
-        cls.fill_grey(sheet, [start_row, start_row + 2], [start_column, start_column + HEADER_COLUMN_COUNT-1])
-
-        pset_start_row = start_row + HEADER_ROW_COUNT
-        index = 0
         for property_set in sorted(obj.get_property_sets(filter=True)):
             for attribute in sorted(property_set.get_attributes(filter=True)):
-                sheet.cell(pset_start_row + index, start_column).value = attribute.name
-                sheet.cell(pset_start_row + index, start_column + 1).value = property_set.name
-                sheet.cell(pset_start_row + index, start_column + 2).value = attribute.description
-                sheet.cell(pset_start_row + index, start_column + 3).value = attribute.data_type
-                sheet.cell(pset_start_row + index, start_column + 4).value = ";".join([str(v) for v in  attribute.value])
+                values = [attribute.name, property_set.name, attribute.description, attribute.data_type,
+                          ";".join([str(v) for v in attribute.value])]
+                cls.track_column_widths(column_widths, start_column, values)
                 if attribute.is_optional(ignore_hirarchy=False):
-                    for c in range(HEADER_COLUMN_COUNT):
-                        sheet.cell(pset_start_row + index, start_column+c).font = OPTIONAL_FONT
-                index += 1
-
-        table_start = sheet.cell(pset_start_row - 1, start_column).coordinate
-        table_end = sheet.cell(pset_start_row + index - 1, start_column + HEADER_COLUMN_COUNT-1).coordinate
-        table_range = f"{table_start}:{table_end}"
-        table = Table(displayName=f"Tabelle_{str(table_index).zfill(5)}", ref=table_range)
+                    values = [cls.create_cell(sheet, value, OPTIONAL_FONT) for value in values]
+                rows.append(values)
+
+        table_start_row = start_row + HEADER_ROW_COUNT - 1
+        table_end_row = start_row + len(rows) - 1
+        cls.add_table(sheet, f"Tabelle_{str(table_index).zfill(5)}", table_start_row, start_column, table_end_row,
+                      OBJECT_TABLE_TITLES)
+        return rows
+
+    @classmethod
+    def write_object_entries(cls, sheet: WriteOnlyWorksheet, entries: list[list[list]],
+                             column_widths: dict[int, int]) -> None:
+        """
+        writes the object blocks side by side, separated by an empty column
+        """
+        cls.set_column_widths(sheet, column_widths)
+        empty_entry_row = [None] * HEADER_COLUMN_COUNT
+        row_count = max((len(rows) for rows in entries), default=0)
+        for row_index in range(row_count):
+            row = list()
+            for rows in entries:
+                row += rows[row_index] if row_index < len(rows) else empty_entry_row
+                row.append(None)
+            sheet.append(row)
+
+    @classmethod
+    def create_cell(cls, sheet: WriteOnlyWorksheet, value, font: styles.Font,
+                    border: styles.Border | None = None, fill: styles.PatternFill | None = None) -> WriteOnlyCell:
+        """
+        assigning a style object hashes it for the lookup in the workbook,
+        so every combination of the shared style objects gets resolved once per workbook and copied afterwards
+        """
+        style_arrays = cls.get_properties().style_arrays
+        key = (id(font), id(border), id(fill))
+        cell = WriteOnlyCell(sheet, value)
+        if key not in style_arrays:
+            cell.font = font
+            if border is not None:
+                cell.border = border
+            if fill is not None:
+                cell.fill = fill
+            style_arrays[key] = cell._style
+        cell._style = copy(style_arrays[key])
+        return cell
+
+    @classmethod
+    def add_table(cls, sheet: WriteOnlyWorksheet, name: str, start_row: int, start_column: int, end_row: int,
+                  titles: list[str]) -> None:
+        end_column = start_column + len(titles) - 1
+        table_range = f"{get_column_letter(start_column)}{start_row}:{get_column_letter(end_column)}{end_row}"
+        table = Table(displayName=name, ref=table_range)
+        # write-only worksheets can't read the header cells back, the table columns are named explicitly
+        table._initialise_columns()
+        for table_column, title in zip(table.tableColumns, titles):
+            table_column.name = title
         style = TableStyleInfo(name=TABLE_STYLE, showFirstColumn=False,
                                showLastColumn=False, showRowStripes=True, showColumnStripes=False)
         table.tableStyleInfo = style
-        sheet.add_table(table)
-
-    @classmethod
-    def draw_border(cls, sheet: Worksheet, row_range: [int, int], column_range: [int, int]):
-        for row in range(row_range[0], row_range[1] + 1):
-            for column in range(column_range[0], column_range[1] + 1):
-                left_side = styles.Side(border_style="none", color="FF000000")
-                right_side = styles.Side(border_style="none", color="FF000000")
-                top_side = styles.Side(border_style="none", color="FF000000")
-                bottom_side = styles.Side(border_style="none", color="FF000000")
-                if column == column_range[0]:
-                    left_side = styles.Side(border_style="thick", color="FF000000")
-
-                if column == column_range[1]:
-                    right_side = styles.Side(border_style="thick", color="FF000000")
-
-                if row == row_range[0]:
-                    top_side = styles.Side(border_style="thick", color="FF000000")
-                if row == row_range[1]:
-                    bottom_side = styles.Side(border_style="thick", color="FF000000")
-                sheet.cell(row, column).border = styles.Border(left=left_side, right=right_side, top=top_side,
-                                                               bottom=bottom_side)
-
-    @classmethod
-    def fill_grey(cls, sheet: Worksheet, row_range: [int, int], column_range: [int, int]):
-        fill = styles.PatternFill(fill_type="solid", start_color="d9d9d9")
-        for row in range(row_range[0], row_range[1] + 1):
-            for column in range(column_range[0], column_range[1] + 1):
-                sheet.cell(row, column).fill = fill
-
-    @classmethod
-    def autoadjust_column_widths(cls, sheet: Worksheet) -> None:
-        for i in range(len(list(sheet.columns))):
-            column_letter = get_column_letter(i + 1)
-            column = sheet[column_letter]
-            width = max([len(cell.value) for cell in column if cell.value is not None], default=2)
-            sheet.column_dimensions[column_letter].width = width
+        # names are unique by construction, Worksheet.add_table would compare them against every existing table
+        sheet.tables.add(table)
+
+    @classmethod
+    def track_column_widths(cls, column_widths: dict[int, int], start_column: int, values: list) -> None:
+        for column, value in enumerate(values, start=start_column):
+            if isinstance(value, str):
+                column_widths[column] = max(column_widths.get(column, 0), len(value))
+
+    @classmethod
+    def set_column_widths(cls, sheet: WriteOnlyWorksheet, column_widths: dict[int, int]) -> None:
+        """
+        write-only sheets write their column dimensions in front of the first row,
+        so the widths need to be set before anything is appended
+        """
+        for column in range(1, max(column_widths, default=0) + 1):
+            width = column_widths.get(column, DEFAULT_COLUMN_WIDTH)
+            sheet.column_dimensions[get_column_letter(column)].width = width
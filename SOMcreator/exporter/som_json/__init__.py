@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import logging
 import os
-import json
 import time
 
 import SOMcreator
@@ -10,8 +9,7 @@ from SOMcreator.datastructure.som_json import MainDict
 from typing import TYPE_CHECKING
 from . import core, project, predefined_pset, property_set, object_, aggregation
 from SOMcreator.templates import HOME_DIR, MAPPING_TEMPLATE
-from SOMcreator.util import xml
-import jinja2
+from SOMcreator.util import serializer, xml
 
 if TYPE_CHECKING:
     from SOMcreator import Project, UseCase, Phase
@@ -24,6 +22,7 @@ object_uuid_dict: dict[str, SOMcreator.Object] = dict()
 property_set_uuid_dict: dict[str, SOMcreator.PropertySet] = dict()
 attribute_uuid_dict: dict[str, SOMcreator.Attribute] = dict()
 filter_matrixes = list()
+filter_matrix_indexes: dict[int, int] = dict()
 
 
 def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str):
@@ -40,6 +39,7 @@ def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str
                 pset_dict[name] = data_format
             obj_dict[pset.name] = pset_dict
         attrib_dict[klass] = obj_dict
+    import jinja2  # only needed for this export, so it isn't loaded with the project
     file_loader = jinja2.FileSystemLoader(HOME_DIR)
     env = jinja2.Environment(loader=file_loader)
     env.trim_blocks = True
@@ -57,12 +57,12 @@ def reset_uuid_dicts():
     SOMcreator.exporter.som_json.property_set_uuid_dict = dict()
     SOMcreator.exporter.som_json.attribute_uuid_dict = dict()
     SOMcreator.exporter.som_json.filter_matrixes = list()
+    SOMcreator.exporter.som_json.filter_matrix_indexes = dict()
 
-def export_json(proj: Project, path: str) -> dict:
+def export_json(proj: Project, path: str, compact: bool = False) -> dict:
     start_time = time.time()
     main_dict = create_export_dict(proj)
-    with open(path, "w") as file:
-        json.dump(project.order_dict(main_dict), file)
+    serializer.write(path, project.order_dict(main_dict), compact)
 
     end_time = time.time()
     logging.info(f"Export Done. Time: {end_time - start_time}")
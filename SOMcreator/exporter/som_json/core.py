@@ -1,9 +1,7 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import logging
 import SOMcreator
 from SOMcreator.datastructure.som_json import NAME, DESCRIPTION, OPTIONAL, PARENT, FILTER_MATRIX
-from SOMcreator.util.misc import check_size_eq
 import SOMcreator.datastructure.base
 
 if TYPE_CHECKING:
@@ -13,13 +11,8 @@ if TYPE_CHECKING:
 #### Export ######
 
 
-def write_filter_matrix(element: SOMcreator.datastructure.base.Hirarchy):
-    proj = element.project
-    filter_matrix = element.get_filter_matrix()
-    if not check_size_eq(filter_matrix, proj.get_filter_matrix()):
-        logging.warning(f"Filter List of {element} doesn't match size of project filter list")
-    return SOMcreator.exporter.som_json.filter_matrixes.index(
-        tuple(tuple(use_case_list) for use_case_list in filter_matrix))
+def write_filter_matrix(element: SOMcreator.datastructure.base.Hirarchy) -> int:
+    return SOMcreator.exporter.som_json.filter_matrix_indexes[element.get_filter_mask()]
 
 
 def write_basics(entity_dict: ObjectDict | PropertySetDict | AttributeDict | AggregationDict,
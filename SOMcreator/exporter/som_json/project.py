@@ -7,8 +7,8 @@ from SOMcreator.datastructure.som_json import DESCRIPTION, FILTER_MATRIXES, FILT
     PROJECT_PHASES, USE_CASES, PREDEFINED_PSETS, OBJECTS, AGGREGATIONS
 from SOMcreator.datastructure.som_json import ProjectDict, FilterDict, MainDict
 import SOMcreator
+from SOMcreator.datastructure.base import filter_mask_to_matrix
 from . import core
-from collections import OrderedDict
 
 if TYPE_CHECKING:
     from SOMcreator import Project
@@ -34,12 +34,12 @@ def write(project: Project, main_dict: MainDict) -> None:
 
 
 def order_dict(main_dict: MainDict):
-    order = [PROJECT, PREDEFINED_PSETS, OBJECTS, AGGREGATIONS, FILTER_MATRIXES]
+    order = [PROJECT, FILTER_MATRIXES, PREDEFINED_PSETS, OBJECTS, AGGREGATIONS]
     ordered_data = [(name, main_dict.get(name)) for name in order]
     for key, data in main_dict.items():
         if key not in order:
             ordered_data.append((key, data))
-    return OrderedDict(ordered_data)
+    return dict(ordered_data)
 
 
 def _write_filter_dict(filter_list: list[SOMcreator.Phase] | list[SOMcreator.UseCase]) -> list[FilterDict]:
@@ -54,8 +54,11 @@ def _write_filter_dict(filter_list: list[SOMcreator.Phase] | list[SOMcreator.Use
 
 
 def create_existing_filter_states(proj: Project):
-    filter_matrixes = set()
-    for entity in proj.get_hirarchy_items(filter=False):
-        hashable = tuple(tuple(use_case_list) for use_case_list in entity.get_filter_matrix())
-        filter_matrixes.add(hashable)
-    return list(filter_matrixes)
+    """
+    collects the distinct filter states of all items and fills the mask -> index table used by write_filter_matrix.
+    Ordered by bitmask so the table stays stable between saves
+    """
+    masks = sorted({entity.get_filter_mask() for entity in proj.get_hirarchy_items(filter=False)})
+    SOMcreator.exporter.som_json.filter_matrix_indexes = {mask: index for index, mask in enumerate(masks)}
+    phase_count, use_case_count = len(proj.get_phases()), len(proj.get_usecases())
+    return [filter_mask_to_matrix(mask, phase_count, use_case_count) for mask in masks]
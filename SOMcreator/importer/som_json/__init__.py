@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import logging
 import os
-import json
 import time
 
 import SOMcreator
 import SOMcreator.datastructure.som_json
-from SOMcreator.datastructure.som_json import FILTER_MATRIXES, MainDict
+from SOMcreator.datastructure.som_json import AGGREGATIONS, FILTER_MATRIXES, MainDict, OBJECTS, PREDEFINED_PSETS, \
+    PROJECT, ProjectDict
 from typing import Type, TYPE_CHECKING
 from . import core, project, predefined_pset, property_set, obj, aggregation, inheritance
+from .stream import JsonStream
+from SOMcreator.util import serializer
 
 if TYPE_CHECKING:
     from SOMcreator import Project, UseCase, Phase
@@ -22,6 +24,15 @@ object_uuid_dict: dict[str, SOMcreator.Object] = dict()
 property_set_uuid_dict: dict[str, SOMcreator.PropertySet] = dict()
 attribute_uuid_dict: dict[str, SOMcreator.Attribute] = dict()
 filter_matrixes = list()
+pending_filter_matrixes: dict[str, int] = dict()
+
+# files above this size are imported section by section instead of being loaded as a whole
+STREAM_THRESHOLD = 32 * 1024 * 1024
+ENTITY_LOADERS = {
+    PREDEFINED_PSETS: predefined_pset.load_items,
+    OBJECTS:          obj.load_items,
+    AGGREGATIONS:     aggregation.load_items,
+}
 
 
 def reset_uuid_dicts():
@@ -29,27 +40,54 @@ def reset_uuid_dicts():
     SOMcreator.importer.som_json.property_set_uuid_dict = dict()
     SOMcreator.importer.som_json.attribute_uuid_dict = dict()
     SOMcreator.importer.som_json.filter_matrixes = list()
+    SOMcreator.importer.som_json.pending_filter_matrixes = dict()
 
 
-def open_json(cls: Type[Project], path: str):
+def open_json(cls: Type[Project], path: str, stream: bool | None = None):
+    """
+    :param stream: import the file section by section without keeping the raw dict in memory.
+    By default, files larger than STREAM_THRESHOLD are streamed
+    """
     start_time = time.time()
 
     SOMcreator.importer.som_json.parent_dict = dict()
+    SOMcreator.importer.som_json.aggregation_dict = dict()
     reset_uuid_dicts()
     if not os.path.isfile(path):
         raise FileNotFoundError(f"File '{path}' does not exist!")
 
-    with open(path, "r") as file:
-        main_dict: MainDict = json.load(file)
+    if stream is None:
+        stream = os.path.getsize(path) > STREAM_THRESHOLD
+
+    if stream:
+        proj = _load_stream(cls, path)
+    else:
+        proj = _load_dict(cls, path)
+
+    core.apply_pending_filter_matrixes(proj)
+
+    inheritance.calculate(proj)
+    logging.debug(f"Inheritance Calculated")
+
+    aggregation.calculate(proj)
+    logging.debug(f"Aggregation Calculated")
+
+    proj.plugin_dict = SOMcreator.importer.som_json.plugin_dict
+    proj.import_dict = dict(SOMcreator.importer.som_json.plugin_dict)
+    end_time = time.time()
+    logging.info(f"Import Done. Time: {end_time - start_time}")
+    return proj
+
+
+def _load_dict(cls: Type[Project], path: str) -> Project:
+    main_dict: MainDict = serializer.read(path)
 
     SOMcreator.importer.som_json.plugin_dict = dict(main_dict)
     SOMcreator.importer.som_json.filter_matrixes = main_dict.get(FILTER_MATRIXES)
     core.remove_part_of_dict(FILTER_MATRIXES)
 
     logging.debug(f"Filter Matrixes Read")
-    project_dict = main_dict.get(SOMcreator.datastructure.som_json.PROJECT)
-    SOMcreator.importer.som_json.phase_list, SOMcreator.importer.som_json.use_case_list = core.get_filter_lists(
-        project_dict)
+    _load_filter_lists(main_dict.get(PROJECT))
     logging.debug(f"Filter List Read")
 
     proj, project_dict = project.load(cls, main_dict)
@@ -63,15 +101,55 @@ def open_json(cls: Type[Project], path: str):
 
     aggregation.load(proj, main_dict)
     logging.debug(f"Aggregations Read")
+    return proj
 
-    inheritance.calculate(proj)
-    logging.debug(f"Inheritance Calculated")
 
-    aggregation.calculate(proj)
-    logging.debug(f"Aggregation Calculated")
+def _load_filter_lists(project_dict: ProjectDict):
+    SOMcreator.importer.som_json.phase_list, SOMcreator.importer.som_json.use_case_list = core.get_filter_lists(
+        project_dict)
 
-    proj.plugin_dict = SOMcreator.importer.som_json.plugin_dict
-    proj.import_dict = main_dict
-    end_time = time.time()
-    logging.info(f"Import Done. Time: {end_time - start_time}")
+
+def _load_stream(cls: Type[Project], path: str) -> Project:
+    """
+    Entities are created while their section is read. Sections that arrive before the data they depend on
+    (Project for all entities, Objects for Aggregations) are decoded and loaded once the dependency is available.
+    """
+    SOMcreator.importer.som_json.plugin_dict = dict()
+    SOMcreator.importer.som_json.filter_matrixes = None
+    proj = None
+    loaded_sections = set()
+    deferred_sections: dict[str, dict | None] = dict()
+
+    with serializer.open_text(path) as file:
+        reader = JsonStream(file)
+        for key in reader.iter_keys():
+            if key == PROJECT:
+                project_dict = reader.decode_value()
+                _load_filter_lists(project_dict)
+                proj, _ = project.load(cls, {PROJECT: project_dict})
+                logging.debug(f"Project Read")
+            elif key == FILTER_MATRIXES:
+                SOMcreator.importer.som_json.filter_matrixes = reader.decode_value()
+                logging.debug(f"Filter Matrixes Read")
+            elif key in ENTITY_LOADERS:
+                is_blocked = proj is None or (key == AGGREGATIONS and OBJECTS not in loaded_sections)
+                if is_blocked or reader.peek() != "{":
+                    deferred_sections[key] = reader.decode_value()
+                    continue
+                ENTITY_LOADERS[key](proj, reader.iter_members())
+                loaded_sections.add(key)
+                logging.debug(f"{key} Read")
+            else:
+                SOMcreator.importer.som_json.plugin_dict[key] = reader.decode_value()
+
+    if proj is None:
+        raise ValueError(f"File '{path}' contains no '{PROJECT}' section!")
+
+    for key, loader in ENTITY_LOADERS.items():
+        if key in loaded_sections:
+            continue
+        entity_dict = deferred_sections.pop(key, None)
+        entity_dict = dict() if core.check_dict(entity_dict, key) else entity_dict
+        loader(proj, entity_dict.items())
+        logging.debug(f"{key} Read")
     return proj
@@ -4,7 +4,7 @@ import SOMcreator
 from SOMcreator.importer.som_json import core
 from SOMcreator.datastructure.som_json import AGGREGATIONS, AggregationDict, CONNECTION, OBJECT
 
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from SOMcreator import Project
@@ -26,15 +26,17 @@ def load(proj: SOMcreator.Project, main_dict: dict):
     aggregations_dict: dict[str, AggregationDict] = main_dict.get(AGGREGATIONS)
     core.remove_part_of_dict(AGGREGATIONS)
     aggregations_dict = dict() if core.check_dict(aggregations_dict, AGGREGATIONS) else aggregations_dict
+    load_items(proj, aggregations_dict.items())
 
-    for uuid_ident, entity_dict in aggregations_dict.items():
+
+def load_items(proj: SOMcreator.Project, items: Iterable[tuple[str, AggregationDict]]):
+    for uuid_ident, entity_dict in items:
         _get_aggregation(proj, entity_dict, uuid_ident)
 
 
 def calculate(proj: SOMcreator.Project):
-    uuid_dict = proj.get_uuid_dict()
     for aggregation, (uuid, connection_type) in SOMcreator.importer.som_json.aggregation_dict.items():
-        parent = uuid_dict.get(uuid)
+        parent = proj.get_element_by_uuid(uuid)
         if parent is None:
             continue
         parent.add_child(aggregation, connection_type)
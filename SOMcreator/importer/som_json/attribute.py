@@ -3,6 +3,7 @@ import SOMcreator
 from SOMcreator.importer.som_json import core
 from SOMcreator.constants.value_constants import OLD_DATATYPE_DICT
 from SOMcreator.importer import som_json
+from SOMcreator.datastructure.base import intern_text
 from typing import TYPE_CHECKING
 
 from SOMcreator.datastructure.som_json import CHILD_INHERITS_VALUE, DATA_TYPE, REVIT_MAPPING, VALUE, \
@@ -13,6 +14,8 @@ def load(proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
          property_set: SOMcreator.PropertySet, ) -> None:
     name, description, optional, parent, filter_matrix = core.get_basics(proj, attribute_dict, identifier)
     value = attribute_dict[VALUE]
+    if isinstance(value, list):
+        value = [intern_text(v) for v in value]
     value_type = attribute_dict[VALUE_TYPE]
     data_type = attribute_dict[DATA_TYPE]
 
@@ -47,6 +47,10 @@ def load_filter_matrix(proj: SOMcreator.Project, element_dict: StandardDict, gui
             f"Achtung! Filtermatrix für Element '{guid}' liegt nicht vor. Eventuell verwenden Sie eine alte Dateiversion. Bitte mit SOM-Toolkit 2.11.3 Öffnen und neu speichern!")
         return proj.create_filter_matrix(True)
     if isinstance(matrix, int):
+        if SOMcreator.importer.som_json.filter_matrixes is None:
+            # streamed file whose FilterMatrixes section follows the entities
+            SOMcreator.importer.som_json.pending_filter_matrixes[guid] = matrix
+            return proj.create_filter_matrix(True)
         return list(SOMcreator.importer.som_json.filter_matrixes[matrix])
     if not SOMcreator.util.misc.check_size_eq(matrix, proj.get_filter_matrix()):
         logging.warning(
@@ -80,3 +84,16 @@ def remove_part_of_dict(key):
     """
     if key in SOMcreator.importer.som_json.plugin_dict:
         SOMcreator.importer.som_json.plugin_dict.pop(key)
+
+
+def apply_pending_filter_matrixes(proj: SOMcreator.Project):
+    filter_matrixes = SOMcreator.importer.som_json.filter_matrixes or list()
+    for guid, index in SOMcreator.importer.som_json.pending_filter_matrixes.items():
+        element = proj.get_element_by_uuid(guid)
+        if element is None:
+            continue
+        if index >= len(filter_matrixes):
+            logging.warning(f"Achtung! Filtermatrix {index} für Element '{guid}' existiert nicht! Status wird überall auf True gesetzt!")
+            continue
+        element.set_filter_matrix(list(filter_matrixes[index]))
+    SOMcreator.importer.som_json.pending_filter_matrixes = dict()
@@ -2,33 +2,52 @@ from __future__ import annotations
 import SOMcreator
 
 
-def _find_parent(uuid_dict, element):
-    for test_el, identifier in SOMcreator.importer.som_json.parent_dict.items():
-        if type(test_el) is not type(element):
-            continue
-        if identifier not in uuid_dict:
-            continue
-        if test_el == element:
-            continue
-        if test_el.parent is not None:
-            continue
+def _index_key(element) -> tuple:
+    return type(element), element.name
+
 
-        if test_el.name != element.name:
+def _value_key(element: SOMcreator.Attribute) -> tuple | None:
+    try:
+        return type(element), element.name, tuple(element.value)
+    except TypeError:
+        return None
+
+
+def _build_parent_index(proj: SOMcreator.Project) -> dict[tuple, str]:
+    """
+    maps (type, name) and for Attributes (type, name, values) to the first resolvable parent uuid of an element
+    with that signature. Used to repair dangling parent references
+    """
+    parent_index = dict()
+    for element, identifier in SOMcreator.importer.som_json.parent_dict.items():
+        if identifier is None or proj.get_element_by_uuid(identifier) is None:
             continue
+        parent_index.setdefault(_index_key(element), identifier)
+        if isinstance(element, SOMcreator.Attribute):
+            value_key = _value_key(element)
+            if value_key is not None:
+                parent_index.setdefault(value_key, identifier)
+    return parent_index
 
-        if isinstance(test_el, SOMcreator.Attribute):
-            if test_el.value == element.value:
-                return identifier
-        return identifier
+
+def _find_parent(parent_index: dict[tuple, str], element) -> str | None:
+    if isinstance(element, SOMcreator.Attribute):
+        value_key = _value_key(element)
+        if value_key in parent_index:
+            return parent_index[value_key]
+    return parent_index.get(_index_key(element))
 
 
 def calculate(proj: SOMcreator.Project):
-    uuid_dict = proj.get_uuid_dict()
+    parent_index = None
     for entity, uuid in SOMcreator.importer.som_json.parent_dict.items():
         if uuid is None:
             continue
-        if uuid not in uuid_dict:
-            uuid = _find_parent(uuid_dict, entity)
-        if uuid is None:
+        parent = proj.get_element_by_uuid(uuid)
+        if parent is None:
+            if parent_index is None:
+                parent_index = _build_parent_index(proj)
+            parent = proj.get_element_by_uuid(_find_parent(parent_index, entity))
+        if parent is None:
             continue
-        uuid_dict[uuid].add_child(entity)
+        parent.add_child(entity)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 from SOMcreator.datastructure.som_json import IFC_MAPPINGS, ABBREVIATION, PROPERTY_SETS, IDENT_ATTRIBUTE, OBJECTS
 from SOMcreator.importer.som_json import property_set
 import SOMcreator
@@ -39,6 +39,9 @@ def load(proj: Project, main_dict: dict):
     core.remove_part_of_dict(OBJECTS)
 
     objects_dict = dict() if core.check_dict(objects_dict, OBJECTS) else objects_dict
+    load_items(proj, objects_dict.items())
 
-    for uuid_ident, entity_dict in objects_dict.items():
+
+def load_items(proj: Project, items: Iterable[tuple[str, ObjectDict]]):
+    for uuid_ident, entity_dict in items:
         _load_object(proj, entity_dict, uuid_ident)
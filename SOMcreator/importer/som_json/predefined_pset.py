@@ -2,10 +2,10 @@ from __future__ import annotations
 from SOMcreator.importer.som_json import core
 from SOMcreator.datastructure.som_json import PREDEFINED_PSETS
 from SOMcreator.importer.som_json import property_set
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from SOMcreator.datastructure.som_json import MainDict
+    from SOMcreator.datastructure.som_json import MainDict, PropertySetDict
     from SOMcreator import Project
 
 
@@ -13,6 +13,9 @@ def load(project: Project, main_dict: MainDict):
     predef_pset_dict = main_dict.get(PREDEFINED_PSETS)
     core.remove_part_of_dict(PREDEFINED_PSETS)
     predef_pset_dict = dict() if core.check_dict(predef_pset_dict, PREDEFINED_PSETS) else predef_pset_dict
+    load_items(project, predef_pset_dict.items())
 
-    for uuid_ident, entity_dict in predef_pset_dict.items():
+
+def load_items(project: Project, items: Iterable[tuple[str, PropertySetDict]]):
+    for uuid_ident, entity_dict in items:
         property_set.load(project, entity_dict, uuid_ident, None)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = " \t\n\r"
+NUMBER_CHARS = "0123456789.eE+-"
+
+
+class JsonStream:
+    """
+    Incremental reader for a JSON document. Only the part of the file that is currently decoded is held in memory,
+    so large objects can be walked member by member instead of being loaded as a whole.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int | None = None) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            buffer_length = len(self._buffer)
+            while self._pos < buffer_length and self._buffer[self._pos] in WHITESPACE:
+                self._pos += 1
+            if self._pos < buffer_length or not self._fill():
+                return
+
+    def peek(self) -> str:
+        self._skip_whitespace()
+        if self._pos >= len(self._buffer):
+            raise json.JSONDecodeError("Unexpected end of file", self._buffer, self._pos)
+        return self._buffer[self._pos]
+
+    def _expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def _is_truncated_number(self, end: int) -> bool:
+        # a number at the end of the buffer may continue in the next chunk
+        if self._buffer[self._pos] not in NUMBER_CHARS:
+            return False
+        return end == len(self._buffer) or self._buffer[end] in NUMBER_CHARS
+
+    def decode_value(self) -> Any:
+        """
+        decodes the next complete JSON value
+        """
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # grow geometrically so large values are not re-parsed once per chunk
+                if not self._fill(max(self._chunk_size, len(self._buffer))):
+                    raise
+                continue
+            if self._is_truncated_number(end) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        walks the members of the next JSON object. The caller has to consume the value of each key
+        (decode_value, iter_keys or iter_members) before requesting the next key
+        """
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.decode_value()
+            self._expect(":")
+            yield key
+            char = self.peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos - 1)
+
+    def iter_members(self) -> Iterator[tuple[str, Any]]:
+        """
+        yields the (key, value) pairs of the next JSON object one by one
+        """
+        for key in self.iter_keys():
+            yield key, self.decode_value()
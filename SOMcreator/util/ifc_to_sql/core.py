@@ -1,4 +1,5 @@
 from __future__ import annotations
+import datetime
 import os, tempfile
 from typing import Type, TYPE_CHECKING
 import logging
@@ -9,38 +10,73 @@ from ifcopenshell.util import element
 if TYPE_CHECKING:
     from SOMcreator.util.sql.tool import ParseSQL
     from SOMcreator.util.ifc_to_sql.tool import IfcToSQL
+    from SOMcreator.util.ifc_to_sql.properties import IfcFileContext
 
 
 def import_ifc_files(proj: Project, main_pset_name, main_attribute_name, ifc_paths: list[os.PathLike], db_path,
-                     parse_sql: Type[ParseSQL], ifctosql: Type[IfcToSQL]):
+                     parse_sql: Type[ParseSQL], ifctosql: Type[IfcToSQL], process_count: int = 1):
+    """
+    :param process_count: with more than one process the IFC files are read in parallel
+    and their rows are written in batches by this process
+    """
     db_path = parse_sql.create_database(db_path, ifctosql.create_tables)
     ifctosql.set_project_name(proj.name)
     parse_sql.connect_to_data_base(db_path)
     ifctosql.set_main_attribute(main_pset_name, main_attribute_name)
-    for ifc_path in ifc_paths:
-        ifctosql.set_ifc_file_name(os.path.basename(ifc_path))
-        logging.debug(f"Import {os.path.basename(ifc_path)}")
-        ifctosql.set_ifc(ifcopenshell.open(ifc_path))
-        logging.debug("Import Done")
-        _import_entities(ifctosql)
+    ifctosql.set_creation_date(datetime.date.today())
+    ifctosql.reset_guids()
+    contexts = [ifctosql.create_file_context(ifc_path, index) for index, ifc_path in enumerate(ifc_paths)]
+    if process_count > 1 and len(contexts) > 1:
+        for context, file_done in ifctosql.read_in_processes(contexts, process_count):
+            if file_done:
+                logging.debug(f"Written {context.ifc_file_name}")
+                parse_sql.commit_sql()
+            else:
+                ifctosql.write_rows(context)
+    else:
+        for context in contexts:
+            read_ifc_file(context, ifctosql)
+            ifctosql.write_rows(context)
+            parse_sql.commit_sql()
+    ifctosql.create_indexes()
     parse_sql.disconnect_from_data_base()
 
 
-def _import_entities(ifctosql: Type[IfcToSQL]):
-    ifc = ifctosql.get_ifc()
-    pset_name, attribute_name = ifctosql.get_main_attribute()
+def read_ifc_file(context: IfcFileContext, ifctosql: Type[IfcToSQL]):
+    """
+    collects the rows of a single IFC file. Full batches are written while reading,
+    in a worker process they are sent to the writing process instead
+    """
+    logging.debug(f"Import {context.ifc_file_name}")
+    ifctosql.open_ifc(context)
+    logging.debug("Import Done")
+    _import_entities(context, ifctosql)
+    ifctosql.close_ifc(context)
+    if ifctosql.is_worker():
+        ifctosql.send_rows(context)
+
+
+def _import_entities(context: IfcFileContext, ifctosql: Type[IfcToSQL]):
+    ifc = context.ifc
+    pset_name, attribute_name = context.main_attribute
     for entity in ifc.by_type("IfcObject"):
         identifier = element.get_pset(entity, pset_name, attribute_name)
         if not identifier:
             continue
-        ifctosql.db_create_entity(entity, identifier)
-        _import_attributes(entity, ifctosql)
+        ifctosql.db_create_entity(context, entity, identifier)
+        _import_attributes(context, entity, ifctosql)
+        if not ifctosql.is_batch_full(context):
+            continue
+        if ifctosql.is_worker():
+            ifctosql.send_rows(context)
+        else:
+            ifctosql.write_rows(context)
 
 
-def _import_attributes(entity: ifcopenshell.entity_instance, ifctosql: Type[IfcToSQL]):
+def _import_attributes(context: IfcFileContext, entity: ifcopenshell.entity_instance, ifctosql: Type[IfcToSQL]):
     properties = element.get_psets(entity)
     for pset_name, attribute_dict in properties.items():
         if pset_name == "Identity Data":
             continue
         for attribute_name, value in attribute_dict.items():
-            ifctosql.db_create_attribute(entity, pset_name, attribute_name, value, "Test")
+            ifctosql.db_create_attribute(context, entity, pset_name, attribute_name, value, "Test")
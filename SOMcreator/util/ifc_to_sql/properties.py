@@ -1,6 +1,31 @@
+from __future__ import annotations
+
+import os
+
+
 class IfcToSQLProperties:
-    ifc_file_name = ""
     project_name = ""
-    guids: dict[str, str] = dict()
+    guids: dict[str, int] = dict()  # GUID -> index of the file whose entity is stored
     main_attribute = ("", "")
-    ifc = None
+    creation_date = ""
+    batch_size = 10000
+    row_queue = None  # set in worker processes, full batches are sent to the writing process through it
+
+
+class IfcFileContext:
+    """
+    State of a single IFC file while it is converted into rows. Contexts are independent of each other,
+    so they can be filled in worker processes while their rows are written by a single connection
+    """
+
+    def __init__(self, ifc_path: str, file_index: int, project_name: str, main_attribute: tuple[str, str],
+                 creation_date: str):
+        self.ifc_path = ifc_path
+        self.file_index = file_index  # position in the import, the first file containing a GUID keeps it
+        self.ifc_file_name = os.path.basename(ifc_path)
+        self.project_name = project_name
+        self.main_attribute = main_attribute
+        self.creation_date = creation_date
+        self.ifc = None
+        self.entity_rows: list[tuple] = list()
+        self.attribute_rows: list[tuple] = list()
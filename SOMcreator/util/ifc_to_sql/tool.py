@@ -1,26 +1,96 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 if TYPE_CHECKING:
     from SOMcreator.util.ifc_to_sql.properties import IfcToSQLProperties
 import SOMcreator
-import sqlite3
 from SOMcreator.util.sql import tool
+from SOMcreator.util.ifc_to_sql.properties import IfcFileContext
 from ifcopenshell import entity_instance
 import ifcopenshell
 import logging
 import datetime
+import multiprocessing
+import queue
+
+QUEUED_BATCHES_PER_PROCESS = 2  # workers wait if the writer falls behind, so only a few batches are held in memory
+
+
+def _init_worker(row_queue):
+    """
+    runs once in every worker process of the pool
+    """
+    IfcToSQL.get_properties().row_queue = row_queue
+
+
+def _read_ifc_file(context: IfcFileContext) -> None:
+    """
+    runs in a worker process of the pool, the rows are sent through the row queue in batches
+    """
+    from SOMcreator.util.ifc_to_sql import core
+    core.read_ifc_file(context, IfcToSQL)
+    IfcToSQL.get_properties().row_queue.put((context.file_index, None, None))  # file is done
 
 
 class IfcToSQL():
 
     @classmethod
-    def set_ifc(cls, ifc: ifcopenshell.file):
-        cls.get_properties().ifc = ifc
+    def create_file_context(cls, ifc_path: str, file_index: int) -> IfcFileContext:
+        prop = cls.get_properties()
+        return IfcFileContext(ifc_path, file_index, prop.project_name, prop.main_attribute, prop.creation_date)
+
+    @classmethod
+    def open_ifc(cls, context: IfcFileContext):
+        context.ifc = ifcopenshell.open(context.ifc_path)
 
     @classmethod
-    def get_ifc(cls, ) -> ifcopenshell.file:
-        return cls.get_properties().ifc
+    def close_ifc(cls, context: IfcFileContext):
+        context.ifc = None
+
+    @classmethod
+    def read_in_processes(cls, contexts: list[IfcFileContext], process_count: int) -> Iterator[
+        tuple[IfcFileContext, bool]]:
+        """
+        reads the files in a process pool. The workers send their rows in batches, every batch is yielded as soon as
+        it arrives as (context, file_done) with the rows in the context. Batches of different files are interleaved
+        """
+        process_count = max(1, min(process_count, len(contexts)))
+        mp_context = multiprocessing.get_context("spawn")
+        row_queue = mp_context.Queue(maxsize=process_count * QUEUED_BATCHES_PER_PROCESS)
+        pool = mp_context.Pool(process_count, initializer=_init_worker, initargs=(row_queue,))
+        try:
+            result = pool.map_async(_read_ifc_file, contexts, chunksize=1)
+            open_files = len(contexts)
+            while open_files:
+                try:
+                    file_index, entity_rows, attribute_rows = row_queue.get(timeout=0.5)
+                except queue.Empty:
+                    if result.ready() and not result.successful():
+                        result.get()  # raises the exception of the worker
+                    continue
+                context = contexts[file_index]
+                file_done = entity_rows is None
+                if file_done:
+                    open_files -= 1
+                else:
+                    context.entity_rows = entity_rows
+                    context.attribute_rows = attribute_rows
+                yield context, file_done
+        finally:
+            pool.terminate()
+
+    @classmethod
+    def send_rows(cls, context: IfcFileContext):
+        """
+        passes the collected rows of a worker process to the writing process and empties the context
+        """
+        cls.get_properties().row_queue.put((context.file_index, context.entity_rows, context.attribute_rows))
+        context.entity_rows = list()
+        context.attribute_rows = list()
+
+    @classmethod
+    def is_worker(cls) -> bool:
+        return cls.get_properties().row_queue is not None
 
     @classmethod
     def set_main_attribute(cls, pset_name, attribute_name):
@@ -35,8 +105,8 @@ class IfcToSQL():
         cls.get_properties().project_name = name
 
     @classmethod
-    def set_ifc_file_name(cls, name: str):
-        cls.get_properties().ifc_file_name = name
+    def reset_guids(cls):
+        cls.get_properties().guids = dict()
 
     @classmethod
     def get_properties(cls) -> IfcToSQLProperties:
@@ -61,40 +131,81 @@ class IfcToSQL():
         tool.ParseSQL.commit_sql()
 
     @classmethod
-    def db_create_entity(cls, entity: entity_instance, bauteil_klasse):
+    def set_creation_date(cls, date: datetime.date):
+        cls.get_properties().creation_date = str(date)
+
+    @classmethod
+    def create_indexes(cls):
+        """
+        indexes are created after the bulk load so the inserts don't have to maintain them
+        """
         cursor = tool.ParseSQL.get_cursor()
-        file_name = cls.get_properties().ifc_file_name
-        project = cls.get_properties().project_name
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_guid ON entities (GUID)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_datei ON entities (datei)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_attribute_guid ON attribute (GUID)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_attribute_property ON attribute (PropertySet, Attribut)")
+        tool.ParseSQL.commit_sql()
+
+    @classmethod
+    def db_create_entity(cls, context: IfcFileContext, entity: entity_instance, bauteil_klasse):
         guid_zwc = tool.ParseSQL.transform_guid(entity.GlobalId, True)
         guid = tool.ParseSQL.transform_guid(entity.GlobalId, False)
         name = entity.Name
         ifc_type = entity.is_a()
         center = [0, 0, 0]
+        row = (guid_zwc, guid, str(name), context.project_name, ifc_type, center[0], center[1], center[2],
+               context.ifc_file_name, str(bauteil_klasse))
+        context.entity_rows.append(row)
+
+    @classmethod
+    def db_create_attribute(cls, context: IfcFileContext, entity, pset_name, attribute_name, value, data_type):
+        row = (context.creation_date, entity.GlobalId, pset_name, attribute_name, str(value), data_type)
+        context.attribute_rows.append(row)
+
+    @classmethod
+    def is_batch_full(cls, context: IfcFileContext) -> bool:
+        batch_size = cls.get_properties().batch_size
+        return len(context.entity_rows) >= batch_size or len(context.attribute_rows) >= batch_size
+
+    @classmethod
+    def write_rows(cls, context: IfcFileContext):
+        """
+        writes the collected rows of a file with executemany and empties the context.
+        An entity is only written if no earlier file contains its GUID. If a later file was written first,
+        its entity is replaced, so the result doesn't depend on the order in which the batches arrive.
+        Committing is left to the caller
+        """
         guids = cls.get_properties().guids
-        if guid in guids:
-            return
-        else:
-            guids[guid] = file_name
-        try:
-            cursor.execute(f'''
-                      INSERT INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
-                            VALUES
-                            ('{guid_zwc}','{guid}','{name}','{project}','{ifc_type}',{center[0]},{center[1]},{center[2]},'{file_name}','{bauteil_klasse}')
-                      ''')
-            tool.ParseSQL.commit_sql()
-        except sqlite3.IntegrityError:
-            logging.warning("Integrity Error -> Element allready exists")
-            pass
-
-    @classmethod
-    def db_create_attribute(cls, entity, pset_name, attribute_name, value, data_type):
-        guid = entity.GlobalId
-        cursor = tool.ParseSQL.get_cursor()
-        date = datetime.date.today()
+        entity_rows = list()
+        replaced_rows = list()
+        for row in context.entity_rows:
+            guid = row[1]
+            owner = guids.get(guid)
+            if owner is None:
+                entity_rows.append(row)
+            elif owner > context.file_index:
+                replaced_rows.append(row)
+            else:
+                continue
+            guids[guid] = context.file_index
 
-        cursor.execute(f'''
+        cursor = tool.ParseSQL.get_cursor()
+        if entity_rows:
+            cursor.executemany('''
+                      INSERT OR IGNORE INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
+                            VALUES (?,?,?,?,?,?,?,?,?,?)
+                      ''', entity_rows)
+            if cursor.rowcount < len(entity_rows):
+                logging.warning("Integrity Error -> Element allready exists")
+        if replaced_rows:
+            cursor.executemany('''
+                      INSERT OR REPLACE INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
+                            VALUES (?,?,?,?,?,?,?,?,?,?)
+                      ''', replaced_rows)
+        if context.attribute_rows:
+            cursor.executemany('''
                           INSERT INTO attribute (creation_date, GUID, PropertySet, Attribut, Value, Type)
-                                VALUES
-                                ('{date}','{guid}','{pset_name}','{attribute_name}','{value}','{data_type}')
-                          ''')
-        tool.ParseSQL.commit_sql()
+                                VALUES (?,?,?,?,?,?)
+                          ''', context.attribute_rows)
+        context.entity_rows = list()
+        context.attribute_rows = list()
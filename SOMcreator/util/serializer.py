@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import gc
+import gzip
+import json
+import re
+from typing import Any, Callable, TextIO
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+COMPACT_LEVEL = 6
+
+# name -> (dumps, loads). dumps returns ASCII bytes, loads accepts bytes
+backends: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = dict()
+active_backend = ""
+
+
+def register_backend(name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes], Any]) -> None:
+    backends[name] = (dumps, loads)
+
+
+def set_backend(name: str) -> None:
+    global active_backend
+    if name not in backends:
+        raise ValueError(f"JSON backend '{name}' is not available. Choose from {list(backends)}")
+    active_backend = name
+
+
+def get_backend() -> str:
+    return active_backend
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data).encode("ascii")
+
+
+# orjson reads integers outside of the 64 bit range as float. Such numbers need at least 19 digits
+_LONG_NUMBER = re.compile(rb"\d{19}")
+
+
+def _orjson_loads(data: bytes) -> Any:
+    if _LONG_NUMBER.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:  # NaN and Infinity are written by the json module but aren't valid JSON
+            pass
+    return json.loads(data)
+
+
+register_backend("json", _json_dumps, json.loads)
+if orjson is not None:
+    # files are always written by the json module: older releases read them with the locale encoding, so they have
+    # to stay ASCII, and orjson can't write integers above 64 bit or NaN
+    register_backend("orjson", _json_dumps, _orjson_loads)
+set_backend("orjson" if orjson is not None else "json")
+
+
+def dumps(data: Any) -> bytes:
+    return backends[active_backend][0](data)
+
+
+def loads(data: bytes) -> Any:
+    return backends[active_backend][1](data)
+
+
+def is_compact(path: str) -> bool:
+    with open(path, "rb") as file:
+        return file.read(2) == GZIP_MAGIC
+
+
+def write(path: str, data: Any, compact: bool = False) -> None:
+    """
+    :param compact: write a gzip container instead of plain JSON. Repeated keys, pset and attribute names
+    compress well, the content stays the same JSON document
+    """
+    content = dumps(data)
+    if compact:
+        content = gzip.compress(content, compresslevel=COMPACT_LEVEL, mtime=0)
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def read(path: str) -> Any:
+    with open(path, "rb") as file:
+        content = file.read()
+    if content[:2] == GZIP_MAGIC:
+        content = gzip.decompress(content)
+    # decoding only allocates acyclic containers, collecting in between is wasted time
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return loads(content)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def open_text(path: str) -> TextIO:
+    """
+    opens a plain or compact file as UTF-8 text stream
+    """
+    if is_compact(path):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
@@ -1,4 +1,4 @@
 import SOMcreator
-from properties import SQLProperties
+from .properties import SQLProperties
 
 SOMcreator.SQLProperties = SQLProperties()
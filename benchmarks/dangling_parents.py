@@ -0,0 +1,76 @@
+"""
+Times the import of a SOM project with many dangling parent references.
+
+    python benchmarks/dangling_parents.py [--objects 20000]
+
+A generated project is saved, then the parent uuid of every inherited "Predef" PropertySet except the first one
+is replaced by an uuid that doesn't exist. The import has to repair these references in inheritance.calculate,
+the script prints its duration and how many of them were resolved.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from SOMcreator import Project
+from SOMcreator.importer.som_json import inheritance
+
+from generate_project import create_project
+
+
+def break_parent_references(path: str) -> int:
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    broken_count = 0
+    kept_first = False
+    for obj_dict in data["Objects"].values():
+        for pset_dict in obj_dict["PropertySets"].values():
+            if not pset_dict["parent"]:
+                continue
+            if not kept_first:
+                kept_first = True
+                continue
+            pset_dict["parent"] = f"dangling-{broken_count}"
+            broken_count += 1
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    return broken_count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dangling parent reference import benchmark")
+    parser.add_argument("--objects", type=int, default=20000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "dangling.SOMjson")
+    create_project(args.objects).save(path)
+    broken_count = break_parent_references(path)
+
+    calculate = inheritance.calculate
+    durations = list()
+
+    def timed_calculate(proj):
+        start = time.perf_counter()
+        calculate(proj)
+        durations.append(time.perf_counter() - start)
+
+    inheritance.calculate = timed_calculate
+    try:
+        start = time.perf_counter()
+        proj = Project.open(path, stream=False)
+        open_duration = time.perf_counter() - start
+    finally:
+        inheritance.calculate = calculate
+
+    resolved = sum(1 for pset in proj.get_property_sets(filter=False) if pset.name == "Predef" and pset.parent)
+    resolved -= 1  # the first reference was kept
+    print(f"{os.path.getsize(path) / 2 ** 20:.0f} MB, {broken_count} dangling references")
+    print(f"open {open_duration:.2f} s, inheritance.calculate {durations[0]:.2f} s, "
+          f"{resolved} of {broken_count} resolved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Times the SOM JSON export of a project whose Attributes have many distinct filter matrices.
+
+    python benchmarks/filter_matrix_export.py [--objects 10000] [--attributes 10]
+
+The generated project has 4 phases and 4 use cases. Every Attribute is enabled per phase and use case by chance,
+so the default of 10000 objects with 10 attributes creates a project with 100k attributes and about 27k distinct
+filter matrices.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from SOMcreator.exporter.som_json import create_export_dict, reset_uuid_dicts
+
+from generate_project import create_project
+
+FILTER_COUNT = 4
+FILTER_PROBABILITY = 0.7
+
+
+def main():
+    parser = argparse.ArgumentParser(description="filter matrix export benchmark")
+    parser.add_argument("--objects", type=int, default=10000)
+    parser.add_argument("--attributes", type=int, default=10, help="attributes per object")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    proj = create_project(args.objects, args.attributes, FILTER_COUNT, FILTER_COUNT, FILTER_PROBABILITY)
+    attribute_count = len(list(proj.get_attributes(filter=False)))
+    print(f"generated {attribute_count} attributes in {time.perf_counter() - start:.1f} s")
+
+    reset_uuid_dicts()
+    start = time.perf_counter()
+    export_dict = create_export_dict(proj)
+    duration = time.perf_counter() - start
+    print(f"create_export_dict {duration:.2f} s, {len(export_dict['FilterMatrixes'])} distinct filter matrices")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Creates synthetic SOM projects for the benchmarks in this folder.
+
+Every Object gets an identifier Attribute and a PropertySet "Main" with further Attributes.
+Every third Object inherits the predefined PropertySet "Predef", consecutive Objects are chained into aggregations.
+
+    python benchmarks/generate_project.py 20000 big.SOMjson
+"""
+from __future__ import annotations
+
+import argparse
+import random
+
+import SOMcreator
+from SOMcreator import Aggregation, Attribute, Object, Project, PropertySet
+
+PREDEFINED_INTERVAL = 3
+AGGREGATION_LENGTH = 10
+
+
+def create_project(object_count: int, attributes_per_object: int = 6, phase_count: int = 1, usecase_count: int = 1,
+                   filter_probability: float | None = None, seed: int = 1) -> Project:
+    """
+    :param attributes_per_object: number of Attributes in "Main" including the identifier
+    :param phase_count: the project gets phases and use cases until these counts are reached
+    :param filter_probability: if set, every Attribute is enabled per phase and use case with this probability,
+    which creates many distinct filter matrices
+    """
+    random.seed(seed)
+    proj = Project(name="Benchmark", author="benchmark")
+    for index in range(len(proj.get_phases()), phase_count):
+        proj.add_project_phase(SOMcreator.Phase(f"Phase{index}", f"Phase{index}", ""))
+    for index in range(len(proj.get_usecases()), usecase_count):
+        proj.add_use_case(SOMcreator.UseCase(f"UseCase{index}", f"UseCase{index}", ""))
+    phases, usecases = proj.get_phases(), proj.get_usecases()
+
+    predefined_pset = PropertySet(name="Predef", project=proj)
+    Attribute(predefined_pset, "PredefAttribute", ["a", "b"], SOMcreator.value_constants.LIST, project=proj)
+    root = None
+    for index in range(object_count):
+        ident = Attribute(name="ident", value=[f"id.{index}"], project=proj)
+        obj = Object(name=f"Object{index}", ident_attrib=ident, project=proj)
+        main_pset = PropertySet(name="Main", project=proj)
+        obj.add_property_set(main_pset)
+        main_pset.add_attribute(ident)
+        for attribute_index in range(attributes_per_object - 1):
+            attribute = Attribute(name=f"Attribute{attribute_index}", value=[str(v) for v in range(5)],
+                                  value_type=SOMcreator.value_constants.LIST, project=proj)
+            main_pset.add_attribute(attribute)
+        if index % PREDEFINED_INTERVAL == 0:
+            obj.add_property_set(predefined_pset.create_child("Predef"))
+        aggregation = Aggregation(obj=obj)
+        if index % AGGREGATION_LENGTH:
+            root.add_child(aggregation)
+        else:
+            root = aggregation
+
+    if filter_probability is not None:
+        for attribute in proj.get_attributes(filter=False):
+            for phase in phases:
+                for usecase in usecases:
+                    attribute.set_filter_state(phase, usecase, random.random() < filter_probability)
+    return proj
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create a synthetic SOM project")
+    parser.add_argument("object_count", type=int)
+    parser.add_argument("path")
+    parser.add_argument("--attributes", type=int, default=6, help="attributes per object")
+    args = parser.parse_args()
+    proj = create_project(args.object_count, args.attributes)
+    proj.save(args.path)
+    print(f"{args.path}: {args.object_count} objects, {len(list(proj.get_attributes(filter=False)))} attributes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Measures how many entity and issue rows per second the modelcheck writes into its SQLite database.
+
+    python benchmarks/modelcheck_sql.py [--entities 20000] [--issues-per-entity 10]
+
+"buffered" writes through Modelcheck.db_create_entity and Modelcheck.add_issues, which collect the rows and insert
+them in batches. "per row" inserts and commits every row on its own like the modelcheck did before.
+The per row run only writes the first --per-row-entities entities, because it is very slow on most disks.
+"""
+from __future__ import annotations
+
+import argparse
+import datetime
+import os
+import tempfile
+import time
+
+import ifcopenshell
+import ifcopenshell.guid
+
+import SOMcreator
+from som_gui import tool
+from som_gui.module import modelcheck as modelcheck_module
+from som_gui.module import project as project_module
+from som_gui.module.modelcheck.constants import PROPERTY_SET_ISSUE
+
+FILE_NAME = "benchmark.ifc"
+
+
+def create_entities(entity_count: int) -> list[ifcopenshell.entity_instance]:
+    ifc = ifcopenshell.file(schema="IFC4")
+    return [ifc.createIfcWall(ifcopenshell.guid.new(), None, f"Wall{index}") for index in range(entity_count)]
+
+
+def write_buffered(db_path: str, entities: list[ifcopenshell.entity_instance], issues_per_entity: int):
+    modelcheck = tool.Modelcheck
+    modelcheck.init_sql_database(db_path)
+    modelcheck.connect_to_data_base(db_path)
+    modelcheck.reset_guids()
+    modelcheck.set_ifc_name(FILE_NAME)
+    for entity in entities:
+        modelcheck.db_create_entity(entity, "Wall")
+        for index in range(issues_per_entity):
+            modelcheck.add_issues(entity.GlobalId, "Pset missing", PROPERTY_SET_ISSUE, None, f"Pset{index}")
+    modelcheck.disconnect_from_data_base()
+
+
+def write_per_row(db_path: str, entities: list[ifcopenshell.entity_instance], issues_per_entity: int):
+    modelcheck = tool.Modelcheck
+    modelcheck.connect_to_data_base(db_path)
+    modelcheck.create_tables()
+    connection = modelcheck.get_properties().connection
+    project = tool.Project.get().name
+    date = datetime.date.today()
+    for entity in entities:
+        guid = entity.GlobalId
+        guid_zwc = tool.Util.transform_guid(guid, True)
+        connection.execute(f'''
+                  INSERT INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
+                        VALUES
+                        ('{guid_zwc}','{guid}','{entity.Name}','{project}','{entity.is_a()}',0,0,0,'{FILE_NAME}','Wall')
+                  ''')
+        connection.commit()
+        for index in range(issues_per_entity):
+            connection.execute(f'''
+                  INSERT INTO issues (GUID_ZWC,creation_date,GUID,short_description,issue_type,PropertySet,Attribut,Value)
+                        VALUES
+                        ('{guid_zwc}','{date}','{guid}','Pset missing',{PROPERTY_SET_ISSUE},'Pset{index}','','')
+                  ''')
+            connection.commit()
+    modelcheck.disconnect_from_data_base()
+
+
+def measure(name: str, func, db_path: str, entities: list[ifcopenshell.entity_instance], issues_per_entity: int):
+    start = time.perf_counter()
+    func(db_path, entities, issues_per_entity)
+    duration = time.perf_counter() - start
+    rows = len(entities) * (issues_per_entity + 1)
+    print(f"{name:9} {rows:>9} rows in {duration:7.2f} s  {rows / duration:10.0f} rows/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="modelcheck SQL write benchmark")
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--issues-per-entity", type=int, default=10)
+    parser.add_argument("--per-row-entities", type=int, default=500)
+    args = parser.parse_args()
+
+    modelcheck_module.register()
+    project_module.register()
+    tool.Project.get_properties().active_project = SOMcreator.Project(name="Benchmark")
+    entities = create_entities(args.entities)
+    directory = tempfile.mkdtemp()
+    measure("buffered", write_buffered, os.path.join(directory, "buffered.db"), entities, args.issues_per_entity)
+    measure("per row", write_per_row, os.path.join(directory, "per_row.db"), entities[:args.per_row_entities],
+            args.issues_per_entity)
+
+
+if __name__ == "__main__":
+    main()
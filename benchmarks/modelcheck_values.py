@@ -0,0 +1,102 @@
+"""
+Times the value checks of the modelcheck on a synthetic workload of 1M values.
+
+    python benchmarks/modelcheck_values.py [--values 1000000]
+
+"per value" repeats the checks as they were done before the AttributeChecker: the allowed values are converted
+for every value and every format is matched uncompiled. "checker" compiles an AttributeChecker for the same
+Attribute and runs its checks. Both include the datatype check, issues aren't written.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import Callable
+
+import SOMcreator
+from SOMcreator.constants import value_constants
+from som_gui.tool.modelcheck import AttributeChecker
+
+LIST_VALUES = [f"V{index}" for index in range(40)]
+FORMATS = [r"\d{3}-[A-Z]+", r"X\d+", r"[a-z]{2}\d"]
+RANGES = [[0, 10], [20, 30], [50, 100]]
+
+
+def check_list(value, attribute: SOMcreator.Attribute) -> bool:
+    return not attribute.value or str(value) in [str(v) for v in attribute.value]
+
+
+def check_format(value, attribute: SOMcreator.Attribute) -> bool:
+    is_ok = False
+    for form in attribute.value:
+        if re.match(form, value) is not None:
+            is_ok = True
+    return is_ok
+
+
+def check_range(value, attribute: SOMcreator.Attribute) -> bool:
+    is_ok = False
+    for possible_range in attribute.value:
+        if min(possible_range) <= value <= max(possible_range):
+            is_ok = True
+    return is_ok
+
+
+def check_datatype(value, attribute: SOMcreator.Attribute) -> bool:
+    return isinstance(value, value_constants.DATATYPE_DICT[attribute.data_type])
+
+
+def create_workload(value_count: int) -> list[tuple[SOMcreator.Attribute, Callable, list]]:
+    project = SOMcreator.Project()
+    obj = SOMcreator.Object("Object", "1", project=project)
+    property_set = SOMcreator.PropertySet("Pset", obj, project=project)
+
+    def create_attribute(name, value, value_type, data_type):
+        return SOMcreator.Attribute(property_set, name, value, value_type, data_type, project=project)
+
+    list_attribute = create_attribute("List", LIST_VALUES, value_constants.LIST, value_constants.LABEL)
+    format_attribute = create_attribute("Format", FORMATS, value_constants.FORMAT, value_constants.LABEL)
+    range_attribute = create_attribute("Range", RANGES, value_constants.RANGE, value_constants.REAL)
+    count = value_count // 3
+    list_data = [random.choice(LIST_VALUES + ["invalid"]) for _ in range(count)]
+    format_data = [random.choice(["123-AB", "X42", "ab1", "invalid"]) for _ in range(count)]
+    range_data = [random.uniform(-10, 110) for _ in range(value_count - 2 * count)]
+    return [(list_attribute, check_list, list_data), (format_attribute, check_format, format_data),
+            (range_attribute, check_range, range_data)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="modelcheck value check benchmark")
+    parser.add_argument("--values", type=int, default=1_000_000)
+    args = parser.parse_args()
+    random.seed(1)
+    workload = create_workload(args.values)
+    total_per_value = total_checker = 0.0
+    for attribute, check_func, data in workload:
+        start = time.perf_counter()
+        per_value_issues = 0
+        for value in data:
+            per_value_issues += not check_func(value, attribute)
+            check_datatype(value, attribute)
+        per_value = time.perf_counter() - start
+
+        start = time.perf_counter()
+        checker = AttributeChecker(attribute)
+        checker_issues = 0
+        for value in data:
+            checker_issues += not checker.is_value_allowed(value)
+            checker.is_datatype_allowed(value)
+        checker_time = time.perf_counter() - start
+
+        assert per_value_issues == checker_issues
+        total_per_value += per_value
+        total_checker += checker_time
+        print(f"{attribute.name:8} {len(data):>9} values  per value {per_value:6.2f} s  checker {checker_time:6.2f} s  "
+              f"{per_value_issues} issues")
+    print(f"{'total':8} {args.values:>9} values  per value {total_per_value:6.2f} s  checker {total_checker:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
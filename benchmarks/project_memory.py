@@ -0,0 +1,58 @@
+"""
+Measures the memory a SOM project occupies after Project.open with tracemalloc.
+
+    python benchmarks/project_memory.py                 generates a project with 20000 objects (120k attributes)
+    python benchmarks/project_memory.py path.SOMjson    measures an existing project
+
+Run it on two commits to compare the bytes per attribute.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from SOMcreator import Project
+from SOMcreator.importer import som_json
+
+from generate_project import create_project
+
+TOP_STATISTICS = 10
+
+
+def main():
+    parser = argparse.ArgumentParser(description="memory of an opened SOM project")
+    parser.add_argument("path", nargs="?", help="SOMjson file, a synthetic project is generated if omitted")
+    parser.add_argument("--objects", type=int, default=20000, help="objects of the generated project")
+    args = parser.parse_args()
+
+    path = args.path
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(), "memory.SOMjson")
+        create_project(args.objects).save(path)
+        gc.collect()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    proj = Project.open(path)
+    duration = time.perf_counter() - start
+    som_json.parent_dict = dict()  # raw parent references of the import, they don't belong to the project
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    attribute_count = len(list(proj.get_attributes(filter=False)))
+    item_count = len(list(proj.get_hirarchy_items(filter=False)))
+    print(f"{attribute_count} attributes, {item_count} items, open {duration:.1f} s")
+    print(f"traced {current / 2 ** 20:.1f} MB (peak {peak / 2 ** 20:.1f} MB), "
+          f"{current / attribute_count:.0f} bytes/attribute")
+    for statistic in snapshot.statistics("lineno")[:TOP_STATISTICS]:
+        print(f"    {statistic}")
+
+
+if __name__ == "__main__":
+    main()
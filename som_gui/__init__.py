@@ -3,6 +3,7 @@ __version__ = "2.13.4" #needs to be on top of som_gui import statements else Imp
 
 import logging
 from typing import TYPE_CHECKING
+from som_gui import startup_profiler  # first import, so the profile includes the startup of som_gui
 from som_gui import core, tool
 from som_gui.resources.icons import get_icon
 import importlib
@@ -24,12 +25,14 @@ for m in pkgutil.iter_modules(module.__path__):
         continue
     logging.info(f"Importing Module '{m.name}'")
     path = f"som_gui.module.{m.name}"
-    modules.append((m.name,importlib.import_module(path)))
+    with startup_profiler.measure("import", m.name):
+        modules.append((m.name,importlib.import_module(path)))
 
 #import Plugin Modules
 for plugin_names in tool.Plugins.get_available_plugins():
     if tool.Plugins.is_plugin_active(plugin_names):
-        modules += tool.Plugins.import_plugin(plugin_names)
+        with startup_profiler.measure("import", f"plugin {plugin_names}"):
+            modules += tool.Plugins.import_plugin(plugin_names)
 
 
 def register():
@@ -41,11 +44,13 @@ def register():
     #Start with the Preregister
     for module_name in preregister:
         index = [x[0] for x in modules].index(module_name)
-        modules[index][1].register()
+        with startup_profiler.measure("register", module_name):
+            modules[index][1].register()
 
     for name, module in modules:
         if name not in preregister:
-            module.register()
+            with startup_profiler.measure("register", name):
+                module.register()
 
 
 def load_ui_triggers():
@@ -57,11 +62,13 @@ def load_ui_triggers():
     #Start with the Preregister
     for module_name in preregister:
         index = [x[0] for x in modules].index(module_name)
-        modules[index][1].load_ui_triggers()
+        with startup_profiler.measure("load_ui_triggers", module_name):
+            modules[index][1].load_ui_triggers()
 
     for name, module in modules:
         if name not in preregister:
-            module.load_ui_triggers()
+            with startup_profiler.measure("load_ui_triggers", name):
+                module.load_ui_triggers()
 
 
 def retranslate_ui():
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import multiprocessing
 import sys
 from typing import TYPE_CHECKING
 from PySide6.QtWidgets import QApplication
@@ -6,7 +7,7 @@ from PySide6.QtWidgets import QApplication
 if TYPE_CHECKING:
     from os import PathLike
 
-from som_gui import core,tool
+from som_gui import core,tool,startup_profiler
 import som_gui.core.main_window
 import som_gui.core.project
 from som_gui.module.project.constants import OPEN_PATH
@@ -31,6 +32,7 @@ def main(initial_file: PathLike | None = None, log_level=None, open_last_project
     #Create UI
     app = QApplication(sys.argv)
     core.main_window.create_main_window(app, tool.MainWindow)
+    startup_profiler.watch_first_paint(tool.MainWindow.get())
     som_gui.load_ui_triggers()
 
     #create Empty Project (calls som_gui.on_new_project)
@@ -47,4 +49,5 @@ def main(initial_file: PathLike | None = None, log_level=None, open_last_project
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
@@ -142,4 +142,4 @@ def main(name: str):
 if __name__ == "__main__":
     module_name = "test_module"
     main(module_name)
-    #you need to add module to tool.__init__.py by hand
\ No newline at end of file
+    #you need to add the tool to TOOL_MODULES in tool.__init__.py by hand
\ No newline at end of file
@@ -4,14 +4,15 @@ import logging
 import os
 from typing import TYPE_CHECKING, Type
 
-import ifcopenshell
 from PySide6.QtCore import QCoreApplication, Qt
 
 import SOMcreator.constants.value_constants as value_constants
 
 if TYPE_CHECKING:
+    import ifcopenshell
     from som_gui import tool
     from som_gui.tool.ifc_importer import IfcImportRunner
+    from som_gui.tool.attribute_import import FilterTableRunner
     from som_gui.module.attribute_import.ui import ValueCheckBox
 import time
 
@@ -52,7 +53,7 @@ def open_import_window(attribute_import: Type[tool.AttributeImport],
     phases = [proj.get_phase_by_index(i) for i in proj.active_phases]
     attribute_import_sql.set_current_object_filter(usecases, phases)
     if attribute_import_results.is_window_allready_build():
-        attribute_import_sql.create_som_filter_table()
+        update_filter_tables(attribute_import_results, attribute_import_sql)
         attribute_import_results.get_results_window().show()
         return
 
@@ -95,6 +96,7 @@ def init_database(attribute_import: Type[tool.AttributeImport], attribute_import
                   project: Type[tool.Project], util: Type[tool.Util]):
     proj = project.get()
     db_path = util.create_tempfile(".db")
+    attribute_import_sql.close_session()
     attribute_import_sql.init_database(db_path)
     all_attributes = list(proj.get_attributes(filter=False))
 
@@ -155,16 +157,33 @@ def start_attribute_import(file: ifcopenshell.file, path, attribute_import: Type
                            attribute_import_sql: Type[tool.AttributeImportSQL], project: Type[tool.Project]):
     pset_name, attribute_name = attribute_import.get_main_pset(), attribute_import.get_main_attribute()
     attribute_import_sql.connect_to_data_base(attribute_import_sql.get_database_path())
+    file_name = os.path.basename(path)
     entity_list = list(file.by_type("IfcObject"))
     entity_count = len(entity_list)
     status_text = "Entität aus Datei importieren:"
     attribute_dict = attribute_import_results.build_attribute_dict(list(project.get().get_objects(filter=False)))
+    batch_size = attribute_import_sql.get_batch_size()
+    entity_rows, attribute_rows = list(), list()
+    row_count = 0
+    start_time = time.perf_counter()
     for index, entity in enumerate(entity_list):
         if index % 100 == 0:
+            rows_per_second = int(row_count / max(time.perf_counter() - start_time, 1e-3))
             attribute_import.set_progress(int(index / entity_count * 100))
-            attribute_import.set_status(f"{status_text} {index}/{entity_count}")
-        identifier = attribute_import_sql.add_entity(entity, pset_name, attribute_name, os.path.basename(path))
-        attribute_import_sql.import_entity_attributes(entity, file, identifier, attribute_dict)
+            attribute_import.set_status(f"{status_text} {index}/{entity_count} ({rows_per_second} Zeilen/s)")
+        pset_dict = attribute_import_sql.get_entity_psets(entity)
+        identifier = attribute_import_sql.get_identifier(pset_dict, pset_name, attribute_name)
+        entity_rows.append(attribute_import_sql.create_entity_row(entity, identifier, file_name))
+        new_rows = attribute_import_sql.create_attribute_rows(entity, pset_dict, file, identifier, attribute_dict)
+        attribute_rows += new_rows
+        row_count += len(new_rows) + 1
+        if len(attribute_rows) >= batch_size:
+            attribute_import_sql.insert_entities(entity_rows)
+            attribute_import_sql.insert_attributes(attribute_rows)
+            entity_rows, attribute_rows = list(), list()
+    attribute_import_sql.insert_entities(entity_rows)
+    attribute_import_sql.insert_attributes(attribute_rows)
+    # the whole file is written in one transaction, disconnecting commits it
     attribute_import_sql.disconnect_from_database()
 
 
@@ -187,24 +206,77 @@ def attribute_import_finished(attribute_import: Type[tool.AttributeImport], ifc_
 
 
 def last_import_finished(attribute_import: Type[tool.AttributeImport],
+                         attribute_import_results: Type[tool.AttributeImportResults],
                          attribute_import_sql: Type[tool.AttributeImportSQL]):
     attribute_import.get_ifc_import_window().close()
-    attribute_import_sql.create_som_filter_table()
     from ..module.attribute_import import trigger
     trigger.open_results_window()
+    update_filter_tables(attribute_import_results, attribute_import_sql, create_indexes=True)
 
 
 def open_results_window(attribute_import_results: Type[tool.AttributeImportResults]):
     attribute_import_widget = attribute_import_results.create_attribute_import_window()
     attribute_import_results.connect_trigger(attribute_import_widget)
     attribute_import_widget.show()
-    attribute_import_results.update_results_window()
-    attribute_import_results.get_ifctype_combo_box().setCurrentText(attribute_import_results.get_all_keyword())
-    attribute_import_results.get_somtype_combo_box().setCurrentText(attribute_import_results.get_all_keyword())
     from ..module.attribute_import import trigger
     trigger.retranslate_ui()
 
 
+def update_filter_tables(attribute_import_results: Type[tool.AttributeImportResults],
+                         attribute_import_sql: Type[tool.AttributeImportSQL], create_indexes=False):
+    """
+    rebuilds the filter and summary tables in a worker thread if their inputs changed since the last build
+    """
+    if attribute_import_sql.filter_tables_are_building():
+        # the inputs are compared again when the running build is finished
+        attribute_import_results.set_results_window_busy(True)
+        return
+    if attribute_import_sql.filter_tables_are_current() and not create_indexes:
+        attribute_import_results.update_results_window()
+        return
+    attribute_import_sql.close_session()
+    runner = attribute_import_sql.create_filter_table_runner(create_indexes)
+    attribute_import_sql.connect_filter_table_runner(runner)
+    attribute_import_results.set_results_window_busy(True)
+    attribute_import_sql.get_filter_table_threadpool().start(runner)
+
+
+def build_filter_tables(runner: FilterTableRunner, attribute_import_sql: Type[tool.AttributeImportSQL]):
+    attribute_import_sql.connect_to_data_base(runner.database_path)
+    if runner.create_indexes:
+        attribute_import_sql.set_status(QCoreApplication.translate("AttributeImport", "Create Indexes"))
+        attribute_import_sql.set_progress(0)
+        attribute_import_sql.create_indexes()
+    attribute_import_sql.set_status(QCoreApplication.translate("AttributeImport", "Filter Attributes"))
+    attribute_import_sql.set_progress(0)
+    attribute_import_sql.create_som_filter_table()
+    attribute_import_sql.set_status(QCoreApplication.translate("AttributeImport", "Count Values"))
+    attribute_import_sql.set_progress(0)
+    attribute_import_sql.create_summary_tables()
+    attribute_import_sql.disconnect_from_database()
+
+
+def filter_tables_built(runner: FilterTableRunner, attribute_import_results: Type[tool.AttributeImportResults],
+                        attribute_import_sql: Type[tool.AttributeImportSQL]):
+    attribute_import_sql.remove_filter_table_runner()
+    attribute_import_sql.set_filter_key(runner.filter_key if runner.tables_created else None)
+    if not attribute_import_results.is_window_allready_build():
+        return
+    if not runner.tables_created:
+        logging.error("Filter tables of the attribute import could not be created")
+        attribute_import_results.set_results_window_busy(False)
+        return
+    if not attribute_import_sql.filter_tables_are_current():
+        # the settings were changed during the build
+        update_filter_tables(attribute_import_results, attribute_import_sql)
+        return
+    attribute_import_results.set_results_window_busy(False)
+    attribute_import_results.update_results_window()
+    if runner.create_indexes:  # first build after an import
+        attribute_import_results.get_ifctype_combo_box().setCurrentText(attribute_import_results.get_all_keyword())
+        attribute_import_results.get_somtype_combo_box().setCurrentText(attribute_import_results.get_all_keyword())
+
+
 def update_results_window(attriubte_import_results: Type[tool.AttributeImportResults]):
     attriubte_import_results.update_results_window()
 
@@ -359,14 +431,15 @@ def settings_clicked(attribute_import_results: Type[tool.AttributeImportResults]
     attriubte_import_sql.update_settins_dialog_checkstates(settings_dialog)
     if settings_dialog.exec():
         attriubte_import_sql.settings_dialog_accepted(settings_dialog)
-        attriubte_import_sql.create_som_filter_table()
-        attribute_import_results.update_results_window()
+        update_filter_tables(attribute_import_results, attriubte_import_sql)
 
 
-def results_abort_clicked(attribute_import_results: Type[tool.AttributeImportResults]):
+def results_abort_clicked(attribute_import_results: Type[tool.AttributeImportResults],
+                          attribute_import_sql: Type[tool.AttributeImportSQL]):
     window = attribute_import_results.get_results_window()
     window.close()
     attribute_import_results.remove_results_window()
+    attribute_import_sql.close_session()
 
 
 def results_accept_clicked(attribute_import_results: Type[tool.AttributeImportResults],
@@ -380,12 +453,13 @@ def results_accept_clicked(attribute_import_results: Type[tool.AttributeImportRe
         if attribute.value_type in [value_constants.FORMAT, value_constants.RANGE]:
             continue
         if value not in attribute.value:
-            attribute.value.append(value)
+            attribute.value = attribute.value + [value]
 
     removed_values = attribute_import_sql.get_removed_attribute_values()
     for identifier, property_set_name, attribute_name, value in removed_values:
         attribute = attribute_dict[identifier][property_set_name][attribute_name]
-        attribute.value.remove(value)
+        attribute.value = [v for v in attribute.value if v != value]
+    attribute_import_sql.close_session()
     window = attribute_import_results.get_results_window()
     window.close()
     attribute_import_results.remove_results_window()
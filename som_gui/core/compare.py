@@ -101,6 +101,8 @@ def open_compare_window(compare_window: Type[tool.CompareWindow], project_select
     appdata.set_path(COMPARE_SETTING, other_file_path)
     project_0 = project.get()
     project_1 = Project.open(other_file_path)
+    # opening a Project makes it the active one, new items should still be created in the current Project
+    project.set_active_project(project_0)
 
     if not project_selector.is_current_project_input():
         project_0, project_1 = project_1, project_0
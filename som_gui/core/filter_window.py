@@ -60,10 +60,10 @@ def search_object(filter_window: Type[tool.FilterWindow], search: Type[tool.Sear
     #You can't combine the parent search with expanding the Tree it needs to happen in two steps
 
     for item in reversed(parent_list):
-        index: QModelIndex = item.index
+        index: QModelIndex = filter_window.get_model_index(item)
         object_tree.expand(index)
 
-    index: QModelIndex = obj.index
+    index: QModelIndex = filter_window.get_model_index(obj)
     flags = object_tree.selectionModel().SelectionFlag.ClearAndSelect | object_tree.selectionModel().SelectionFlag.Rows
     object_tree.selectionModel().select(index, flags)
     object_tree.scrollTo(index.sibling(index.row(), 0),object_tree.ScrollHint.EnsureVisible)
@@ -21,12 +21,15 @@ def create_logger(logging_tool: Type[tool.Logging], util: Type[tool.Util], main_
     logger.setLevel(logging_tool.get_log_level())
 
     logging_tool.get_signaller()  # create signaller
-    for handler in logger.handlers:
+    for handler in list(logger.handlers):
         logger.removeHandler(handler)
 
-    logger.addHandler(logging_tool.create_console_handler())
-    logger.addHandler(logging_tool.create_file_handler(logging_tool.get_logging_filename()))
-    logger.addHandler(logging_tool.create_popup_handler(main_window.get()))  # creates Popup if Error/Warning is logged
+    handlers = [logging_tool.create_console_handler(),
+                logging_tool.create_file_handler(logging_tool.get_logging_filename()),
+                logging_tool.create_popup_handler(main_window.get()),  # creates Popup if Error/Warning is logged
+                ]
+    # the handlers run in a separate thread, so logging doesn't block the thread that logs
+    logger.addHandler(logging_tool.create_queue_handler(handlers))
     logging_tool.create_error_popup()  # creates Popup if error is raised
 
 
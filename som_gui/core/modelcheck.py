@@ -4,13 +4,14 @@ from typing import TYPE_CHECKING, Type
 
 if TYPE_CHECKING:
     from som_gui import tool
+    import ifcopenshell
 import SOMcreator
-import ifcopenshell
 from datetime import datetime
 from PySide6.QtCore import QCoreApplication
 
 GROUP = "Gruppe"
 ELEMENT = "Element"
+ENTITY_CHECK_PLUGINS = "entity_check_plugins"
 
 rev_datatype_dict = {
     str:   "IfcText/IfcLabel",
@@ -24,8 +25,10 @@ def check_file(file: ifcopenshell.file, modelcheck: Type[tool.Modelcheck],
                modelcheck_window: Type[tool.ModelcheckWindow]):
     modelcheck.connect_to_data_base(modelcheck.get_database_path())
     modelcheck.remove_existing_issues(datetime.today())
+    modelcheck.reset_pset_cache()
 
     modelcheck.build_data_dict(modelcheck_window.get_item_checkstate_dict())
+    modelcheck.compile_checkers()
 
     modelcheck.set_object_checked_count(0)
     modelcheck.set_object_count(modelcheck.get_element_count())
@@ -33,11 +36,15 @@ def check_file(file: ifcopenshell.file, modelcheck: Type[tool.Modelcheck],
 
     entities = file.by_type("IfcElement")
     modelcheck.set_object_count(len(entities))
-    check_entities(entities, modelcheck)
+    if modelcheck.get_process_count() > 1 and modelcheck.get_ifc_path():
+        check_entities_parallel(file, entities, modelcheck)
+    else:
+        check_entities(entities, modelcheck)
 
     for plugin_func in modelcheck.get_file_check_plugins():
         plugin_func(file)
 
+    modelcheck.reset_pset_cache()
     modelcheck.disconnect_from_data_base()
 
     modelcheck.set_status(QCoreApplication.translate("Modelcheck", "Modelcheck Done!"))
@@ -51,6 +58,74 @@ def check_entities(entities: list[ifcopenshell.entity_instance], modelcheck: Typ
         if modelcheck.is_aborted():
             return
         check_element(entity, modelcheck)
+        modelcheck.evict_element_psets(entity)
+
+
+def check_entities_parallel(file: ifcopenshell.file, entities: list[ifcopenshell.entity_instance],
+                            modelcheck: Type[tool.Modelcheck]):
+    """
+    evaluates the entities in worker processes and writes their findings from this thread
+    """
+    modelcheck.set_status(f'{len(entities)} {QCoreApplication.translate("Modelcheck", "Entities will be checked.")}')
+    rule_plan = modelcheck.build_rule_plan()
+    for entity_ids, findings in modelcheck.run_shards(entities, rule_plan):
+        if modelcheck.is_aborted():
+            return
+        for entity_id, name, args in findings:
+            element = file.by_id(entity_id)
+            if element != modelcheck.get_active_element():
+                modelcheck.set_active_element_type(ELEMENT)
+                modelcheck.set_active_element(element)
+            modelcheck.replay_finding(element, name, args)
+        for entity_id in entity_ids:
+            modelcheck.evict_element_psets(file.by_id(entity_id))
+            modelcheck.increment_checked_items()
+
+
+def check_shard(entity_ids: list[int], modelcheck: Type[tool.Modelcheck]) -> list[tuple]:
+    """
+    runs inside a worker process and returns the findings of all entities of the shard
+    """
+    file = modelcheck.get_shard_file()
+    findings = list()
+    for entity_id in entity_ids:
+        element = file.by_id(entity_id)
+        findings += evaluate_element(element, modelcheck)
+        modelcheck.evict_element_psets(element)
+    return findings
+
+
+def evaluate_element(element: ifcopenshell.entity_instance, modelcheck: Type[tool.Modelcheck]) -> list[tuple]:
+    """
+    counterpart of check_element which returns (entity_id, issue_function, args) tuples instead of writing issues
+    """
+    entity_id, guid = element.id(), element.GlobalId
+    rule_plan = modelcheck.get_rule_plan()
+    main_pset_name, main_attribute_name = modelcheck.get_main_pset_name(), modelcheck.get_main_attribute_name()
+    main_attribute_value = modelcheck.get_ident_value(element)
+    main_attribute_value = "" if main_attribute_value is None else main_attribute_value
+    findings = [(entity_id, "db_create_entity", (main_attribute_value,))]
+
+    if not modelcheck.is_pset_existing(element, main_pset_name):
+        findings.append((entity_id, "ident_pset_issue", (guid, main_pset_name)))
+        return findings
+
+    elif not modelcheck.is_attribute_existing(element, main_pset_name, main_attribute_name):
+        findings.append((entity_id, "ident_issue", (guid, main_pset_name, main_attribute_name)))
+        return findings
+
+    if main_attribute_value not in rule_plan["identifiers"]:
+        findings.append((entity_id, "ident_unknown", (guid, main_pset_name, main_attribute_name,
+                                                      main_attribute_value)))
+        return findings
+
+    pset_rules = rule_plan["objects"].get(main_attribute_value)
+    if pset_rules is None:  # Object Type shouldn't be tested
+        return findings
+
+    findings.append((entity_id, ENTITY_CHECK_PLUGINS, ()))
+    findings += modelcheck.evaluate_attribute_rules(element, pset_rules)
+    return findings
 
 
 def check_element(element: ifcopenshell.entity_instance, modelcheck: Type[tool.Modelcheck]):
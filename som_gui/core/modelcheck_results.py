@@ -6,32 +6,48 @@ from typing import Type
 from PySide6.QtCore import QCoreApplication
 
 from som_gui import tool
+from som_gui.module.modelcheck_results.constants import CSV, PARQUET
 
 
 def create_results(data_base_path: os.PathLike | str, results: Type[tool.ModelcheckResults],
                    modelcheck_window: Type[tool.ModelcheckWindow]):
-    _issues = results.query_issues(data_base_path)
-    text = QCoreApplication.translate("Modelcheck", "{} Issues found!").format(len(_issues))
+    issue_count = results.count_issues(data_base_path)
+    text = QCoreApplication.translate("Modelcheck", "{} Issues found!").format(issue_count)
     modelcheck_window.set_status(text)
 
-    if len(_issues) == 0:
+    if issue_count == 0:
         modelcheck_window.set_status(QCoreApplication.translate("Modelcheck", "Model free of errors"))
         return
-    workbook, worksheet = results.create_workbook()
-    last_cell = results.fill_worksheet(_issues, worksheet)
-    results.create_table(worksheet, last_cell)
-    results.autofit_column_width(worksheet)
-    save_workbook(workbook, results)
 
-
-def save_workbook(workbook, results: Type[tool.ModelcheckResults]):
     path = results.get_export_path()
+    export_format = results.get_export_format(path)
+    if export_format == PARQUET and not results.is_parquet_available():
+        export_format, path = CSV, results.get_csv_path(path)
+        text = QCoreApplication.translate("Modelcheck", "pyarrow is not installed, Issues are exported to '{}'")
+        modelcheck_window.set_status(text.format(path))
+    elif export_format not in (CSV, PARQUET) and issue_count >= results.get_max_excel_rows():
+        export_format, path = CSV, results.get_csv_path(path)
+        text = QCoreApplication.translate("Modelcheck", "{} Issues don't fit into Excel, they are exported to '{}'")
+        modelcheck_window.set_status(text.format(issue_count, path))
+
+    if export_format == CSV:
+        save_file(path, lambda: results.write_csv(results.iter_issues(data_base_path), path))
+    elif export_format == PARQUET:
+        save_file(path, lambda: results.write_parquet(results.iter_issues(data_base_path), path))
+    else:
+        workbook, worksheet = results.create_workbook()
+        row_count = results.fill_worksheet(results.iter_issues(data_base_path), worksheet)
+        results.create_table(worksheet, row_count)
+        save_file(path, lambda: workbook.save(path))
+
+
+def save_file(path: str, write_func):
     try:
-        workbook.save(path)
+        write_func()
     except PermissionError:
 
         title = QCoreApplication.translate("Modelcheck", "Excel still open")
         text = QCoreApplication.translate("Modelcheck", "The output file is locked by another process")
         detail = QCoreApplication.translate("Modelcheck", "Path:'{}'\nWarning: file will be overridden!").format(path)
         if tool.Popups.file_in_use_warning(title, text, detail):
-            save_workbook(workbook, results)
+            save_file(path, write_func)
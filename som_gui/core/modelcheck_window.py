@@ -33,7 +33,8 @@ def open_window(modelcheck_window: Type[tool.ModelcheckWindow], util: Type[tool.
     util.fill_main_attribute(window.ui.main_attribute_widget, main_pset_name, main_attribute_name)
 
     util.fill_file_selector(window.ui.widget_import, "IfcPath", "IFC Files (*.ifc *.IFC);;", "modelcheck_files")
-    util.fill_file_selector(window.ui.widget_export, "ExportPfad", "Excel File (*.xlsx);;", "modelcheck_export",
+    util.fill_file_selector(window.ui.widget_export, "ExportPfad",
+                            "Excel File (*.xlsx);;CSV File (*.csv);;Parquet File (*.parquet);;", "modelcheck_export",
                             request_save=True)
     modelcheck_window.connect_buttons()
     modelcheck_window.set_progressbar_visible(False)
@@ -133,6 +134,7 @@ def ifc_import_finished(runner: IfcImportRunner, modelcheck_window: Type[tool.Mo
     modelcheck_window.set_status(QCoreApplication.translate("Modelcheck", "Import Done!"))
 
     modelcheck.set_ifc_name(os.path.basename(runner.path))
+    modelcheck.set_ifc_path(runner.path)
     modelcheck_runner = modelcheck.create_modelcheck_runner(runner.ifc)
 
     modelcheck_window.connect_modelcheck_runner(modelcheck_runner)
@@ -134,9 +134,12 @@ def add_project(project_tool: Type[Project], appdata: Type[tool.Appdata], popups
         return
     p1 = project_tool.get()
     p2 = project_tool.load_project(path)
+    # opening a Project makes it the active one, new items should still be created in the current Project
+    project_tool.set_active_project(p1)
     title = util.get_window_title(QCoreApplication.translate('MergeDialog', 'Merge Project'))
 
     project_tool.merge_projects(title, p1, p2)
+    p2.close()  # merged items were moved into p1, the rest of p2 can be released
 
     logging.warning(f"Import of Buildingstructure is not supported")
 
@@ -4,12 +4,29 @@ from typing import TYPE_CHECKING, Type
 
 if TYPE_CHECKING:
     from som_gui import tool
+    from som_gui.tool.search import SearchRunner
 
 
 def refresh_search_window(search_tool: Type[tool.Search]):
     widget = search_tool.get_dialog()
     threshold = search_tool.get_search_properties().filter_threshold
-    search_tool.refresh_dialog(widget, threshold)
+    runner = search_tool.create_search_runner(widget, threshold)
+    search_tool.connect_search_runner(runner)
+    search_tool.get_thread_pool().start(runner)
+
+
+def search_text_changed(search_tool: Type[tool.Search]):
+    search_tool.restart_search_timer()
+
+
+def search_finished(runner: SearchRunner, search_tool: Type[tool.Search]):
+    if not search_tool.is_latest_search(runner):
+        return
+    search_tool.set_search_results(search_tool.get_dialog(), runner.results)
+
+
+def reset_search_indexes(search_tool: Type[tool.Search]):
+    search_tool.reset_search_indexes()
 
 
 def retranslate_ui(search: Type[tool.Search]):
@@ -2,8 +2,18 @@
 class Appdata:
     def _get_config(self, ): pass
 
+    def _get_mtime(self, ): pass
+
+    def _get_value(self, section, path, default): pass
+
+    def _read_config(self, ): pass
+
+    def _schedule_write(self, ): pass
+
     def _write_config(self, config_parser): pass
 
+    def flush(self, ): pass
+
     def get_bool_setting(self, section, path, default): pass
 
     def get_float_setting(self, section, path, default): pass
@@ -12,6 +22,8 @@ class Appdata:
 
     def get_path(self, value): pass
 
+    def get_properties(self, ): pass
+
     def get_settings_path(self, ): pass
 
     def get_string_setting(self, section, path, default): pass
@@ -314,6 +326,12 @@ class AttributeImportResults:
 
     def set_object_count_label_text(self, text): pass
 
+    def set_progress_bar_text(self, text): pass
+
+    def set_progress_bar_value(self, value): pass
+
+    def set_results_window_busy(self, busy): pass
+
     def unlock_updating(self, ): pass
 
     def update_attribute_table_styling(self, ): pass
@@ -336,42 +354,74 @@ class AttributeImportSQL:
 
     def add_attribute_without_value(self, attribute): pass
 
-    def add_entity(self, entity, main_pset, main_attribute, file_name): pass
+    def add_som_attribute_rows(self, attribute, values): pass
 
     def change_checkstate_of_values(self, ifc_type, identifier, property_set, attribute, value_text, checkstate): pass
 
+    def close_session(self, ): pass
+
+    def commit_session(self, ): pass
+
     def commit_sql(self, ): pass
 
+    def connect_filter_table_runner(self, runner): pass
+
     def connect_to_data_base(self, path): pass
 
     def count_objects(self, ifc_type, identifier): pass
 
+    def create_attribute_rows(self, entity, pset_dict, ifc_file, identifier, existing_object_dict): pass
+
+    def create_entity_row(self, entity, identifier, file_name): pass
+
+    def create_filter_table_runner(self, create_indexes): pass
+
+    def create_indexes(self, ): pass
+
     def create_settings_filter(self, ): pass
 
     def create_settings_window(self, ): pass
 
     def create_som_filter_table(self, ): pass
 
+    def create_summary_tables(self, ): pass
+
     def create_tables(self, ): pass
 
     def disconnect_from_database(self, ): pass
 
     def fill_filter_table(self, project): pass
 
+    def filter_tables_are_building(self, ): pass
+
+    def filter_tables_are_current(self, ): pass
+
     def get_attribute_data(self, attribute): pass
 
     def get_attribute_query(self, ): pass
 
     def get_attributes(self, ifc_type, identifier, property_set): pass
 
+    def get_batch_size(self, ): pass
+
     def get_current_object_filter(self, ): pass
 
     def get_cursor(self, ): pass
 
     def get_database_path(self, ): pass
 
+    def get_datatype_from_dict(self, value_dict, ifc_file): pass
+
     def get_datatype_from_value(self, value): pass
 
+    def get_entity_psets(self, entity): pass
+
+    def get_filter_key(self, ): pass
+
+    def get_filter_table_threadpool(self, ): pass
+
+    def get_identifier(self, pset_dict, main_pset, main_attribute): pass
+
     def get_identifier_types(self, ifc_type, all_keyword): pass
 
     def get_new_attribute_values(self, ): pass
@@ -382,20 +432,34 @@ class AttributeImportSQL:
 
     def get_removed_attribute_values(self, ): pass
 
+    def get_session_cursor(self, ): pass
+
     def get_settings_dialog_checkbox_list(self, dialog): pass
 
     def get_values(self, ifc_type, identifier, property_set, attribute): pass
 
     def get_wanted_ifc_types(self, ): pass
 
-    def import_entity_attributes(self, entity, ifc_file, identifier, existing_object_dict): pass
-
     def init_database(self, db_path): pass
 
+    def insert_attributes(self, rows): pass
+
+    def insert_entities(self, rows): pass
+
+    def open_session(self, ): pass
+
+    def remove_filter_table_runner(self, ): pass
+
     def set_current_object_filter(self, usecases, phases): pass
 
     def set_database_path(self, path): pass
 
+    def set_filter_key(self, filter_key): pass
+
+    def set_progress(self, value): pass
+
+    def set_status(self, text): pass
+
     def settings_dialog_accepted(self, dialog): pass
 
     def update_settins_dialog_checkstates(self, dialog): pass
@@ -676,6 +740,8 @@ class FilterWindow:
 
     def get_active_object(self, ): pass
 
+    def get_model_index(self, item): pass
+
     def get_object_tree(self, ): pass
 
     def get_project_table(self, ): pass
@@ -698,6 +764,8 @@ class FilterWindow:
 
     def set_active_object(self, obj): pass
 
+    def set_model_index(self, item, index): pass
+
     def set_object_label(self, value): pass
 
     def set_settings_widget(self, widget): pass
@@ -760,6 +828,8 @@ class Language:
 
 
 class Logging:
+    def collect_popup_record(self, record, handler): pass
+
     def create_console_handler(self, ): pass
 
     def create_error_popup(self, ): pass
@@ -768,8 +838,14 @@ class Logging:
 
     def create_popup_handler(self, main_window): pass
 
+    def create_queue_handler(self, handlers): pass
+
+    def exec_summary_popup(self, records): pass
+
     def get_custom_formatter(self, ): pass
 
+    def get_handlers(self, ): pass
+
     def get_log_level(self, ): pass
 
     def get_logger(self, ): pass
@@ -780,10 +856,14 @@ class Logging:
 
     def get_properties(self, ): pass
 
+    def get_record_key(self, record): pass
+
     def get_settings_widget(self, ): pass
 
     def get_signaller(self, ): pass
 
+    def schedule_popup(self, ): pass
+
     def set_log_level(self, log_level): pass
 
     def set_logging_directory(self, path, check_if_identical): pass
@@ -792,7 +872,11 @@ class Logging:
 
     def show_exception_popup(self, exctype, value, tb): pass
 
-    def show_popup(self, record, message): pass
+    def show_popup(self, ): pass
+
+    def stop_queue_listener(self, ): pass
+
+    def take_popup_records(self, ): pass
 
 
 class MainWindow:
@@ -910,20 +994,16 @@ class Modelcheck:
 
     def build_ident_dict(self, objects): pass
 
-    def check_datatype(self, value, attribute): pass
+    def build_rule_plan(self, ): pass
 
     def check_for_attributes(self, element, obj): pass
 
-    def check_format(self, value, attribute): pass
-
-    def check_list(self, value, attribute): pass
-
-    def check_range(self, value, attribute): pass
-
     def check_values(self, value, attribute): pass
 
     def commit_sql(self, ): pass
 
+    def compile_checkers(self, ): pass
+
     def connect_to_data_base(self, path): pass
 
     def create_modelcheck_runner(self, ifc_file): pass
@@ -940,6 +1020,14 @@ class Modelcheck:
 
     def entity_should_be_tested(self, entity): pass
 
+    def evaluate_attribute_rules(self, element, pset_rules): pass
+
+    def evaluate_value(self, guid, value, checker, element_type): pass
+
+    def evict_element_psets(self, entity): pass
+
+    def flush_sql_buffer(self, ): pass
+
     def format_issue(self, guid, attribute, value): pass
 
     def get_active_element(self, ): pass
@@ -950,6 +1038,8 @@ class Modelcheck:
 
     def get_attribute_value(self, entity, pset_name, attribute_name): pass
 
+    def get_checker(self, attribute): pass
+
     def get_current_runner(self, ): pass
 
     def get_cursor(self, ): pass
@@ -960,6 +1050,8 @@ class Modelcheck:
 
     def get_element_count(self, ): pass
 
+    def get_element_psets(self, entity): pass
+
     def get_entity_check_plugins(self, ): pass
 
     def get_file_check_plugins(self, ): pass
@@ -972,6 +1064,8 @@ class Modelcheck:
 
     def get_ifc_name(self, ): pass
 
+    def get_ifc_path(self, ): pass
+
     def get_main_attribute_name(self, ): pass
 
     def get_main_pset_name(self, ): pass
@@ -982,8 +1076,16 @@ class Modelcheck:
 
     def get_object_representation(self, entity): pass
 
+    def get_process_count(self, ): pass
+
     def get_properties(self, ): pass
 
+    def get_rule_plan(self, ): pass
+
+    def get_shard_file(self, ): pass
+
+    def get_type_psets(self, element_type): pass
+
     def guid_issue(self, guid, file1, file2): pass
 
     def ident_issue(self, guid, pset_name, attribute_name): pass
@@ -1010,10 +1112,16 @@ class Modelcheck:
 
     def remove_existing_issues(self, creation_date): pass
 
+    def replay_finding(self, element, name, args): pass
+
     def reset_abort(self, ): pass
 
     def reset_guids(self, ): pass
 
+    def reset_pset_cache(self, ): pass
+
+    def run_shards(self, entities, rule_plan): pass
+
     def set_active_element(self, element): pass
 
     def set_active_element_type(self, value): pass
@@ -1026,6 +1134,8 @@ class Modelcheck:
 
     def set_ifc_name(self, value): pass
 
+    def set_ifc_path(self, value): pass
+
     def set_main_attribute_name(self, value): pass
 
     def set_main_pset_name(self, value): pass
@@ -1074,28 +1184,44 @@ class ModelcheckExternal:
 
 
 class ModelcheckResults:
-    def autofit_column_width(self, worksheet): pass
+    def count_issues(self, path): pass
 
-    def create_table(self, worksheet, last_cell): pass
+    def create_table(self, worksheet, row_count): pass
 
     def create_workbook(self, ): pass
 
     def fill_worksheet(self, issues, ws): pass
 
+    def get_column_widths(self, rows): pass
+
+    def get_csv_path(self, path): pass
+
+    def get_export_format(self, path): pass
+
     def get_export_path(self, ): pass
 
     def get_header(self, ): pass
 
-    def get_max_width(self, worksheet): pass
+    def get_max_excel_rows(self, ): pass
 
     def get_properties(self, ): pass
 
+    def is_parquet_available(self, ): pass
+
+    def iter_issues(self, path): pass
+
     def last_modelcheck_finished(self, ): pass
 
     def query_issues(self, path): pass
 
+    def set_column_widths(self, worksheet, widths): pass
+
     def set_export_path(self, value): pass
 
+    def write_csv(self, issues, path): pass
+
+    def write_parquet(self, issues, path): pass
+
 
 class ModelcheckWindow:
     def _update_pset_row(self, item, enabled): pass
@@ -1664,9 +1790,15 @@ class PropertySetWindow:
 
 
 class Search:
-    def activate_item(self, ): pass
+    def activate_item(self, index): pass
 
-    def check_row(self, table, search_text, row, column_count): pass
+    def connect_dialog(self, widget): pass
+
+    def connect_search_runner(self, runner): pass
+
+    def create_search_index(self, rows): pass
+
+    def create_search_runner(self, widget, threshold): pass
 
     def create_table_items(self, ): pass
 
@@ -1676,11 +1808,23 @@ class Search:
 
     def get_dialog(self, ): pass
 
+    def get_search_index(self, rows): pass
+
     def get_search_mode(self, ): pass
 
     def get_search_properties(self, ): pass
 
-    def refresh_dialog(self, widget, threshold): pass
+    def get_thread_pool(self, ): pass
+
+    def is_latest_search(self, runner): pass
+
+    def normalize_text(self, text): pass
+
+    def query_search_index(self, search_index, search_text, threshold, limit): pass
+
+    def reset_search_indexes(self, ): pass
+
+    def restart_search_timer(self, ): pass
 
     def retranslate_title(self, widget, search_mode): pass
 
@@ -1688,6 +1832,8 @@ class Search:
 
     def search_object(self, ): pass
 
+    def set_search_results(self, widget, results): pass
+
 
 class Settings:
     def add_page_to_toolbox(self, widget_function, page_name, accept_function): pass
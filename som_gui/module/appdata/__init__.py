@@ -0,0 +1,21 @@
+import som_gui
+from som_gui import tool
+from . import prop, trigger
+
+
+def register():
+    # the settings are already read while the plugins get imported, so the Properties might exist.
+    # get_properties creates them and registers the flush at exit in one place
+    tool.Appdata.get_properties()
+
+
+def load_ui_triggers():
+    trigger.connect()
+
+
+def on_new_project():
+    trigger.on_new_project()
+
+
+def retranslate_ui():
+    trigger.retranslate_ui()
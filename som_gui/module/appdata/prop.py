@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import threading
+from configparser import ConfigParser
+from dataclasses import dataclass, field
+
+
+@dataclass
+class AppdataProperties:
+    config: ConfigParser | None = None  # in memory copy of config.ini
+    mtime: float | None = None  # mtime of config.ini after the last read or write
+    last_check: float = 0.0  # time.monotonic() of the last mtime check
+    pending: dict[tuple[str, str], str] = field(default_factory=dict)  # (section, option) -> value not written yet
+    write_timer: threading.Timer | None = None
+    lock: threading.RLock = field(default_factory=threading.RLock)
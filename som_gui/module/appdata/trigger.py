@@ -0,0 +1,10 @@
+def connect():
+    pass
+
+
+def on_new_project():
+    pass
+
+
+def retranslate_ui():
+    pass
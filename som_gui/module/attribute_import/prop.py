@@ -11,6 +11,8 @@ if TYPE_CHECKING:
     from PySide6.QtWidgets import QLabel, QProgressBar
     from PySide6.QtGui import QAction
     from sqlite3 import Connection
+    from PySide6.QtCore import QThreadPool
+    from som_gui.tool.attribute_import import FilterTableRunner
 
 
 class AttributeImportProperties:
@@ -38,6 +40,8 @@ class AttributeImportProperties:
 class AttributeImportSQLProperties:
     database_path: str = None
     connection: Connection = None
+    session_connection: Connection = None
+    batch_size: int = 10000
     settings_dialog: SettingsDialog = None
     show_existing_values: bool = False
     show_regex_values: bool = False
@@ -47,3 +51,6 @@ class AttributeImportSQLProperties:
     active_usecases: list[SOMcreator.UseCase] = list()
     active_phases: list[SOMcreator.Phase] = list()
     activate_object_filter = True
+    filter_key: tuple = None  # inputs of the current filter and summary tables
+    filter_table_runner: FilterTableRunner = None
+    thread_pool: QThreadPool = None
@@ -1,9 +1,16 @@
-import ifcopenshell
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from PySide6.QtWidgets import QPushButton
 
 from som_gui import tool
 from som_gui.core import attribute_import as core
 
+if TYPE_CHECKING:
+    import ifcopenshell
+    from som_gui.tool.attribute_import import FilterTableRunner
+
 
 def connect():
     core.create_main_menu_actions(tool.AttributeImport, tool.MainWindow)
@@ -41,7 +48,18 @@ def connect_attribute_import_runner(runner):
 
 
 def last_import_finished():
-    core.last_import_finished(tool.AttributeImport, tool.AttributeImportSQL)
+    core.last_import_finished(tool.AttributeImport, tool.AttributeImportResults, tool.AttributeImportSQL)
+
+
+def connect_filter_table_runner(runner: FilterTableRunner):
+    runner.signaller.finished.connect(
+        lambda: core.filter_tables_built(runner, tool.AttributeImportResults, tool.AttributeImportSQL))
+    runner.signaller.status.connect(tool.AttributeImportResults.set_progress_bar_text)
+    runner.signaller.progress.connect(tool.AttributeImportResults.set_progress_bar_value)
+
+
+def build_filter_tables(runner: FilterTableRunner):
+    core.build_filter_tables(runner, tool.AttributeImportSQL)
 
 
 def start_attribute_import(file: ifcopenshell.file, path: str):
@@ -98,7 +116,7 @@ def all_checkbox_checkstate_changed():
 
 
 def result_abort_clicked():
-    core.results_abort_clicked(tool.AttributeImportResults)
+    core.results_abort_clicked(tool.AttributeImportResults, tool.AttributeImportSQL)
 
 
 def result_acccept_clicked():
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PySide6.QtWidgets import QCheckBox, QComboBox, QDialog, QTableWidget, QWidget
+from PySide6.QtWidgets import QCheckBox, QComboBox, QDialog, QProgressBar, QTableWidget, QWidget
 
 from som_gui.resources.icons import get_icon, get_settings_icon
 from . import trigger
@@ -13,6 +13,9 @@ class AttributeImportResultWindow(QWidget):
         self.ui = ui_Widget.Ui_AttributeImport()
         self.ui.setupUi(self)
         self.ui.button_settings.setIcon(get_settings_icon())
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setVisible(False)
+        self.ui.main_layout.insertWidget(1, self.progress_bar)
         self.setWindowIcon(get_icon())
 
 
@@ -6,6 +6,7 @@ if TYPE_CHECKING:
     from PySide6.QtWidgets import QHBoxLayout, QLabel
     from .ui import ProjectSelectDialog, CompareDialog
     from PySide6.QtGui import QAction
+    import SOMcreator
 
 
 class CompareProjectSelectProperties:
@@ -26,3 +27,4 @@ class CompareWindowProperties:
     window: CompareDialog = None
     export_funcs = list()
     actions: dict[str, QAction] = dict()
+    projects: list[SOMcreator.Project | None] = [None, None]
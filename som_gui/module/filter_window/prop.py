@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtGui import QAction
 
 import SOMcreator
@@ -19,6 +20,8 @@ class FilterWindowProperties:
     active_check_state: Qt.CheckState = None
     settings_widget: ui.SettingsWidget = None
     actions: dict[str, QAction] = dict()
+    model_indexes: WeakKeyDictionary[SOMcreator.Object | SOMcreator.PropertySet | SOMcreator.Attribute, QModelIndex] = \
+        WeakKeyDictionary()
 
 
 class FilterCompareProperties:
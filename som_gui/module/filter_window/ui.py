@@ -332,16 +332,14 @@ class ObjectModel(TreeModel):
                 self.endRemoveRows()
                 return QModelIndex()
             item = self.get_root()[row]
-            item.index = self.createIndex(row, column, item)
-            return item.index
+            return tool.FilterWindow.set_model_index(item, self.createIndex(row, column, item))
 
         node: SOMcreator.Object = parent.internalPointer()
         children = list(node.get_children(filter=False))  # Use get_children() to access children
 
         if 0 <= row < len(children):
             child = children[row]
-            child.index = self.createIndex(row, column, child)
-            return child.index
+            return tool.FilterWindow.set_model_index(child, self.createIndex(row, column, child))
         return QModelIndex()
 
     # Returns the parent index of the given index
@@ -351,7 +349,7 @@ class ObjectModel(TreeModel):
         node: SOMcreator.Object = index.internalPointer()
         if node is None or not node.parent:
             return QModelIndex()
-        parent_index: QModelIndex = node.parent.index
+        parent_index: QModelIndex = tool.FilterWindow.get_model_index(node.parent)
         return parent_index.sibling(parent_index.row(), 0)
 
     # Returns the data to be displayed for each cell
@@ -372,7 +370,7 @@ class PsetModel(TreeModel):
     def flags(self, index: QModelIndex):
         node: SOMcreator.PropertySet | SOMcreator.Attribute = index.internalPointer()
         if isinstance(node, SOMcreator.PropertySet):
-            parent_index = node.object.index
+            parent_index = tool.FilterWindow.get_model_index(node.object)
             parent_index = parent_index.sibling(parent_index.row(), index.column() + 1)
         else:
             parent_index = self.parent(index)
@@ -408,16 +406,14 @@ class PsetModel(TreeModel):
                 self.endRemoveRows()
                 return QModelIndex()
             item: SOMcreator.PropertySet = self.get_property_sets()[row]
-            item.index = self.createIndex(row, column, item)
-            return item.index
+            return tool.FilterWindow.set_model_index(item, self.createIndex(row, column, item))
 
         node: SOMcreator.PropertySet = parent.internalPointer()
         children = list(node.get_attributes(filter=False))  # Use get_children() to access children
 
         if 0 <= row < len(children):
             child = children[row]
-            child.index = self.createIndex(row, column, child)
-            return child.index
+            return tool.FilterWindow.set_model_index(child, self.createIndex(row, column, child))
         return QModelIndex()
 
     # Returns the parent index of the given index
@@ -427,7 +423,7 @@ class PsetModel(TreeModel):
         node: SOMcreator.PropertySet | SOMcreator.Attribute = index.internalPointer()
         if node is None or isinstance(node, SOMcreator.PropertySet):
             return QModelIndex()
-        parent_index: QModelIndex = node.property_set.index
+        parent_index: QModelIndex = tool.FilterWindow.get_model_index(node.property_set)
         return parent_index.sibling(parent_index.row(), 0)
 
     # Returns the data to be displayed for each cell
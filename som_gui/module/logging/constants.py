@@ -1,3 +1,4 @@
 LOG_SECTION = "logging"
 LOG_PATH = "log_path"
 LOG_LEVEL = "log_level"
+POPUP_DELAY = 500  # ms to collect records before the summary popup is shown
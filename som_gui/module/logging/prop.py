@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import threading
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from logging.handlers import QueueListener
     from som_gui.tool.logging import Signaller
     from . import ui
 
@@ -15,3 +17,8 @@ class LoggingProperties:
     ignore_texts = list()
     signaller: Signaller = None
     settings_widget: ui.SettingsWidget = None
+    queue_listener: QueueListener = None
+    # (pathname, funcName, lineno) -> [highest level, count, message of the first record]
+    popup_records: dict[tuple[str, str, int], list] = dict()
+    popup_pending = False  # a summary popup is scheduled or open
+    popup_lock = threading.Lock()
@@ -13,3 +13,8 @@ REPETETIVE_GROUP_ISSUE = 12
 DATATYPE_ISSUE = 13
 
 ISSUE_PATH = "issue_path"
+
+SETTINGS_SECTION = "modelcheck"
+PROCESS_COUNT = "process_count"
+SHARD_SIZE = 2000
+ATTRIBUTE_ISSUES = ("datatype_issue", "format_issue", "list_issue", "range_issue")
@@ -2,9 +2,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import ifcopenshell
-
 if TYPE_CHECKING:
+    import ifcopenshell
     from som_gui.tool.modelcheck import ModelcheckRunner
     from PySide6.QtWidgets import QLabel, QProgressBar
     from sqlite3 import Connection
@@ -16,10 +15,17 @@ class ModelcheckProperties:
     main_attribute_name: str = None
     main_pset_name: str = None
     ifc_name: str = None
+    ifc_path: str = None
+    shard_file: ifcopenshell.file = None
+    rule_plan: dict = dict()
+    rule_attributes: dict = dict()
+    checker_dict: dict = dict()
     ident_dict: dict = dict()
     data_dict: dict = dict()
     active_element: ifcopenshell.entity_instance = None
     active_element_type: str = None
+    pset_cache: dict[int, dict[str, dict]] = dict()
+    type_pset_cache: dict[int, dict[str, dict]] = dict()
     runner: ModelcheckRunner = None
     status_label: QLabel = None
     progress_bar: QProgressBar = None
@@ -29,5 +35,8 @@ class ModelcheckProperties:
     group_parent_dict: dict = dict()
     group_dict: dict = dict()
     connection: Connection = None
+    batch_size: int = 5000
+    entity_buffer: list[tuple] = list()
+    issue_buffer: list[tuple] = list()
     file_check_plugins = list()
     entity_check_plugins = list()
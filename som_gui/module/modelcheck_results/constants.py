@@ -0,0 +1,4 @@
+XLSX = "xlsx"
+CSV = "csv"
+PARQUET = "parquet"
+MAX_EXCEL_ROWS = 1048576
@@ -1,2 +1,4 @@
 class ModelcheckResultProperties:
     excel_export_path: str = None
+    chunk_size: int = 10000
+    width_sample_size: int = 1000
@@ -0,0 +1,2 @@
+SEARCH_DELAY = 150  # ms after the last keystroke until the search starts
+SEARCH_LIMIT = 500  # maximum number of rows shown in the search dialog
@@ -1,7 +1,25 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
 
 from PySide6.QtWidgets import QDialog
 
+if TYPE_CHECKING:
+    from PySide6.QtCore import QThreadPool, QTimer
+
+
+@dataclass
+class SearchIndex:
+    """
+    Flat arrays of the normalized search texts. Every text is stored once and sorted by length,
+    so a query only scores the length window that can reach the threshold
+    """
+    rows: list[tuple[Any, list[str]]]  # (data, display texts) for each table row
+    texts: list[str]  # normalized unique texts sorted by length
+    lengths: list[int]
+    text_rows: list[tuple[int, ...]]  # rows that contain the text
+
 
 @dataclass
 class SearchProperties():
@@ -9,3 +27,7 @@ class SearchProperties():
     filter_threshold: int = 65
     search_mode = 1  # 1 = Object 2= Attribute
     selected_info = None
+    search_indexes: dict[int, SearchIndex] = field(default_factory=dict)  # search_mode -> SearchIndex
+    search_timer: QTimer = None
+    thread_pool: QThreadPool = None
+    search_id: int = 0  # id of the latest started search; results of older searches are dropped
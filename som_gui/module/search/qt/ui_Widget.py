@@ -16,8 +16,8 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
                            QImage, QKeySequence, QLinearGradient, QPainter,
                            QPalette, QPixmap, QRadialGradient, QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDialog, QGridLayout,
-                               QHeaderView, QLineEdit, QSizePolicy, QTableWidget,
-                               QTableWidgetItem, QWidget)
+                               QHeaderView, QLineEdit, QSizePolicy, QTableView,
+                               QWidget)
 
 class Ui_Search(object):
     def setupUi(self, Search):
@@ -31,19 +31,19 @@ class Ui_Search(object):
 
         self.gridLayout.addWidget(self.lineEdit, 0, 0, 1, 1)
 
-        self.tableWidget = QTableWidget(Search)
-        self.tableWidget.setObjectName(u"tableWidget")
+        self.tableView = QTableView(Search)
+        self.tableView.setObjectName(u"tableView")
         sizePolicy = QSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.tableWidget.sizePolicy().hasHeightForWidth())
-        self.tableWidget.setSizePolicy(sizePolicy)
-        self.tableWidget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
-        self.tableWidget.setSortingEnabled(True)
-        self.tableWidget.horizontalHeader().setStretchLastSection(True)
-        self.tableWidget.verticalHeader().setVisible(False)
-
-        self.gridLayout.addWidget(self.tableWidget, 1, 0, 1, 1)
+        sizePolicy.setHeightForWidth(self.tableView.sizePolicy().hasHeightForWidth())
+        self.tableView.setSizePolicy(sizePolicy)
+        self.tableView.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.tableView.setSortingEnabled(True)
+        self.tableView.horizontalHeader().setStretchLastSection(True)
+        self.tableView.verticalHeader().setVisible(False)
+
+        self.gridLayout.addWidget(self.tableView, 1, 0, 1, 1)
 
         self.retranslateUi(Search)
 
@@ -1,18 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from som_gui import tool
 from som_gui.core import search as core
 
+if TYPE_CHECKING:
+    from som_gui.tool.search import SearchRunner
+
 
 def connect():
     pass
 
 
 def on_new_project():
-    pass
+    core.reset_search_indexes(tool.Search)
 
 
 def refresh_window():
     core.refresh_search_window(tool.Search)
 
 
+def search_text_changed():
+    core.search_text_changed(tool.Search)
+
+
+def search_finished(runner: SearchRunner):
+    core.search_finished(runner, tool.Search)
+
+
 def retranslate_ui():
     core.retranslate_ui(tool.Search)
@@ -1,9 +1,17 @@
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PySide6.QtWidgets import QDialog
 
-from som_gui.module.search import trigger
+from som_gui.module.project.constants import CLASS_REFERENCE
 from som_gui.resources.icons import get_icon
 from .qt import ui_Widget
 
+if TYPE_CHECKING:
+    from .prop import SearchIndex
+
 
 class SearchWindow(QDialog):
     def __init__(self):
@@ -12,6 +20,57 @@ class SearchWindow(QDialog):
         self.ui.setupUi(self)
         self.setWindowIcon(get_icon())
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        trigger.refresh_window()
+
+class SearchModel(QAbstractTableModel):
+    """
+    shows the best rows of the last search. The last column holds the score
+    """
+
+    def __init__(self, search_index: SearchIndex, column_texts: list[str]):
+        super().__init__()
+        self.search_index = search_index
+        self.column_texts = column_texts
+        self.results: list[tuple[int, int]] = list()  # (row in SearchIndex, score)
+
+    def set_results(self, results: list[tuple[int, int]]):
+        self.beginResetModel()
+        self.results = results
+        self.endResetModel()
+
+    def get_data(self, row: int) -> Any:
+        return self.search_index.rows[self.results[row][0]][0]
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.column_texts) + 1
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        index_row, score = self.results[index.row()]
+        if role == CLASS_REFERENCE:
+            return self.search_index.rows[index_row][0]
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if index.column() == len(self.column_texts):
+            return score
+        return self.search_index.rows[index_row][1][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        if section < len(self.column_texts):
+            return self.column_texts[section]
+        return None
+
+    def sort(self, column: int, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or not self.results:
+            return
+        reverse = order == Qt.SortOrder.DescendingOrder
+        if column == len(self.column_texts):
+            key = lambda result: result[1]
+        else:
+            key = lambda result: self.search_index.rows[result[0]][1][column].lower()
+        self.layoutAboutToBeChanged.emit()
+        self.results.sort(key=key, reverse=reverse)
+        self.layoutChanged.emit()
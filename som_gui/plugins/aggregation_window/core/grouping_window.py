@@ -5,7 +5,6 @@ import os
 import time
 from typing import TYPE_CHECKING, Type
 
-import ifcopenshell
 from PySide6.QtCore import QCoreApplication
 from PySide6.QtWidgets import QDialogButtonBox
 
@@ -15,6 +14,7 @@ from .. import tool as aw_tool
 from ..module.grouping_window.constants import GROUP_ATTRIBUTE, GROUP_PSET, IFC_MOD
 
 if TYPE_CHECKING:
+    import ifcopenshell
     from som_gui.tool.ifc_importer import IfcImportRunner
 
 
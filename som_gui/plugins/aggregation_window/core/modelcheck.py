@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Type
+from typing import TYPE_CHECKING, Type
 
-import ifcopenshell
 from PySide6.QtCore import QCoreApplication
 
 import SOMcreator
@@ -11,6 +10,9 @@ from som_gui import tool
 from som_gui.core.modelcheck import ELEMENT, GROUP
 from som_gui.plugins.aggregation_window import tool as aw_tool
 
+if TYPE_CHECKING:
+    import ifcopenshell
+
 
 def add_modelcheck_plugin(modelcheck: Type[tool.Modelcheck], modelcheck_plugin: Type[aw_tool.Modelcheck]):
     modelcheck.add_file_check_plugin(lambda file: check_file(file, modelcheck, modelcheck_plugin))
@@ -46,11 +48,13 @@ def check_group(group_entity: ifcopenshell.entity_instance, layer_index, modelch
                 modelcheck_plugin: Type[aw_tool.Modelcheck]):
     modelcheck.increment_checked_items()
     if not modelcheck.entity_should_be_tested(group_entity):
+        modelcheck.evict_element_psets(group_entity)
         return
 
     if group_entity.is_a("IfcElement"):
         modelcheck.set_active_element_type(ELEMENT)
         check_correct_parent(group_entity, modelcheck, modelcheck_plugin)
+        modelcheck.evict_element_psets(group_entity)
         return
     else:
         modelcheck.set_active_element_type(GROUP)
@@ -60,6 +64,7 @@ def check_group(group_entity: ifcopenshell.entity_instance, layer_index, modelch
         check_collector_group(group_entity, modelcheck, modelcheck_plugin)
     else:
         check_group_entity(group_entity, modelcheck, modelcheck_plugin)
+    modelcheck.evict_element_psets(group_entity)
 
     sub_groups = modelcheck_plugin.get_sub_entities(group_entity)
     if not sub_groups:
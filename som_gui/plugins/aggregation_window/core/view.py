@@ -6,6 +6,7 @@ from PySide6.QtCore import QCoreApplication, QPoint, QPointF, Qt
 
 import SOMcreator
 from SOMcreator import value_constants
+from SOMcreator.datastructure.aggregation import AGGREGATION_REMOVED
 from som_gui import tool
 
 if TYPE_CHECKING:
@@ -27,7 +28,11 @@ def key_press_event(event: QKeyEvent, view: Type[aw_tool.View], connection: Type
 
 
 def import_pos_from_project(view: Type[aw_tool.View], project: Type[tool.Project]) -> None:
-    view.import_aggregations_from_project(project.get())
+    proj = project.get()
+    for scene in view.get_all_scenes():
+        view.remove_nodes_with_deleted_aggregations(scene, proj)
+    view.connect_project(proj)
+    view.import_aggregations_from_project(proj)
 
 
 def paint_event(view: Type[aw_tool.View], node: Type[aw_tool.Node], connection: Type[aw_tool.Connection],
@@ -39,37 +44,67 @@ def paint_event(view: Type[aw_tool.View], node: Type[aw_tool.Node], connection:
     scene_id = view.get_scene_index(scene)
 
     # Add Nodes from import_list
+    new_nodes = list()
     for aggregation, position in view.get_import_list()[scene_id]:
         new_node = node.create_node(aggregation)
         view.add_node_to_scene(new_node, scene)
         node.set_node_pos(new_node, position)
+        new_nodes.append((new_node, scene))
     view.clean_import_list_of_scene(scene)
 
-    # delete Nodes with deleted Aggregations
-    view.remove_nodes_with_deleted_aggregations(scene, project.get())
-
-    # create connections
-    node_dict = {node.aggregation: node for node in view.get_nodes_in_scene(scene)}
-    for aggregation, top_node in node_dict.items():
-        for sub_aggregation in aggregation.get_children(filter=True):
-            sub_node = node_dict.get(sub_aggregation)
-            if sub_node is None:
+    # apply the changes of Aggregations since the last paint event
+    changed_nodes = list()
+    for aggregation, change in view.pop_aggregation_changes().items():
+        for changed_scene in view.get_all_scenes():
+            changed_node = view.get_node_by_aggregation(changed_scene, aggregation)
+            if changed_node is None:
                 continue
-            if not node.is_node_connected_to_node(top_node, sub_node):
-                new_connection = connection.create_connection(top_node, sub_node,
-                                                              sub_node.aggregation.parent_connection)
-                view.add_connection_to_scene(new_connection, scene)
+            if change == AGGREGATION_REMOVED:
+                view.remove_node_from_scene(changed_node, changed_scene)
+            else:
+                changed_nodes.append((changed_node, changed_scene))
+
+    # a filter change can activate children of any Node
+    if view.pop_filter_outdated(scene):
+        changed_nodes += [(scene_node, scene) for scene_node in view.get_nodes_in_scene(scene)]
 
-        if not top_node.top_connection:
+    for changed_node, changed_scene in new_nodes + changed_nodes:
+        if changed_node.scene() is None:  # removed by an earlier change
             continue
-        if aggregation.parent_connection != top_node.top_connection.connection_type:
-            top_node.top_connection.connection_type = aggregation.parent_connection
-            top_node.top_connection.update()
+        update_connections_of_node(changed_node, changed_scene, view, node, connection)
 
     if not view.scene_was_alleady_focused(scene):
         view.autofit_view()
 
 
+def update_connections_of_node(changed_node: node_ui.NodeProxy, scene, view: Type[aw_tool.View],
+                               node: Type[aw_tool.Node], connection: Type[aw_tool.Connection]) -> None:
+    aggregation = changed_node.aggregation
+
+    # connection to the parent Node
+    top_connection = changed_node.top_connection
+    parent_node = view.get_node_by_aggregation(scene, aggregation.parent) if aggregation.parent else None
+    if top_connection is not None and top_connection.top_node is not parent_node:
+        view.remove_connection_from_scene(top_connection, scene)
+        top_connection = None
+    if top_connection is None and parent_node is not None and aggregation.is_active():
+        top_connection = connection.create_connection(parent_node, changed_node, aggregation.parent_connection)
+        view.add_connection_to_scene(top_connection, scene)
+    if top_connection is not None and aggregation.parent_connection != top_connection.connection_type:
+        top_connection.connection_type = aggregation.parent_connection
+        top_connection.update()
+
+    # connections to the child Nodes
+    for sub_aggregation in aggregation.get_children(filter=True):
+        sub_node = view.get_node_by_aggregation(scene, sub_aggregation)
+        if sub_node is None or node.is_node_connected_to_node(changed_node, sub_node):
+            continue
+        if sub_node.top_connection is not None:
+            view.remove_connection_from_scene(sub_node.top_connection, scene)
+        new_connection = connection.create_connection(changed_node, sub_node, sub_aggregation.parent_connection)
+        view.add_connection_to_scene(new_connection, scene)
+
+
 def mouse_move_event(position: QPoint, view: Type[aw_tool.View], node: Type[aw_tool.Node],
                      connection: Type[aw_tool.Connection], ):
     last_pos = view.get_last_mouse_pos()
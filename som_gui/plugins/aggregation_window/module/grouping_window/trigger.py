@@ -1,10 +1,16 @@
-import ifcopenshell
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from PySide6.QtWidgets import QPushButton
 
 from som_gui import tool
 from ... import tool as aw_tool
 from ...core import grouping_window as core
 
+if TYPE_CHECKING:
+    import ifcopenshell
+
 
 def connect():
     core.create_main_menu_actions(aw_tool.GroupingWindow, tool.MainWindow)
@@ -19,11 +19,14 @@ class ViewProperties:
     scene_name_list: list[str] = list()
     scene_list: list[AggregationScene] = list()
     node_list: list[set[NodeProxy]] = list()
+    node_index_list: list[dict[str, NodeProxy]] = list()  # uuid of Aggregation -> Node for each scene
+    aggregation_changes: dict[Aggregation, str] = dict()  # changes since the last paint event
     import_list: list[list[tuple[Aggregation, QPointF]]] = list()
     connections_list: list[set[Connection]] = list()
     scene_settings_list: list[
         tuple[QTransform, float, float] | None] = list()  # (Transform, Horizontal Scroll, Vertical Scroll)
     focus_list: list[bool] = list()  # list for scenes which autofocussed at least once
+    filter_outdated_list: list[bool] = list()  # scenes whose connections need a reconcile after a filter change
     last_mouse_pos: QPointF = None
     mouse_mode: int = 0
     resize_node: NodeProxy | None = None
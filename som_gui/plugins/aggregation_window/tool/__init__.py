@@ -1,7 +1,39 @@
-from .aggregation import Aggregation
-from .connection import Connection
-from .grouping_window import GroupingWindow
-from .modelcheck import Modelcheck
-from .node import Node
-from .view import View
-from .window import Window
+"""
+Tools are imported on first access, see som_gui.tool
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aggregation import Aggregation
+    from .connection import Connection
+    from .grouping_window import GroupingWindow
+    from .modelcheck import Modelcheck
+    from .node import Node
+    from .view import View
+    from .window import Window
+
+TOOL_MODULES = {
+    "Aggregation": "aggregation",
+    "Connection": "connection",
+    "GroupingWindow": "grouping_window",
+    "Modelcheck": "modelcheck",
+    "Node": "node",
+    "View": "view",
+    "Window": "window",
+}
+
+
+def __getattr__(name: str):
+    module_name = TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(TOOL_MODULES))
@@ -11,7 +11,6 @@ from som_gui.plugins.aggregation_window.module.aggregation import ui as ui_aggre
 from som_gui.plugins.aggregation_window.module.aggregation.prop import AggregationProperties
 
 ABBREV_ISSUE = 2
-from SOMcreator.exporter.desite import building_structure
 from PySide6.QtGui import QAction
 from PySide6.QtCore import QCoreApplication
 
@@ -31,6 +30,7 @@ class Aggregation(som_gui.plugins.aggregation_window.core.tool.Aggregation):
 
     @classmethod
     def export_building_structure(cls, project: SOMcreator.Project, path):
+        from SOMcreator.exporter.desite import building_structure  # lxml is loaded with the export
         building_structure.export_bs(project, path)
 
     @classmethod
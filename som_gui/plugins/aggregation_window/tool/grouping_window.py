@@ -4,7 +4,6 @@ import logging
 import os
 from typing import Iterator, TYPE_CHECKING
 
-import ifcopenshell
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QDialogButtonBox
@@ -17,12 +16,11 @@ from ..module.grouping_window import ui as grouping_ui
 from ..module.grouping_window.constants import GROUP_ATTRIBUTE, GROUP_FOLDER, GROUP_PSET, IFC_MOD
 
 if TYPE_CHECKING:
+    import ifcopenshell
     from ..module.grouping_window.prop import GroupingWindowProperties
     from som_gui.module.ifc_importer.ui import IfcImportWidget
     from som_gui.tool.ifc_importer import IfcImportRunner
 from som_gui import tool
-from SOMcreator.util.group_ifc import GROUP, get_ifc_el_info, ELEMENT, IFC_REP, fill_existing_groups, \
-    create_aggregation_structure
 
 
 class Signaller(QObject):
@@ -200,6 +198,7 @@ class GroupingWindow(som_gui.plugins.aggregation_window.core.tool.GroupingWindow
     def create_structure_dict(cls, ifc_elements: list[ifcopenshell.entity_instance],
                               project: SOMcreator.Project) -> dict:
         """Iterate over all Entities, build the targeted Datastructure"""
+        from SOMcreator.util.group_ifc import ELEMENT, GROUP, IFC_REP, get_ifc_el_info
 
         targeted_group_structure = {GROUP: {}, ELEMENT: {}, IFC_REP: None}
         bk_dict = {obj.ident_value: obj for obj in project.get_objects(filter=True)}
@@ -238,6 +237,7 @@ class GroupingWindow(som_gui.plugins.aggregation_window.core.tool.GroupingWindow
 
     @classmethod
     def fill_existing_groups(cls, ifc_file: ifcopenshell.file, structure_dict):
+        from SOMcreator.util.group_ifc import fill_existing_groups
         fill_existing_groups(ifc_file, structure_dict, cls.get_attribute_bundle())
 
     @classmethod
@@ -253,6 +253,7 @@ class GroupingWindow(som_gui.plugins.aggregation_window.core.tool.GroupingWindow
     @classmethod
     def create_new_grouping_strictures(cls, ifc_file, structure_dict, owner_history,
                                        objects_list: Iterator[SOMcreator.Object]):
+        from SOMcreator.util.group_ifc import create_aggregation_structure
         attribute_bundle = cls.get_attribute_bundle()
         kuerzel_dict = {obj.abbreviation.upper(): obj for obj in objects_list}
         create_empty = cls.get_properties().create_empty_attribues
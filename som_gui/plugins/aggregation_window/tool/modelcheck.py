@@ -1,7 +1,8 @@
-import ifcopenshell
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from PySide6.QtCore import QCoreApplication
-from ifcopenshell import entity_instance
-from ifcopenshell.util import element as ifc_el
 
 import SOMcreator
 import som_gui.plugins.aggregation_window.core.tool
@@ -10,6 +11,10 @@ from som_gui import tool
 from som_gui.module.modelcheck.constants import *
 from som_gui.plugins.aggregation_window.module.modelcheck.prop import AggregationModelcheckProperties
 
+if TYPE_CHECKING:
+    import ifcopenshell
+    from ifcopenshell import entity_instance
+
 ABBREV_ISSUE = 2
 
 
@@ -112,7 +117,7 @@ class Modelcheck(som_gui.plugins.aggregation_window.core.tool.Modelcheck):
         main_pset_name = tool.Modelcheck.get_main_pset_name()
         main_attribute_name = tool.Modelcheck.get_main_attribute_name()
         element_type = tool.Modelcheck.get_active_element_type()
-        ident_value = ifc_el.get_pset(parent_element, main_pset_name, main_attribute_name)
+        ident_value = tool.Modelcheck.get_ident_value(parent_element, main_pset_name, main_attribute_name)
 
         description = QCoreApplication.translate("Aggregation", "{}: Parent '{}' is not allowed").format(element_type,
                                                                                                          ident_value)
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import QApplication, QFileDialog, QGraphicsView
 
 import SOMcreator
 from SOMcreator.datastructure.som_json import NODES
+from SOMcreator.datastructure.aggregation import AGGREGATION_REMOVED
 from som_gui.plugins.aggregation_window.module.view.constants import AGGREGATIONSCENES, SCENE_SIZE, SCENE_MARGIN
 from som_gui.plugins.aggregation_window.module.node import ui as ui_node
 from som_gui.plugins.aggregation_window import tool as aw_tool
@@ -102,9 +103,11 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         prop.scene_name_list.append(scene_name)
         prop.scene_list.append(scene)
         prop.node_list.append(set())
+        prop.node_index_list.append(dict())
         prop.import_list.append(list())
         prop.connections_list.append(set())
         prop.focus_list.append(False)
+        prop.filter_outdated_list.append(False)
         prop.scene_settings_list.append(None)
         return scene, scene_name
 
@@ -116,8 +119,8 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         scene_index = cls.get_scene_index(scene)
         prop = cls.get_properties()
         scene = prop.scene_list[scene_index]
-        lists = [prop.scene_name_list, prop.node_list, prop.import_list, prop.connections_list, prop.focus_list,
-                 prop.scene_settings_list, prop.scene_list]
+        lists = [prop.scene_name_list, prop.node_list, prop.node_index_list, prop.import_list, prop.connections_list,
+                 prop.focus_list, prop.filter_outdated_list, prop.scene_settings_list, prop.scene_list]
         [scene_list.pop(scene_index) for scene_list in lists]
         scene.deleteLater()
 
@@ -127,7 +130,6 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         if not plugin_dict:
             return
 
-        aggregation_ref = {aggregation.uuid: aggregation for aggregation in proj.get_aggregations(filter=False)}
         import_scene_dict = plugin_dict.get(AGGREGATIONSCENES)
 
         if import_scene_dict is None:
@@ -154,7 +156,7 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
             for aggregation_uuid, pos in node_dict["Nodes"].items():
                 x = SCENE_SIZE[0] / 2 + pos[0] - x_min
                 y = SCENE_SIZE[1] / 2 + pos[1] - y_min
-                aggregation_tuple = (aggregation_ref[aggregation_uuid], QPointF(x, y))
+                aggregation_tuple = (proj.get_element_by_uuid(aggregation_uuid), QPointF(x, y))
                 cls.get_properties().import_list[scene_id].append(aggregation_tuple)
 
     @classmethod
@@ -204,6 +206,7 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         scene.addItem(node.circle)
         scene_index = cls.get_scene_index(scene)
         cls.get_properties().node_list[scene_index].add(node)
+        cls.get_properties().node_index_list[scene_index][node.aggregation.uuid] = node
 
     @classmethod
     def clean_import_list_of_scene(cls, scene: ui_view.AggregationScene) -> None:
@@ -243,13 +246,17 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         scene_index = cls.get_scene_index(scene)
         prop = cls.get_properties()
         prop.node_list[scene_index].remove(node)
+        node_index = prop.node_index_list[scene_index]
+        if node_index.get(node.aggregation.uuid) is node:
+            node_index.pop(node.aggregation.uuid)
         scene.removeItem(node.header)
         scene.removeItem(node.frame)
         scene.removeItem(node.resize_rect)
         scene.removeItem(node.circle)
         scene.removeItem(node)
         node.deleteLater()
-        if node.aggregation in node.aggregation.project.get_aggregations(filter=False):
+        proj = node.aggregation.project
+        if proj is not None and proj.get_element_by_uuid(node.aggregation.uuid) is node.aggregation:
             node.aggregation.delete()
 
     @classmethod
@@ -507,11 +514,58 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
     @classmethod
     def remove_nodes_with_deleted_aggregations(cls, scene: ui_view.AggregationScene, proj: SOMcreator.Project) -> None:
         nodes = cls.get_nodes_in_scene(scene)
-        existing_aggregations = list(proj.get_aggregations(filter=False))
+        existing_aggregations = set(proj.get_aggregations(filter=False))
         for existing_node in list(nodes):
             if existing_node.aggregation not in existing_aggregations:
                 cls.remove_node_from_scene(existing_node, scene)
 
+    @classmethod
+    def get_node_by_aggregation(cls, scene: ui_view.AggregationScene,
+                                aggregation: SOMcreator.Aggregation) -> ui_node.NodeProxy | None:
+        scene_index = cls.get_scene_index(scene)
+        node = cls.get_properties().node_index_list[scene_index].get(aggregation.uuid)
+        if node is None or node.aggregation is not aggregation:
+            return None
+        return node
+
+    @classmethod
+    def connect_project(cls, proj: SOMcreator.Project) -> None:
+        """
+        Changes of Aggregations are queued and applied to the scenes by the next paint event
+        """
+        cls.get_properties().aggregation_changes = dict()
+        proj.add_aggregation_listener(cls.queue_aggregation_change)
+        proj.add_filter_listener(cls.queue_filter_change)
+
+    @classmethod
+    def queue_aggregation_change(cls, change: str, aggregation: SOMcreator.Aggregation) -> None:
+        changes = cls.get_properties().aggregation_changes
+        if changes.get(aggregation) != AGGREGATION_REMOVED:
+            changes[aggregation] = change
+
+    @classmethod
+    def queue_filter_change(cls) -> None:
+        """
+        a filter change emits no Aggregation changes, so every scene gets reconciled once by its next paint event
+        """
+        prop = cls.get_properties()
+        prop.filter_outdated_list = [True for _ in prop.filter_outdated_list]
+
+    @classmethod
+    def pop_filter_outdated(cls, scene: ui_view.AggregationScene) -> bool:
+        scene_index = cls.get_scene_index(scene)
+        prop = cls.get_properties()
+        is_outdated = prop.filter_outdated_list[scene_index]
+        prop.filter_outdated_list[scene_index] = False
+        return is_outdated
+
+    @classmethod
+    def pop_aggregation_changes(cls) -> dict[SOMcreator.Aggregation, str]:
+        prop = cls.get_properties()
+        changes = prop.aggregation_changes
+        prop.aggregation_changes = dict()
+        return changes
+
     @classmethod
     def create_child_node(cls, top_node: ui_node.NodeProxy,
                           obj: SOMcreator.Object) -> ui_node.NodeProxy | None:
@@ -1 +1,27 @@
-from .move import Move
+"""
+Tools are imported on first access, see som_gui.tool
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .move import Move
+
+TOOL_MODULES = {
+    "Move": "move",
+}
+
+
+def __getattr__(name: str):
+    module_name = TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(TOOL_MODULES))
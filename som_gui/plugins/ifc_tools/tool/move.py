@@ -4,7 +4,6 @@ import logging
 import os
 from typing import TYPE_CHECKING
 
-import ifcopenshell
 from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction
 
@@ -12,6 +11,7 @@ import som_gui
 from som_gui.plugins.ifc_tools.module.move import trigger, ui
 
 if TYPE_CHECKING:
+    import ifcopenshell
     from som_gui.plugins.ifc_tools.module.move.prop import MoveProperties
     from som_gui.tool.ifc_importer import IfcImportRunner
 
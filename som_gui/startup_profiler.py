@@ -0,0 +1,95 @@
+"""
+Measures the startup of som_gui. It is activated by the environment variable SOM_GUI_PROFILE_STARTUP:
+
+    SOM_GUI_PROFILE_STARTUP=1          prints the import, register and load_ui_triggers time of every module
+                                       and the time until the main window is painted the first time
+    SOM_GUI_PROFILE_STARTUP=benchmark  prints the same report and quits after the first paint (cold start benchmark)
+
+The report is written to stderr, because the logging module isn't set up while the modules are imported.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
+
+PROFILE_ENV = "SOM_GUI_PROFILE_STARTUP"
+BENCHMARK = "benchmark"
+REPORT_LIMIT = 15  # slowest entries per step
+
+_mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+_start = time.perf_counter()
+_records: list[tuple[str, str, float, list[str]]] = list()  # (step, name, duration, loaded packages)
+_paint_filter = None
+
+
+def is_active() -> bool:
+    return _mode not in ("", "0", "false")
+
+
+@contextmanager
+def measure(step: str, name: str):
+    """
+    records the duration of the block and the third party packages which were imported inside of it
+    """
+    if not is_active():
+        yield
+        return
+    known_modules = set(sys.modules)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        packages = {n.split(".")[0] for n in sys.modules.keys() - known_modules}
+        packages -= {"som_gui", "SOMcreator", *getattr(sys, "stdlib_module_names", ())}
+        packages = {p for p in packages if not p.startswith("_")}
+        _records.append((step, name, duration, sorted(packages)))
+
+
+def watch_first_paint(window: QWidget) -> None:
+    """
+    prints the report as soon as the window is painted the first time
+    """
+    global _paint_filter
+    if not is_active():
+        return
+    from PySide6.QtCore import QEvent, QObject
+
+    class PaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint:
+                watched.removeEventFilter(self)
+                _first_paint()
+            return False
+
+    _paint_filter = PaintFilter()
+    window.installEventFilter(_paint_filter)
+
+
+def _first_paint() -> None:
+    from PySide6.QtCore import QCoreApplication, QTimer
+    print_report(time.perf_counter() - _start)
+    if _mode == BENCHMARK:
+        # exit() leaves the event loop without closing the windows, so no save prompt blocks the benchmark
+        QTimer.singleShot(0, lambda: QCoreApplication.exit(0))
+
+
+def print_report(first_paint: float | None = None) -> None:
+    lines = [f"som_gui startup profile ({len(_records)} measurements)"]
+    steps = list(dict.fromkeys(record[0] for record in _records))
+    for step in steps:
+        records = [r for r in _records if r[0] == step]
+        total = sum(r[2] for r in records)
+        lines.append(f"{step}: {total * 1000:.1f} ms")
+        for _, name, duration, packages in sorted(records, key=lambda r: r[2], reverse=True)[:REPORT_LIMIT]:
+            loaded = f"  loaded: {', '.join(packages)}" if packages else ""
+            lines.append(f"    {duration * 1000:8.1f} ms  {name}{loaded}")
+    if first_paint is not None:
+        lines.append(f"first paint after {first_paint * 1000:.1f} ms (measured from 'import som_gui')")
+    print("\n".join(lines), file=sys.stderr)
@@ -1,28 +1,87 @@
-from som_gui.tool.appdata import Appdata
-from som_gui.tool.attribute import Attribute, AttributeCompare
-from som_gui.tool.attribute_import import AttributeImport, AttributeImportResults, AttributeImportSQL
-from som_gui.tool.attribute_table import AttributeTable
-from som_gui.tool.bsdd import Bsdd
-from som_gui.tool.compare import CompareProjectSelector, CompareWindow
-from som_gui.tool.console import Console
-from som_gui.tool.exports import Exports
-from som_gui.tool.filter_window import FilterCompare, FilterWindow
-from som_gui.tool.ifc_importer import IfcImporter
-from som_gui.tool.language import Language
-from som_gui.tool.logging import Logging
-from som_gui.tool.main_window import MainWindow
-from som_gui.tool.mapping import Mapping
-from som_gui.tool.modelcheck import Modelcheck
-from som_gui.tool.modelcheck_external import ModelcheckExternal
-from som_gui.tool.modelcheck_results import ModelcheckResults
-from som_gui.tool.modelcheck_window import ModelcheckWindow
-from som_gui.tool.object import Object
-from som_gui.tool.plugins import Plugins
-from som_gui.tool.popups import Popups
-from som_gui.tool.predefined_property_set import PredefinedPropertySet, PredefinedPropertySetCompare
-from som_gui.tool.project import Project
-from som_gui.tool.property_set import PropertySet
-from som_gui.tool.property_set_window import PropertySetWindow
-from som_gui.tool.search import Search
-from som_gui.tool.settings import Settings
-from som_gui.tool.util import Util
+"""
+Tools are imported on first access, so modules like ifcopenshell or openpyxl are only loaded if a tool needs them
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from som_gui.tool.appdata import Appdata
+    from som_gui.tool.attribute import Attribute, AttributeCompare
+    from som_gui.tool.attribute_import import AttributeImport, AttributeImportResults, AttributeImportSQL
+    from som_gui.tool.attribute_table import AttributeTable
+    from som_gui.tool.bsdd import Bsdd
+    from som_gui.tool.compare import CompareProjectSelector, CompareWindow
+    from som_gui.tool.console import Console
+    from som_gui.tool.exports import Exports
+    from som_gui.tool.filter_window import FilterCompare, FilterWindow
+    from som_gui.tool.ifc_importer import IfcImporter
+    from som_gui.tool.language import Language
+    from som_gui.tool.logging import Logging
+    from som_gui.tool.main_window import MainWindow
+    from som_gui.tool.mapping import Mapping
+    from som_gui.tool.modelcheck import Modelcheck
+    from som_gui.tool.modelcheck_external import ModelcheckExternal
+    from som_gui.tool.modelcheck_results import ModelcheckResults
+    from som_gui.tool.modelcheck_window import ModelcheckWindow
+    from som_gui.tool.object import Object
+    from som_gui.tool.plugins import Plugins
+    from som_gui.tool.popups import Popups
+    from som_gui.tool.predefined_property_set import PredefinedPropertySet, PredefinedPropertySetCompare
+    from som_gui.tool.project import Project
+    from som_gui.tool.property_set import PropertySet
+    from som_gui.tool.property_set_window import PropertySetWindow
+    from som_gui.tool.search import Search
+    from som_gui.tool.settings import Settings
+    from som_gui.tool.util import Util
+
+TOOL_MODULES = {
+    "Appdata": "appdata",
+    "Attribute": "attribute",
+    "AttributeCompare": "attribute",
+    "AttributeImport": "attribute_import",
+    "AttributeImportResults": "attribute_import",
+    "AttributeImportSQL": "attribute_import",
+    "AttributeTable": "attribute_table",
+    "Bsdd": "bsdd",
+    "CompareProjectSelector": "compare",
+    "CompareWindow": "compare",
+    "Console": "console",
+    "Exports": "exports",
+    "FilterCompare": "filter_window",
+    "FilterWindow": "filter_window",
+    "IfcImporter": "ifc_importer",
+    "Language": "language",
+    "Logging": "logging",
+    "MainWindow": "main_window",
+    "Mapping": "mapping",
+    "Modelcheck": "modelcheck",
+    "ModelcheckExternal": "modelcheck_external",
+    "ModelcheckResults": "modelcheck_results",
+    "ModelcheckWindow": "modelcheck_window",
+    "Object": "object",
+    "Plugins": "plugins",
+    "Popups": "popups",
+    "PredefinedPropertySet": "predefined_property_set",
+    "PredefinedPropertySetCompare": "predefined_property_set",
+    "Project": "project",
+    "PropertySet": "property_set",
+    "PropertySetWindow": "property_set_window",
+    "Search": "search",
+    "Settings": "settings",
+    "Util": "util",
+}
+
+
+def __getattr__(name: str):
+    module_name = TOOL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    tool = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(TOOL_MODULES))
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import tempfile
+import threading
+import time
 from configparser import ConfigParser
 
 import appdirs
@@ -9,13 +13,24 @@ import appdirs
 import som_gui
 import som_gui.core.tool
 from som_gui import tool
+from som_gui.module.appdata.prop import AppdataProperties
 from som_gui.module.util.constants import PATH_SEPERATOR
 
 PATHS_SECTION = "paths"
+WRITE_DELAY = 1.0  # seconds between a changed setting and writing config.ini
+CHECK_INTERVAL = 2.0  # seconds between checks of config.ini for external edits
 
 
 class Appdata(som_gui.core.tool.Appdata):
 
+    @classmethod
+    def get_properties(cls) -> AppdataProperties:
+        # settings are read while the plugins are imported, before the modules are registered
+        if not hasattr(som_gui, "AppdataProperties"):
+            som_gui.AppdataProperties = AppdataProperties()
+            atexit.register(cls.flush)
+        return som_gui.AppdataProperties
+
     @classmethod
     def get_path(cls, value: str) -> str | list | set:
         logging.info(f"Appdata Path '{value}' requested")
@@ -34,71 +49,167 @@ class Appdata(som_gui.core.tool.Appdata):
 
     @classmethod
     def set_setting(cls, section: str, path: str, value):
-        config_parser = cls._get_config()
-        if not config_parser.has_section(section):
-            config_parser.add_section(section)
-        config_parser.set(section, path, str(value))
-        cls._write_config(config_parser)
+        value = str(value)
+        prop = cls.get_properties()
+        with prop.lock:
+            config_parser = cls._get_config()
+            if config_parser.has_option(section, path) and config_parser.get(section, path, raw=True) == value:
+                return
+            if not config_parser.has_section(section):
+                config_parser.add_section(section)
+            config_parser.set(section, path, value)
+            prop.pending[(section, path)] = value
+            cls._schedule_write()
 
     @classmethod
     def get_settings_path(cls):
         return os.path.join(appdirs.user_config_dir(som_gui.__name__), "config.ini")
 
     @classmethod
-    def _write_config(cls, config_parser) -> None:
-        with open(cls.get_settings_path(), "w") as f:
-            config_parser.write(f)
+    def _schedule_write(cls) -> None:
+        """
+        changes are collected for WRITE_DELAY seconds and written at once
+        """
+        prop = cls.get_properties()
+        if prop.write_timer is not None:
+            return
+        prop.write_timer = threading.Timer(WRITE_DELAY, cls.flush)
+        prop.write_timer.daemon = True
+        prop.write_timer.start()
 
     @classmethod
-    def _get_config(cls, ) -> ConfigParser:
-        config = ConfigParser()
+    def flush(cls) -> None:
+        """
+        writes pending changes to config.ini
+        """
+        prop = cls.get_properties()
+        with prop.lock:
+            if prop.write_timer is not None:
+                prop.write_timer.cancel()
+                prop.write_timer = None
+            if not prop.pending:
+                return
+            if prop.config is None or cls._get_mtime() != prop.mtime:
+                cls._read_config()  # keeps external edits of config.ini
+            cls._write_config(prop.config)
+            prop.pending = dict()
+
+    @classmethod
+    def _write_config(cls, config_parser) -> None:
+        """
+        writes into a temporary file which replaces config.ini, so an interrupted write can't corrupt the settings
+        """
+        prop = cls.get_properties()
         config_path = cls.get_settings_path()
         parent_folder = os.path.dirname(config_path)
         if not os.path.exists(parent_folder):
             tool.Util.create_directory(parent_folder)
-            return config
-        if not os.path.exists(config_path):
-            return config
-        with open(config_path, "r") as f:
-            config.read_file(f)
-        return config
+        file_descriptor, temp_path = tempfile.mkstemp(dir=parent_folder, prefix="config", suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as f:
+                config_parser.write(f)
+            os.replace(temp_path, config_path)
+        except OSError:
+            logging.exception(f"Settings could not be written to '{config_path}'")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        prop.mtime = os.stat(config_path).st_mtime
+        prop.last_check = time.monotonic()
 
     @classmethod
-    def get_bool_setting(cls, section: str, path: str, default=False) -> bool:
+    def _get_config(cls, ) -> ConfigParser:
+        """
+        returns the cached settings. config.ini is read again if it was edited by someone else
+        """
+        prop = cls.get_properties()
+        with prop.lock:
+            if prop.config is None:
+                cls._read_config()
+            elif time.monotonic() - prop.last_check > CHECK_INTERVAL:
+                prop.last_check = time.monotonic()
+                if cls._get_mtime() != prop.mtime:
+                    logging.info("config.ini was changed externally -> reload settings")
+                    cls._read_config()
+            return prop.config
+
+    @classmethod
+    def _get_mtime(cls) -> float | None:
+        try:
+            return os.stat(cls.get_settings_path()).st_mtime
+        except OSError:
+            return None
+
+    @classmethod
+    def _read_config(cls) -> None:
+        """
+        reads config.ini into the cache. Changes which are not written yet are kept
+        """
+        prop = cls.get_properties()
+        config = ConfigParser()
+        config_path = cls.get_settings_path()
+        prop.mtime = cls._get_mtime()
+        prop.last_check = time.monotonic()
+        if prop.mtime is not None:
+            with open(config_path, "r") as f:
+                config.read_file(f)
+        for (section, path), value in prop.pending.items():
+            if not config.has_section(section):
+                config.add_section(section)
+            config.set(section, path, value)
+        prop.config = config
+
+    @classmethod
+    def _get_value(cls, section: str, path: str, default) -> str | None:
+        """
+        returns the stored text of the setting. A missing setting is stored with its default and None is returned
+        """
         config_parser = cls._get_config()
         if config_parser.has_option(section, path):
-            path = config_parser.get(section, path)
-            if path is not None:
-                return eval(path)
+            return config_parser.get(section, path)
         cls.set_setting(section, path, default)
-        return default
+        return None
+
+    @classmethod
+    def get_bool_setting(cls, section: str, path: str, default=False) -> bool:
+        value = cls._get_value(section, path, default)
+        if value is None:
+            return default
+        state = ConfigParser.BOOLEAN_STATES.get(value.strip().lower())
+        if state is None:
+            logging.warning(f"Setting '{section}/{path}' is no bool: '{value}'")
+            return default
+        return state
 
     @classmethod
     def get_string_setting(cls, section: str, path: str, default="") -> str:
-        config_parser = cls._get_config()
-        if config_parser.has_option(section, path):
-            value = config_parser.get(section, path)
-            if value is not None:
-                return value
-        cls.set_setting(section, path, default)
-        return default
+        value = cls._get_value(section, path, default)
+        if value is None:
+            return default
+        return value
 
     @classmethod
     def get_int_setting(cls, section: str, path: str, default=0) -> int:
-        config_parser = cls._get_config()
-        if config_parser.has_option(section, path):
-            path = config_parser.get(section, path)
-            if path is not None:
-                return eval(path)
-        cls.set_setting(section, path, default)
-        return default
+        value = cls._get_value(section, path, default)
+        if value is None:
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            pass
+        try:
+            return int(float(value))
+        except ValueError:
+            logging.warning(f"Setting '{section}/{path}' is no int: '{value}'")
+            return default
 
     @classmethod
     def get_float_setting(cls, section: str, path: str, default=0) -> float:
-        config_parser = cls._get_config()
-        if config_parser.has_option(section, path):
-            path = config_parser.get(section, path)
-            if path is not None:
-                return eval(path)
-        cls.set_setting(section, path, default)
-        return default
+        value = cls._get_value(section, path, default)
+        if value is None:
+            return default
+        try:
+            return float(value)
+        except ValueError:
+            logging.warning(f"Setting '{section}/{path}' is no float: '{value}'")
+            return default
@@ -858,7 +858,7 @@ class AttributeCompare(som_gui.core.tool.AttributeCompare):
     def get_uuid_dict(cls, index=1) -> dict:
         if cls.get_properties().uuid_dicts[index] is None:
             project = cls.get_project(index)
-            d = {hi.uuid: hi for hi in project.get_hirarchy_items(filter=False)}
+            d = project.get_uuid_dict()
             cls.get_properties().uuid_dicts[index] = d
         return cls.get_properties().uuid_dicts[index]
 
@@ -866,7 +866,7 @@ class AttributeCompare(som_gui.core.tool.AttributeCompare):
     def get_ident_dict(cls, index=1) -> dict:
         if cls.get_properties().ident_dicts[index] is None:
             project = cls.get_project(index)
-            d = {obj.ident_value: obj for obj in project.get_objects(filter=False)}
+            d = project.get_ident_dict()
             cls.get_properties().ident_dicts[index] = d
         return cls.get_properties().ident_dicts[index]
 
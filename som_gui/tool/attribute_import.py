@@ -3,11 +3,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-import ifcopenshell
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
 from PySide6.QtGui import QAction, QBrush, QPalette
 from PySide6.QtWidgets import QCheckBox, QComboBox, QTableWidget, QTableWidgetItem
-from ifcopenshell.util import element as ifc_element_util
 
 import SOMcreator
 import som_gui
@@ -16,6 +14,7 @@ from som_gui import tool
 from som_gui.module.attribute_import import trigger, ui
 
 if TYPE_CHECKING:
+    import ifcopenshell
     from som_gui.module.attribute_import.prop import AttributeImportProperties, AttributeImportSQLProperties
     from som_gui.module.ifc_importer.ui import IfcImportWidget
     from som_gui.tool.ifc_importer import IfcImportRunner
@@ -34,6 +33,23 @@ class AttributeImportRunner(QRunnable):
         self.signaller.finished.emit()
 
 
+class FilterTableRunner(QRunnable):
+    def __init__(self, database_path: str, filter_key: tuple, create_indexes: bool):
+        super().__init__()
+        self.database_path = database_path
+        self.filter_key = filter_key
+        self.create_indexes = create_indexes
+        self.tables_created = False
+        self.signaller = Signaller()
+
+    def run(self):
+        try:
+            trigger.build_filter_tables(self)
+            self.tables_created = True
+        finally:
+            self.signaller.finished.emit()
+
+
 class Signaller(QObject):
     finished = Signal()
     status = Signal(str)
@@ -144,6 +160,31 @@ class AttributeImportResults(som_gui.core.tool.AttributeImport):
 
         return prop.result_window
 
+    @classmethod
+    def set_results_window_busy(cls, busy: bool):
+        """
+        locks the results window while the filter tables are rebuilt, because its queries read these tables
+        """
+        window = cls.get_results_window()
+        if window is None:
+            return
+        widget = window.ui
+        for child in (widget.combo_box_ifc_type, widget.combo_box_identifier, widget.splitter_tables,
+                      widget.button_settings, widget.buttonBox):
+            child.setDisabled(busy)
+        window.progress_bar.setValue(0)
+        window.progress_bar.setVisible(busy)
+
+    @classmethod
+    def set_progress_bar_value(cls, value: int):
+        if cls.get_results_window() is not None:
+            cls.get_results_window().progress_bar.setValue(value)
+
+    @classmethod
+    def set_progress_bar_text(cls, text: str):
+        if cls.get_results_window() is not None:
+            cls.get_results_window().progress_bar.setFormat(f"{text} %p%")
+
     @classmethod
     def update_results_window(cls):
         trigger.update_ifc_type_combobox()
@@ -536,6 +577,59 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
     def get_current_object_filter(cls) -> tuple[list[SOMcreator.UseCase], list[SOMcreator.Phase]]:
         return cls.get_properties().active_usecases, cls.get_properties().active_phases
 
+    @classmethod
+    def get_filter_key(cls) -> tuple:
+        """
+        all inputs of the filter and summary tables. The tables are only rebuilt if the key changes
+        """
+        prop = cls.get_properties()
+        usecases, phases = cls.get_current_object_filter()
+        return (prop.database_path, prop.activate_object_filter, tuple(u.name for u in usecases),
+                tuple(p.name for p in phases), prop.show_regex_values, prop.show_range_values,
+                prop.show_existing_values, prop.show_boolean_values)
+
+    @classmethod
+    def set_filter_key(cls, filter_key: tuple | None) -> None:
+        cls.get_properties().filter_key = filter_key
+
+    @classmethod
+    def filter_tables_are_current(cls) -> bool:
+        return cls.get_properties().filter_key == cls.get_filter_key()
+
+    @classmethod
+    def create_filter_table_runner(cls, create_indexes: bool) -> FilterTableRunner:
+        runner = FilterTableRunner(cls.get_database_path(), cls.get_filter_key(), create_indexes)
+        cls.get_properties().filter_table_runner = runner
+        return runner
+
+    @classmethod
+    def connect_filter_table_runner(cls, runner: FilterTableRunner) -> None:
+        trigger.connect_filter_table_runner(runner)
+
+    @classmethod
+    def remove_filter_table_runner(cls) -> None:
+        cls.get_properties().filter_table_runner = None
+
+    @classmethod
+    def filter_tables_are_building(cls) -> bool:
+        return cls.get_properties().filter_table_runner is not None
+
+    @classmethod
+    def get_filter_table_threadpool(cls) -> QThreadPool:
+        if cls.get_properties().thread_pool is None:
+            tp = QThreadPool()
+            cls.get_properties().thread_pool = tp
+            tp.setMaxThreadCount(1)
+        return cls.get_properties().thread_pool
+
+    @classmethod
+    def set_status(cls, text: str):
+        cls.get_properties().filter_table_runner.signaller.status.emit(text)
+
+    @classmethod
+    def set_progress(cls, value: int):
+        cls.get_properties().filter_table_runner.signaller.progress.emit(value)
+
     @classmethod
     def set_database_path(cls, path: str) -> None:
         cls.get_properties().database_path = path
@@ -562,6 +656,58 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
             return
         con.commit()
 
+    @classmethod
+    def open_session(cls):
+        """
+        opens the long-lived connection used by the results window
+        """
+        prop = cls.get_properties()
+        if prop.session_connection is not None:
+            return
+        prop.session_connection = sqlite3.connect(prop.database_path)
+        prop.session_connection.execute("PRAGMA temp_store=MEMORY")
+
+    @classmethod
+    def close_session(cls):
+        prop = cls.get_properties()
+        if prop.session_connection is None:
+            return
+        prop.session_connection.commit()
+        prop.session_connection.close()
+        prop.session_connection = None
+
+    @classmethod
+    def get_session_cursor(cls):
+        cls.open_session()
+        return cls.get_properties().session_connection.cursor()
+
+    @classmethod
+    def commit_session(cls):
+        con = cls.get_properties().session_connection
+        if con is None:
+            return
+        con.commit()
+
+    @classmethod
+    def create_indexes(cls):
+        """
+        covering indexes for the results window queries. Created once after all files are imported,
+        so the inserts don't have to maintain them
+        """
+        cursor = cls.get_cursor()
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_identifier ON entities (identifier, ifc_type, GUID)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_entities_guid ON entities (GUID, identifier, ifc_type)")
+        cls.set_progress(30)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_attributes_guid
+            ON attributes (GUID, PropertySet, Attribut, Value, Checked, IsDefined, DataType)''')
+        cls.set_progress(70)
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_som_attributes_identifier ON som_attributes (identifier, PropertySet, Attribut)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_attribute_filter_guid ON attribute_filter (AttributeGUID)")
+        cursor.execute("ANALYZE")
+        cls.commit_sql()
+
     @classmethod
     def create_tables(cls):
         cursor = cls.get_cursor()
@@ -599,42 +745,28 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
     @classmethod
     def fill_filter_table(cls, project: SOMcreator.Project):
-        def add_table_entry(entity: SOMcreator.UseCase | SOMcreator.Phase):
-            cursor = cls.get_cursor()
-            text = f'''
-                                  INSERT INTO filter_list (name,description,filter_type)
-                                        VALUES
-                                        ('{entity.name}','{entity.description}','{entity.filter_type}')
-                                  '''
-            cursor.execute(text)
-            cls.commit_sql()
-
-        for usecase in project.get_usecases():
-            add_table_entry(usecase)
-        for phase in project.get_phases():
-            add_table_entry(phase)
+        rows = [(entity.name, entity.description, entity.filter_type) for entity in
+                list(project.get_usecases()) + list(project.get_phases())]
+        cursor = cls.get_cursor()
+        cursor.executemany("INSERT INTO filter_list (name,description,filter_type) VALUES (?,?,?)", rows)
 
     @classmethod
     def add_attribute_to_filter_table(cls, project: SOMcreator.Project, attribute: SOMcreator.Attribute):
         use_case_list = project.get_usecases()
         phase_list = project.get_phases()
-        cursor = cls.get_cursor()
-
+        rows = list()
         for use_case in use_case_list:
             for phase in phase_list:
                 state = attribute.get_filter_state(phase, use_case)
                 state = 1 if state is None else int(state)
-                text = f'''
-                    INSERT INTO attribute_filter (usecase,phase,AttributeGUID,Value)
-                    VALUES
-                    ('{use_case.name}','{phase.name}','{attribute.uuid}',{state})
-                        '''
-                cursor.execute(text)
-        cls.commit_sql()
+                rows.append((use_case.name, phase.name, attribute.uuid, state))
+        cursor = cls.get_cursor()
+        cursor.executemany("INSERT INTO attribute_filter (usecase,phase,AttributeGUID,Value) VALUES (?,?,?,?)", rows)
 
     @classmethod
     def init_database(cls, db_path: str):
         cls.set_database_path(db_path)
+        cls.set_filter_key(None)
         logging.info(f"Database: {db_path}")
 
         cls.connect_to_data_base(db_path)
@@ -652,58 +784,54 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
     @classmethod
     def add_attribute_without_value(cls, attribute: SOMcreator.Attribute):
-        cursor = cls.get_cursor()
-        identifier, propertyset, attribute_name, valuetype, datatype = cls.get_attribute_data(attribute)
-        text = f'''
-                      INSERT INTO som_attributes (identifier,PropertySet,Attribut,Value,ValueType,DataType,GUID)
-                            VALUES
-                            ('{identifier}','{propertyset}','{attribute_name}','','{valuetype}','{datatype}','{attribute.uuid}')
-                      '''
-        cursor.execute(text)
-        cls.commit_sql()
+        cls.add_som_attribute_rows(attribute, [""])
 
     @classmethod
     def add_attribute_with_value(cls, attribute: SOMcreator.Attribute):
-        cursor = cls.get_cursor()
-        identifier, propertyset, attribute_name, valuetype, datatype = cls.get_attribute_data(attribute)
-        for value in attribute.value:
-            text = f'''
-                          INSERT INTO som_attributes (identifier,PropertySet,Attribut,Value,ValueType,DataType,GUID)
-                                VALUES
-                                ('{identifier}','{propertyset}','{attribute_name}','{value}','{valuetype}','{datatype}','{attribute.uuid}')
-                                  '''
-            cursor.execute(text)
-            cls.commit_sql()
+        cls.add_som_attribute_rows(attribute, attribute.value)
 
     @classmethod
-    def add_entity(cls, entity: ifcopenshell.entity_instance, main_pset: str, main_attribute: str, file_name):
+    def add_som_attribute_rows(cls, attribute: SOMcreator.Attribute, values: list):
+        identifier, propertyset, attribute_name, valuetype, datatype = cls.get_attribute_data(attribute)
+        rows = [(str(identifier), propertyset, attribute_name, str(value), valuetype, datatype, attribute.uuid)
+                for value in values]
         cursor = cls.get_cursor()
-        identifier = ifc_element_util.get_pset(entity, main_pset, main_attribute) or ""
-        entity_guid = entity.GlobalId
-        entity_guid_zw = tool.Util.transform_guid(entity_guid, True)
+        cursor.executemany('''
+                      INSERT INTO som_attributes (identifier,PropertySet,Attribut,Value,ValueType,DataType,GUID)
+                            VALUES (?,?,?,?,?,?,?)
+                      ''', rows)
 
-        text = f'''
-          INSERT INTO entities (GUID_ZWC,GUID,Name,ifc_type,datei,identifier)
-                VALUES
-                ('{entity_guid_zw}','{entity_guid}','{entity.Name}','{entity.is_a()}','{file_name}','{identifier}')
-                  '''
+    @classmethod
+    def get_batch_size(cls) -> int:
+        return cls.get_properties().batch_size
 
-        try:
-            cursor.execute(text)
-        except sqlite3.IntegrityError:
-            logging.warning(f"GUID '{entity_guid}' exists for multiple Entities! ")
-        cls.commit_sql()
-        return identifier
+    @classmethod
+    def get_entity_psets(cls, entity: ifcopenshell.entity_instance) -> dict:
+        from ifcopenshell.util import element as ifc_element_util  # ifcopenshell is loaded by the ifc import
+        return ifc_element_util.get_psets(entity, verbose=True)
 
     @classmethod
-    def import_entity_attributes(cls, entity: ifcopenshell.entity_instance, ifc_file: ifcopenshell.file,
-                                 identifier, existing_object_dict):
+    def get_identifier(cls, pset_dict: dict, main_pset: str, main_attribute: str):
+        """
+        reads the identifier from the verbose pset dict, so the psets of an entity are only collected once
+        """
+        value_dict = pset_dict.get(main_pset, dict()).get(main_attribute)
+        if not isinstance(value_dict, dict):
+            return ""
+        return value_dict.get("value") or ""
 
-        cursor = cls.get_cursor()
-        pset_dict = ifc_element_util.get_psets(entity, verbose=True)
+    @classmethod
+    def create_entity_row(cls, entity: ifcopenshell.entity_instance, identifier, file_name) -> tuple:
         entity_guid = entity.GlobalId
         entity_guid_zw = tool.Util.transform_guid(entity_guid, True)
+        return entity_guid_zw, entity_guid, str(entity.Name), entity.is_a(), file_name, str(identifier)
 
+    @classmethod
+    def create_attribute_rows(cls, entity: ifcopenshell.entity_instance, pset_dict: dict, ifc_file: ifcopenshell.file,
+                              identifier, existing_object_dict) -> list[tuple]:
+        entity_guid = entity.GlobalId
+        entity_guid_zw = tool.Util.transform_guid(entity_guid, True)
+        rows = list()
         existing_pset_dict = existing_object_dict.get(identifier)
         for property_set_name, attribute_dict in pset_dict.items():
             existing_attribute_dict = existing_pset_dict.get(property_set_name) if existing_pset_dict else None
@@ -711,12 +839,10 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
                 if not isinstance(value_dict, dict):
                     continue
-                value = value_dict.get("value")
-
-                value_id = value_dict.get("id")
-                data_type = cls.get_datatype_from_value(ifc_file.by_id(value_id))
+                data_type = cls.get_datatype_from_dict(value_dict, ifc_file)
                 if data_type is None:
                     continue
+                value = value_dict.get("value")
 
                 if existing_attribute_dict is None:
                     checkstate = 0
@@ -725,18 +851,42 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
                 else:
                     checkstate = 1 if value in existing_attribute_dict[attribute_name].value else 0
 
-                if not value:
-                    value = 'NULL'
-                else:
-                    value = str(value).replace("'", "''")
-                    value = f"'{value}'"
-                text = f'''
-                 INSERT INTO attributes (GUID_ZWC,GUID,PropertySet,Attribut,Value,DataType,Checked,IsDefined)
-                VALUES
-                ('{entity_guid_zw}','{entity_guid}','{property_set_name}','{attribute_name}',{value},'{data_type}',{checkstate},{checkstate})
-                '''
-                cursor.execute(text)
-        cls.commit_sql()
+                value = str(value) if value else None
+                rows.append((entity_guid_zw, entity_guid, property_set_name, attribute_name, value, data_type,
+                             checkstate, checkstate))
+        return rows
+
+    @classmethod
+    def insert_entities(cls, rows: list[tuple]):
+        cursor = cls.get_cursor()
+        cursor.executemany('''
+          INSERT OR IGNORE INTO entities (GUID_ZWC,GUID,Name,ifc_type,datei,identifier)
+                VALUES (?,?,?,?,?,?)
+                  ''', rows)
+        if cursor.rowcount < len(rows):
+            logging.warning(f"{len(rows) - cursor.rowcount} GUIDs exist for multiple Entities! ")
+
+    @classmethod
+    def insert_attributes(cls, rows: list[tuple]):
+        cursor = cls.get_cursor()
+        cursor.executemany('''
+         INSERT INTO attributes (GUID_ZWC,GUID,PropertySet,Attribut,Value,DataType,Checked,IsDefined)
+                VALUES (?,?,?,?,?,?,?,?)
+                ''', rows)
+
+    @classmethod
+    def get_datatype_from_dict(cls, value_dict: dict, ifc_file: ifcopenshell.file) -> str | None:
+        """
+        newer ifcopenshell versions add the type of a single value to the verbose pset dict,
+        older ones need a lookup of the property entity
+        """
+        if "value_type" not in value_dict:
+            return cls.get_datatype_from_value(ifc_file.by_id(value_dict.get("id")))
+        if value_dict.get("class") != "IfcPropertySingleValue":
+            return None
+        if value_dict["value_type"] is None:
+            logging.info(f"#{value_dict.get('id')} has undefined Value")
+        return value_dict["value_type"]
 
     @classmethod
     def get_datatype_from_value(cls, value: ifcopenshell.entity_instance):
@@ -762,7 +912,6 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
     @classmethod
     def create_som_filter_table(cls) -> str:
 
-        cls.connect_to_data_base(cls.get_database_path())
         cursor = cls.get_cursor()
         cursor.execute("DROP TABLE IF EXISTS filtered_som_attributes;")
         prop = cls.get_properties()
@@ -789,7 +938,10 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
         logging.debug(sql_query)
         cursor.execute(sql_query)
-        cls.disconnect_from_database()
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_filtered_som_attributes
+            ON filtered_som_attributes (identifier, PropertySet, Attribut)''')
+        cls.commit_sql()
         return sql_query
 
     @classmethod
@@ -797,15 +949,15 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
         query = """
                 FROM attributes a
                 JOIN entities e ON e.guid = a.guid
-                JOIN filtered_som_attributes sa ON sa.identifier = e.identifier and a.PropertySet = sa.PropertySet and a.Attribut = sa.Attribut
+                JOIN (SELECT DISTINCT identifier, PropertySet, Attribut FROM filtered_som_attributes) sa
+                    ON sa.identifier = e.identifier and a.PropertySet = sa.PropertySet and a.Attribut = sa.Attribut
             """
         return query
 
     @classmethod
     def get_wanted_ifc_types(cls):
         logging.debug("request IfcTypes")
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
         cursor.execute('''
                 SELECT DISTINCT e.ifc_type
                 FROM entities e
@@ -813,7 +965,6 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
             ''')
         ifc_type_list = cursor.fetchall()
         ifc_type_list = [item[0] for item in ifc_type_list]
-        cls.disconnect_from_database()
         logging.debug("request IfcTypes Done")
 
         return ifc_type_list
@@ -821,8 +972,7 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
     @classmethod
     def get_identifier_types(cls, ifc_type: str, all_keyword: str) -> list[str]:
         logging.debug("Request Identifier")
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
 
         ifc_type_filter = "" if ifc_type == all_keyword else f"AND ifc_type IS '{ifc_type}'"
         sql_query = f'''
@@ -834,34 +984,84 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
         identifier_list = cursor.fetchall()
         identifier_list = [item[0] for item in identifier_list]
 
-        cls.disconnect_from_database()
         logging.debug("Request Identifier Done")
 
         return identifier_list
 
     @classmethod
-    def get_property_sets(cls, ifc_type: str, identifier: str | SOMcreator.Object) -> list[
-        tuple[str, int]]:
-        logging.debug("Request PropertySets")
-
-        cls.connect_to_data_base(cls.get_database_path())
+    def create_summary_tables(cls):
+        """
+        Materializes the counts shown in the results window for the current filter settings.
+        Entities belong to exactly one (ifc_type, identifier) group, so summing the per group counts
+        gives the same numbers as counting distinct GUIDs over the raw tables
+        """
+        logging.debug("Create Summary Tables")
         cursor = cls.get_cursor()
         attribute_query = cls.get_attribute_query()
         filter_query = cls.create_settings_filter()
-        sql_query = f'''
-            SELECT DISTINCT a.propertyset, COUNT(DISTINCT a.GUID)
+        for table in ("object_summary", "property_set_summary", "attribute_summary", "value_summary"):
+            cursor.execute(f"DROP TABLE IF EXISTS {table};")
+
+        cursor.execute('''
+            CREATE TABLE object_summary AS
+            SELECT e.ifc_type, e.identifier, COUNT(DISTINCT e.GUID) AS entity_count
+            FROM entities e
+            JOIN attributes a ON a.guid = e.guid
+            GROUP BY e.ifc_type, e.identifier;
+            ''')
+        cls.set_progress(10)
+        cursor.execute(f'''
+            CREATE TABLE property_set_summary AS
+            SELECT e.ifc_type, e.identifier, a.PropertySet, COUNT(DISTINCT a.GUID) AS entity_count
             {attribute_query}
-            WHERE e.identifier {identifier}
-            AND e.ifc_type {ifc_type}
-            AND a.Value iS NOT NULL
-        
+            WHERE a.Value IS NOT NULL
             {filter_query}
-            GROUP BY a.propertyset;
+            GROUP BY e.ifc_type, e.identifier, a.PropertySet;
+            ''')
+        cls.set_progress(40)
+        cursor.execute(f'''
+            CREATE TABLE attribute_summary AS
+            SELECT e.ifc_type, e.identifier, a.PropertySet, a.Attribut, COUNT(DISTINCT e.GUID) AS entity_count
+            {attribute_query}
+            WHERE a.Value IS NOT NULL
+            {filter_query}
+            GROUP BY e.ifc_type, e.identifier, a.PropertySet, a.Attribut;
+            ''')
+        cls.set_progress(70)
+        cursor.execute(f'''
+            CREATE TABLE value_summary AS
+            SELECT e.ifc_type, e.identifier, a.PropertySet, a.Attribut, a.Value,
+                COUNT(DISTINCT e.GUID) AS entity_count, COUNT(*) AS row_count, SUM(a.Checked) AS checked_count
+            {attribute_query}
+            WHERE a.Value IS NOT NULL
+            {filter_query}
+            GROUP BY e.ifc_type, e.identifier, a.PropertySet, a.Attribut, a.Value;
+            ''')
+        cls.set_progress(95)
+        cursor.execute("CREATE INDEX idx_property_set_summary ON property_set_summary (identifier, ifc_type)")
+        cursor.execute(
+            "CREATE INDEX idx_attribute_summary ON attribute_summary (PropertySet, identifier, ifc_type, Attribut)")
+        cursor.execute(
+            "CREATE INDEX idx_value_summary ON value_summary (PropertySet, Attribut, identifier, ifc_type, Value)")
+        cls.commit_sql()
+        logging.debug("Create Summary Tables Done")
+
+    @classmethod
+    def get_property_sets(cls, ifc_type: str, identifier: str | SOMcreator.Object) -> list[
+        tuple[str, int]]:
+        logging.debug("Request PropertySets")
+
+        cursor = cls.get_session_cursor()
+        sql_query = f'''
+            SELECT s.PropertySet, SUM(s.entity_count)
+            FROM property_set_summary s
+            WHERE s.identifier {identifier}
+            AND s.ifc_type {ifc_type}
+            GROUP BY s.PropertySet;
             '''
         logging.debug(f"get property_sets: \n{sql_query}")
         cursor.execute(sql_query)
         pset_list = cursor.fetchall()
-        cls.disconnect_from_database()
         logging.debug("Request PropertySets Done")
 
         return pset_list
@@ -871,24 +1071,24 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
             list[tuple[str, int, int]]:
         logging.debug("Request Attributes")
 
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
-        attribute_query = cls.get_attribute_query()
-        filter_query = cls.create_settings_filter()
+        cursor = cls.get_session_cursor()
         sql_query = f'''
-            SELECT  DISTINCT a.Attribut, COUNT(DISTINCT e.GUID),COUNT(DISTINCT a.Value)
-            {attribute_query}
-            WHERE e.identifier {identifier}
-            AND e.ifc_type {ifc_type}
-            AND a.PropertySet {property_set}
-            AND a.Value iS NOT NULL
-            {filter_query}
-            GROUP BY a.Attribut ;
+            SELECT s.Attribut, SUM(s.entity_count), (
+                SELECT COUNT(DISTINCT v.Value)
+                FROM value_summary v
+                WHERE v.PropertySet {property_set}
+                AND v.Attribut = s.Attribut
+                AND v.identifier {identifier}
+                AND v.ifc_type {ifc_type})
+            FROM attribute_summary s
+            WHERE s.identifier {identifier}
+            AND s.ifc_type {ifc_type}
+            AND s.PropertySet {property_set}
+            GROUP BY s.Attribut ;
             '''
         logging.debug(f"get Attributes: \n{sql_query}")
         cursor.execute(sql_query)
         attribute_list = cursor.fetchall()
-        cls.disconnect_from_database()
         logging.debug("Request Done")
 
         return attribute_list
@@ -897,20 +1097,16 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
     def get_values(cls, ifc_type, identifier, property_set, attribute):
         logging.debug("Request Values")
 
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
-        filter_query = cls.create_settings_filter()
-        attribute_query = cls.get_attribute_query()
+        cursor = cls.get_session_cursor()
         sql_query = f'''
-                SELECT  DISTINCT a.Value, COUNT(DISTINCT e.GUID), a.Checked, COUNT (DISTINCT a.Checked)
-                {attribute_query}
-                WHERE e.identifier {identifier}
-                AND e.ifc_type {ifc_type}
-                AND a.PropertySet {property_set}
-                AND a.Attribut {attribute}
-                AND a.Value IS NOT NULL
-                {filter_query}
-                GROUP BY a.Value ;
+                SELECT v.Value, SUM(v.entity_count), MAX(v.checked_count > 0),
+                    MAX(v.checked_count > 0) + MAX(v.checked_count < v.row_count)
+                FROM value_summary v
+                WHERE v.identifier {identifier}
+                AND v.ifc_type {ifc_type}
+                AND v.PropertySet {property_set}
+                AND v.Attribut {attribute}
+                GROUP BY v.Value ;
                     '''
 
         logging.debug(f"get Values: \n{sql_query}")
@@ -919,7 +1115,6 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
         logging.debug("Request Done")
 
         value_list = cursor.fetchall()
-        cls.disconnect_from_database()
 
         result_list = list()
         checkstate_dict = dict()
@@ -934,8 +1129,7 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
     def change_checkstate_of_values(cls, ifc_type, identifier, property_set, attribute, value_text, checkstate):
         logging.debug("Request Checkstate")
 
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
 
         sql_query = f"""
                 UPDATE attributes
@@ -946,41 +1140,46 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
                     JOIN entities  e on a.GUID = e.GUID
                     WHERE e.identifier {identifier}
                     AND e.ifc_type {ifc_type}
-                    )        
+                    )
                 AND PropertySet {property_set}
                 AND Attribut  {attribute}
                 AND Value {value_text}
             """
         cursor.execute(sql_query)
-        logging.debug("Request Done")
 
-        cls.disconnect_from_database()
+        # every raw row behind a matching summary row was updated, so the summary is either fully checked or not
+        cursor.execute(f"""
+                UPDATE value_summary
+                SET checked_count = CASE WHEN {checkstate} THEN row_count ELSE 0 END
+                WHERE identifier {identifier}
+                AND ifc_type {ifc_type}
+                AND PropertySet {property_set}
+                AND Attribut {attribute}
+                AND Value {value_text}
+            """)
+        logging.debug("Request Done")
+        cls.commit_session()
 
     @classmethod
     def count_objects(cls, ifc_type, identifier) -> int:
         logging.debug("Request ObjectCount")
 
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
         sql_query = f"""
-            SELECT count(distinct(e.guid))
-            FROM entities e
-            JOIN attributes a ON a.guid = e.guid
-            WHERE e.identifier {identifier}
-            AND e.ifc_type {ifc_type}
-            
+            SELECT COALESCE(SUM(s.entity_count), 0)
+            FROM object_summary s
+            WHERE s.identifier {identifier}
+            AND s.ifc_type {ifc_type}
             """
         cursor.execute(sql_query)
         value_list = cursor.fetchall()
-        cls.disconnect_from_database()
         logging.debug("Request Done")
 
         return value_list[0][0]
 
     @classmethod
     def get_new_attribute_values(cls):
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
         sql_query = f"""
             
             SELECT DISTINCT sa.identifier,sa.PropertySet,sa.Attribut, a.value
@@ -994,13 +1193,11 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
         cursor.execute(sql_query)
         value_list = cursor.fetchall()
-        cls.disconnect_from_database()
         return value_list
 
     @classmethod
     def get_removed_attribute_values(cls):
-        cls.connect_to_data_base(cls.get_database_path())
-        cursor = cls.get_cursor()
+        cursor = cls.get_session_cursor()
         sql_query = f"""
         
             SELECT DISTINCT sa.identifier,sa.PropertySet,sa.Attribut, a.value
@@ -1016,5 +1213,4 @@ class AttributeImportSQL(som_gui.core.tool.AttributeImportSQL):
 
         cursor.execute(sql_query)
         value_list = cursor.fetchall()
-        cls.disconnect_from_database()
         return value_list
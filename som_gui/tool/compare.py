@@ -7,6 +7,7 @@ from PySide6.QtGui import QIcon
 
 import som_gui
 import som_gui.core.tool
+from som_gui import tool
 from som_gui.module.compare import trigger
 from som_gui.module.compare import ui
 
@@ -144,3 +145,7 @@ class CompareWindow(som_gui.core.tool.CompareWindow):
         prop.window = None
         for _tool in cls.get_properties().tools:
             _tool.reset()
+        for project in prop.projects:
+            if project is not None and project is not tool.Project.get():
+                project.close()
+        prop.projects = [None, None]
@@ -10,11 +10,8 @@ import SOMcreator
 import SOMcreator.exporter.som_json
 import som_gui
 import som_gui.core.tool
-from SOMcreator.exporter import allplan, card1, vestra
-from SOMcreator.exporter.desite import bookmarks
-from SOMcreator.exporter.excel import core as excel_core
-from SOMcreator.exporter.excel.tool import ExportExcel
 
+# the exporters import lxml, openpyxl and jinja2, so they are imported when an export is started
 if TYPE_CHECKING:
     from som_gui.module.exports.prop import ExportProperties
 
@@ -34,6 +31,7 @@ class Exports(som_gui.core.tool.Exports):
 
     @classmethod
     def export_bookmarks(cls, project: SOMcreator.Project, path: str):
+        from SOMcreator.exporter.desite import bookmarks
         bookmarks.export_bookmarks(project, path)
 
     @classmethod
@@ -45,6 +43,7 @@ class Exports(som_gui.core.tool.Exports):
             caption = QCoreApplication.translate("Export", "Export Folder")
             export_folder = QFileDialog.getExistingDirectory(parent_window, caption, path)
             if export_folder:
+                from SOMcreator.exporter import vestra
                 vestra.create_mapping(excel_path, export_folder, project)
                 return export_folder
 
@@ -59,11 +58,14 @@ class Exports(som_gui.core.tool.Exports):
         path = QFileDialog.getSaveFileName(parent_window, caption, path, file_text)[0]
 
         if path:
+            from SOMcreator.exporter import card1
             card1.create_mapping(src, path, project)
             return path
 
     @classmethod
     def export_excel(cls, project: SOMcreator.Project, path: str):
+        from SOMcreator.exporter.excel import core as excel_core
+        from SOMcreator.exporter.excel.tool import ExportExcel
         excel_core.export(project, path, ExportExcel)
 
     @classmethod
@@ -72,6 +74,7 @@ class Exports(som_gui.core.tool.Exports):
 
     @classmethod
     def export_allplan(cls, project, path, name):
+        from SOMcreator.exporter import allplan
         allplan.create_mapping(project, path, name)
 
     @classmethod
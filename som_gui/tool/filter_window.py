@@ -155,6 +155,16 @@ class FilterWindow(som_gui.core.tool.FilterWindow):
     def get_active_object(cls) -> SOMcreator.Object:
         return cls.get_properties().active_object
 
+    @classmethod
+    def set_model_index(cls, item: SOMcreator.Object | SOMcreator.PropertySet | SOMcreator.Attribute,
+                        index: QModelIndex) -> QModelIndex:
+        cls.get_properties().model_indexes[item] = index
+        return index
+
+    @classmethod
+    def get_model_index(cls, item: SOMcreator.Object | SOMcreator.PropertySet | SOMcreator.Attribute) -> QModelIndex:
+        return cls.get_properties().model_indexes.get(item, QModelIndex())
+
     @classmethod
     def set_object_label(cls, value: str):
         cls.get().ui.label.setText(value)
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import atexit
 import datetime
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import traceback
 from typing import TYPE_CHECKING
 
 import appdirs
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, QTimer, Signal
 from PySide6.QtWidgets import QCheckBox, QMessageBox
 
 import som_gui
@@ -20,43 +23,55 @@ if TYPE_CHECKING:
 
 from som_gui.resources.icons import get_icon
 from som_gui import tool
-from som_gui.module.logging.constants import LOG_PATH, LOG_SECTION, LOG_LEVEL
+from som_gui.module.logging.constants import LOG_PATH, LOG_SECTION, LOG_LEVEL, POPUP_DELAY
 
 
 class CustomFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, style='%'):
         super().__init__(fmt, datefmt, style)
+        self.module_funcs: dict[tuple[str, str, str], str] = dict()
 
-    def format(self, record: logging.LogRecord):
+    def get_module_func(self, record: logging.LogRecord) -> str:
+        key = (record.pathname, record.module, record.funcName)
+        module_func = self.module_funcs.get(key)
+        if module_func is not None:
+            return module_func
         # Combine module and function name
-        path_name = record.pathname.split("\\")[-2]
+        path_name = os.path.basename(os.path.dirname(record.pathname.replace("\\", "/")))
         module_func = f"{path_name}.{record.module}.{record.funcName}"
         # Ensure the combined string is 50 characters long
         if len(module_func) > 50:
             module_func = module_func[:47] + '...'
         else:
             module_func = module_func.ljust(50)
+        self.module_funcs[key] = module_func
+        return module_func
 
+    def format(self, record: logging.LogRecord):
         # Set the custom attribute
-        record.module_func = module_func
-
+        record.module_func = self.get_module_func(record)
         return super().format(record)
 
 
 class Signaller(QObject):
-    error = Signal(logging.LogRecord, str)
+    records_collected = Signal()
 
 
 class PopupHandler(logging.Handler):
+    """
+    collects warnings for a summary popup. Only the first record of each code position gets formatted
+    """
+
     def __init__(self, parent=None):
         super().__init__()
         self.parent = parent
         self.signaller = tool.Logging.get_signaller()
 
     def emit(self, record):
-        if record.levelno >= logging.WARNING:
-            msg = self.format(record)
-            self.signaller.error.emit(record, msg)
+        if record.levelno < logging.WARNING:
+            return
+        if tool.Logging.collect_popup_record(record, self):
+            self.signaller.records_collected.emit()
 
 
 class Logging(som_gui.core.tool.Logging):
@@ -65,13 +80,60 @@ class Logging(som_gui.core.tool.Logging):
         return som_gui.LoggingProperties
 
     @classmethod
-    def show_popup(cls, record: logging.LogRecord, message):
-        level_no = record.levelno
-        # find path of error
-        identifier = f"{record.pathname}.{record.module}.{record.funcName}.{record.lineno}"
+    def get_record_key(cls, record: logging.LogRecord) -> tuple[str, str, int]:
+        return record.pathname, record.funcName, record.lineno
+
+    @classmethod
+    def collect_popup_record(cls, record: logging.LogRecord, handler: logging.Handler) -> bool:
+        """
+        counts the record for the summary popup. Returns True if the popup needs to be scheduled
+        """
+        prop = cls.get_properties()
+        key = cls.get_record_key(record)
         # if this error was set to be ignored, don't show popup
-        if identifier in cls.get_properties().ignore_texts:
-            return
+        if key in prop.ignore_texts:
+            return False
+        with prop.popup_lock:
+            entry = prop.popup_records.get(key)
+            if entry is not None:
+                entry[0] = max(entry[0], record.levelno)
+                entry[1] += 1
+                return False
+            prop.popup_records[key] = [record.levelno, 1, handler.format(record)]
+            if prop.popup_pending:
+                return False
+            prop.popup_pending = True
+            return True
+
+    @classmethod
+    def schedule_popup(cls):
+        QTimer.singleShot(POPUP_DELAY, cls.show_popup)
+
+    @classmethod
+    def take_popup_records(cls) -> dict[tuple[str, str, int], list]:
+        prop = cls.get_properties()
+        with prop.popup_lock:
+            records = prop.popup_records
+            prop.popup_records = dict()
+        return records
+
+    @classmethod
+    def show_popup(cls):
+        """
+        shows one popup for all records collected since the last popup
+        """
+        prop = cls.get_properties()
+        records = cls.take_popup_records()
+        if records:
+            cls.exec_summary_popup(records)
+        with prop.popup_lock:
+            prop.popup_pending = bool(prop.popup_records)
+        if prop.popup_pending:  # records arrived while the popup was open
+            cls.schedule_popup()
+
+    @classmethod
+    def exec_summary_popup(cls, records: dict[tuple[str, str, int], list]):
+        level_no = max(level for level, count, message in records.values())
         msg_box = QMessageBox()
         states = [
             (QMessageBox.Icon.Information, "Information"),
@@ -85,18 +147,56 @@ class Logging(som_gui.core.tool.Logging):
         msg_box.setWindowIcon(get_icon())
         title = tool.Util.get_window_title(str(level))
         msg_box.setWindowTitle(title)
-        msg_box.setText(f"An {level} occurred:")
-        msg_box.setDetailedText(message)
+        record_count = sum(count for level, count, message in records.values())
+        if record_count == 1:
+            msg_box.setText(f"An {level} occurred:")
+        else:
+            msg_box.setText(f"{record_count} messages occurred at {len(records)} positions:")
+        details = [message if count == 1 else f"[{count}x] {message}" for level, count, message in records.values()]
+        msg_box.setDetailedText("\n".join(details))
         if msg_box.exec_() and cb.isChecked():
-            cls.get_properties().ignore_texts.append(identifier)
+            cls.get_properties().ignore_texts += list(records)
 
     @classmethod
     def get_signaller(cls):
         if cls.get_properties().signaller is None:
             cls.get_properties().signaller = Signaller()
-            cls.get_properties().signaller.error.connect(cls.show_popup)
+            cls.get_properties().signaller.records_collected.connect(cls.schedule_popup)
         return cls.get_properties().signaller
 
+    @classmethod
+    def create_queue_handler(cls, handlers: list[logging.Handler]) -> logging.handlers.QueueHandler:
+        """
+        the handlers run in the thread of a QueueListener, so logging threads only put the record into a queue
+        """
+        cls.stop_queue_listener()
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        cls.get_properties().queue_listener = listener
+        atexit.unregister(cls.stop_queue_listener)
+        atexit.register(cls.stop_queue_listener)
+        return logging.handlers.QueueHandler(log_queue)
+
+    @classmethod
+    def stop_queue_listener(cls):
+        """
+        handles the remaining records and stops the thread of the QueueListener
+        """
+        listener = cls.get_properties().queue_listener
+        if listener is None:
+            return
+        cls.get_properties().queue_listener = None
+        listener.stop()
+
+    @classmethod
+    def get_handlers(cls) -> list[logging.Handler]:
+        handlers = list(cls.get_logger().handlers)
+        listener = cls.get_properties().queue_listener
+        if listener is not None:
+            handlers += listener.handlers
+        return handlers
+
     @classmethod
     def get_log_level(cls):
         return tool.Appdata.get_int_setting(LOG_SECTION, LOG_LEVEL, logging.WARNING)
@@ -106,7 +206,7 @@ class Logging(som_gui.core.tool.Logging):
         tool.Appdata.set_setting(LOG_SECTION, LOG_LEVEL, log_level)
 
         cls.get_logger().setLevel(log_level)
-        for handler in cls.get_logger().handlers:
+        for handler in cls.get_handlers():
             handler.setLevel(log_level)
         logging.info(f"Set Loglevel {log_level}")
 
@@ -123,12 +223,15 @@ class Logging(som_gui.core.tool.Logging):
             tool.Util.create_directory(path)
 
         tool.Appdata.set_path(LOG_PATH, path)
-        for handler in cls.get_logger().handlers:
-            if isinstance(handler, logging.FileHandler):
-                cls.get_logger().removeHandler(handler)
-                handler.close()
-
-        cls.get_logger().addHandler(cls.create_file_handler(cls.get_logging_filename()))
+        listener = cls.get_properties().queue_listener
+        if listener is None:
+            return
+        handlers = [handler for handler in listener.handlers if not isinstance(handler, logging.FileHandler)]
+        handlers.append(cls.create_file_handler(cls.get_logging_filename()))
+        old_file_handlers = [handler for handler in listener.handlers if isinstance(handler, logging.FileHandler)]
+        listener.handlers = tuple(handlers)
+        for handler in old_file_handlers:
+            handler.close()
 
     @classmethod
     def get_logging_directory(cls):
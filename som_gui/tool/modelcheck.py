@@ -7,20 +7,23 @@ from PySide6.QtCore import QObject, QRunnable, Signal
 from som_gui import tool
 
 if TYPE_CHECKING:
+    import ifcopenshell
+    from ifcopenshell import entity_instance
     from som_gui.module.modelcheck.prop import ModelcheckProperties
 import som_gui.core.tool
 import SOMcreator
+import bisect
 import datetime
 import logging
+import multiprocessing
 import re
 import sqlite3
-from ifcopenshell import entity_instance
-import ifcopenshell
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from som_gui.module.modelcheck.constants import *
-from ifcopenshell.util import element as ifc_el
 from SOMcreator import value_constants
 from som_gui.resources.data import constants
 from som_gui.module.modelcheck import trigger
+from som_gui.core.modelcheck import ELEMENT, ENTITY_CHECK_PLUGINS
 from PySide6.QtCore import QCoreApplication
 
 rev_datatype_dict = {
@@ -48,6 +51,83 @@ class Signaller(QObject):
     progress = Signal(int)
 
 
+class AttributeChecker:
+    """
+    precompiled value requirements of a single SOM Attribute
+    """
+
+    def __init__(self, attribute: SOMcreator.Attribute):
+        self.attribute_uuid = attribute.uuid
+        self.attribute_name = attribute.name
+        self.datatype = value_constants.DATATYPE_DICT.get(attribute.data_type)
+        values = list(attribute.value)
+
+        if attribute.value_type in (value_constants.FORMAT, constants.GER_FORMAT):
+            self.value_issue = "format_issue"
+            patterns = list()
+            for form in values:
+                try:
+                    patterns.append(re.compile(form))
+                except (re.error, TypeError):
+                    logging.warning(f"Attribute {attribute.name}: '{form}' is no valid format and will be ignored")
+            self.patterns = tuple(patterns)
+            # one alternation is faster than a match per format, but it renumbers groups (backreferences)
+            # and can't contain inline global flags like (?i), so those formats are matched one by one
+            self.pattern = None
+            if patterns and not any(pattern.groups for pattern in patterns):
+                try:
+                    self.pattern = re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+                except re.error:
+                    self.pattern = None
+
+        elif attribute.value_type in (value_constants.RANGE, constants.GER_RANGE):
+            self.value_issue = "range_issue"
+            ranges = sorted((min(possible_range), max(possible_range)) for possible_range in values if possible_range)
+            self.lower_bounds = [lower for lower, _ in ranges]
+            self.max_upper_bounds = list()
+            for _, upper in ranges:
+                previous = self.max_upper_bounds[-1] if self.max_upper_bounds else upper
+                self.max_upper_bounds.append(max(previous, upper))
+        else:
+            self.value_issue = "list_issue"
+            self.allowed_values = frozenset(str(v) for v in values) if values else None
+
+    def is_value_allowed(self, value) -> bool:
+        if self.value_issue == "format_issue":
+            text = str(value)
+            if self.pattern is not None:
+                return self.pattern.match(text) is not None
+            return any(pattern.match(text) for pattern in self.patterns)
+        if self.value_issue == "range_issue":
+            try:
+                index = bisect.bisect_right(self.lower_bounds, value) - 1
+                return index >= 0 and value <= self.max_upper_bounds[index]
+            except TypeError:
+                return False
+        return self.allowed_values is None or str(value) in self.allowed_values
+
+    def is_datatype_allowed(self, value) -> bool:
+        return self.datatype is None or isinstance(value, self.datatype)
+
+
+def _init_shard_worker(ifc_path: str, main_pset_name: str, main_attribute_name: str, rule_plan: dict):
+    """
+    runs once in every worker process of the process pool
+    """
+    import som_gui.module.modelcheck
+    som_gui.module.modelcheck.register()
+    Modelcheck.set_main_pset_name(main_pset_name)
+    Modelcheck.set_main_attribute_name(main_attribute_name)
+    Modelcheck.get_properties().rule_plan = rule_plan
+    import ifcopenshell
+    Modelcheck.get_properties().shard_file = ifcopenshell.open(ifc_path)
+
+
+def _run_shard(entity_ids: list[int]) -> tuple[list[int], list[tuple]]:
+    from som_gui.core import modelcheck as core
+    return entity_ids, core.check_shard(entity_ids, Modelcheck)
+
+
 class Modelcheck(som_gui.core.tool.Modelcheck):
     @classmethod
     def get_file_check_plugins(cls) -> list[Callable]:
@@ -141,57 +221,141 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
         return ModelcheckRunner(ifc_file)
 
     #######################################################################################
-    ###############################Modelchecks#############################################
+    ###############################Multiprocessing#########################################
     #######################################################################################
 
     @classmethod
-    def check_values(cls, value, attribute: SOMcreator.Attribute):
-        check_dict = {value_constants.LIST:   cls.check_list, value_constants.RANGE: cls.check_range,
-                      value_constants.FORMAT: cls.check_format, constants.GER_LIST: cls.check_list,
-                      constants.GER_VALUE:    cls.check_values, constants.GER_FORMAT: cls.check_format,
-                      constants.GER_RANGE:    cls.check_range}
-        func = check_dict[attribute.value_type]
-        func(value, attribute)
-        cls.check_datatype(value, attribute)
+    def get_process_count(cls) -> int:
+        return tool.Appdata.get_int_setting(SETTINGS_SECTION, PROCESS_COUNT, 1)
 
     @classmethod
-    def check_datatype(cls, value, attribute):
-        guid = cls.get_active_guid()
-        data_type = value_constants.DATATYPE_DICT[attribute.data_type]
-        element_type = cls.get_active_element_type()
-        if not isinstance(value, data_type):
-            cls.datatype_issue(guid, attribute, element_type, rev_datatype_dict[type(value)], value)
+    def compile_checkers(cls) -> dict[SOMcreator.Attribute, AttributeChecker]:
+        """
+        creates an AttributeChecker for every Attribute of the data_dict
+        needs to be called after build_data_dict
+        """
+        checker_dict = dict()
+        for pset_dict in cls.get_data_dict().values():
+            for attributes in pset_dict.values():
+                for attribute in attributes:
+                    if attribute not in checker_dict:
+                        checker_dict[attribute] = AttributeChecker(attribute)
+        cls.get_properties().checker_dict = checker_dict
+        cls.get_properties().rule_attributes = {attribute.uuid: attribute for attribute in checker_dict}
+        return checker_dict
 
     @classmethod
-    def check_format(cls, value, attribute):
-        element_type = cls.get_active_element_type()
-        guid = cls.get_active_guid()
-        is_ok = False
-        for form in attribute.value:
-            if re.match(form, value) is not None:
-                is_ok = True
-        if not is_ok:
-            cls.format_issue(guid, attribute, value)
+    def get_checker(cls, attribute: SOMcreator.Attribute) -> AttributeChecker:
+        return cls.get_properties().checker_dict[attribute]
+
+    @classmethod
+    def build_rule_plan(cls) -> dict:
+        """
+        converts the data_dict into plain python structures which can be sent to worker processes
+        needs to be called after compile_checkers
+        """
+        data_dict = cls.get_data_dict()
+        objects = dict()
+        for identifier, obj in cls.get_ident_dict().items():
+            if obj not in data_dict:
+                continue
+            objects[identifier] = [(property_set.name, [cls.get_checker(attribute) for attribute in attributes])
+                                   for property_set, attributes in data_dict[obj].items()]
+        rule_plan = {"identifiers": set(cls.get_ident_dict().keys()), "objects": objects}
+        cls.get_properties().rule_plan = rule_plan
+        return rule_plan
+
+    @classmethod
+    def get_rule_plan(cls) -> dict:
+        return cls.get_properties().rule_plan
+
+    @classmethod
+    def get_shard_file(cls) -> ifcopenshell.file:
+        return cls.get_properties().shard_file
+
+    @classmethod
+    def run_shards(cls, entities: list[entity_instance], rule_plan: dict) -> Iterator[tuple[list[int], list[tuple]]]:
+        """
+        evaluates the entities in a process pool and yields the findings of every shard once it is done
+        leaving the iteration early cancels all shards that didn't start yet
+        """
+        entity_ids = [entity.id() for entity in entities]
+        shards = [entity_ids[i:i + SHARD_SIZE] for i in range(0, len(entity_ids), SHARD_SIZE)]
+        initargs = (cls.get_ifc_path(), cls.get_main_pset_name(), cls.get_main_attribute_name(), rule_plan)
+        executor = ProcessPoolExecutor(max_workers=cls.get_process_count(),
+                                       mp_context=multiprocessing.get_context("spawn"),
+                                       initializer=_init_shard_worker, initargs=initargs)
+        futures = [executor.submit(_run_shard, shard) for shard in shards]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def evaluate_attribute_rules(cls, element: entity_instance, pset_rules: list[tuple]) -> list[tuple]:
+        """
+        counterpart of check_for_attributes which returns findings instead of writing issues
+        """
+        entity_id, guid = element.id(), element.GlobalId
+        pset_dict = cls.get_element_psets(element)
+        findings = list()
+        for pset_name, checkers in pset_rules:
+            if pset_name not in pset_dict:
+                findings.append((entity_id, "property_set_issue", (guid, pset_name, ELEMENT)))
+                continue
+            for checker in checkers:
+                attribute_name = checker.attribute_name
+                if attribute_name not in pset_dict[pset_name]:
+                    findings.append((entity_id, "attribute_issue", (guid, pset_name, attribute_name, ELEMENT)))
+                    continue
+                value = pset_dict[pset_name][attribute_name]
+                if value is None or value == "":
+                    findings.append((entity_id, "empty_value_issue", (guid, pset_name, attribute_name, ELEMENT)))
+                else:
+                    value_findings = cls.evaluate_value(guid, value, checker, ELEMENT)
+                    findings += [(entity_id, name, args) for name, args in value_findings]
+        return findings
+
+    @classmethod
+    def evaluate_value(cls, guid: str, value, checker: AttributeChecker, element_type: str) -> list[tuple[str, tuple]]:
+        findings = list()
+        if not checker.is_value_allowed(value):
+            if checker.value_issue == "format_issue":
+                findings.append((checker.value_issue, (guid, checker.attribute_uuid, value)))
+            else:
+                findings.append((checker.value_issue, (guid, checker.attribute_uuid, element_type, value)))
+        if not checker.is_datatype_allowed(value):
+            findings.append(("datatype_issue", (guid, checker.attribute_uuid, element_type,
+                                                rev_datatype_dict[type(value)], value)))
+        return findings
 
     @classmethod
-    def check_list(cls, value, attribute):
-        if not attribute.value:
+    def replay_finding(cls, element: entity_instance, name: str, args: tuple):
+        """
+        writes a finding of a worker process into the database
+        """
+        if name == ENTITY_CHECK_PLUGINS:
+            for plugin_func in cls.get_entity_check_plugins():
+                plugin_func(element)
             return
-        element_type = cls.get_active_element_type()
-        guid = cls.get_active_guid()
-        if str(value) not in [str(v) for v in attribute.value]:
-            cls.list_issue(guid, attribute, element_type, value)
+        if name == "db_create_entity":
+            cls.db_create_entity(element, *args)
+            return
+        if name in ATTRIBUTE_ISSUES:
+            args = (args[0], cls.get_properties().rule_attributes[args[1]]) + args[2:]
+        getattr(cls, name)(*args)
+
+    #######################################################################################
+    ###############################Modelchecks#############################################
+    #######################################################################################
 
     @classmethod
-    def check_range(cls, value, attribute):
-        is_ok = False
-        element_type = cls.get_active_element_type()
-        guid = cls.get_active_guid()
-        for possible_range in attribute:
-            if min(possible_range) <= value <= max(possible_range):
-                is_ok = True
-        if not is_ok:
-            cls.range_issue(guid, attribute, element_type, value)
+    def check_values(cls, value, attribute: SOMcreator.Attribute):
+        element = cls.get_active_element()
+        checker = cls.get_checker(attribute)
+        for name, args in cls.evaluate_value(element.GlobalId, value, checker, cls.get_active_element_type()):
+            cls.replay_finding(element, name, args)
 
     @classmethod
     def check_for_attributes(cls, element, obj: SOMcreator.Object):
@@ -199,7 +363,7 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
         element_type = cls.get_active_element_type()
         guid = cls.get_active_guid()
         data_dict = cls.get_data_dict()
-        pset_dict = ifc_el.get_psets(element)
+        pset_dict = cls.get_element_psets(element)
 
         for property_set in data_dict[obj]:
             pset_name = property_set.name
@@ -323,6 +487,7 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
         logging.info(f"Database: {db_path}")
 
         cls.connect_to_data_base(db_path)
+        cls.get_cursor().execute("PRAGMA journal_mode=WAL")
         cls.create_tables()
         cls.disconnect_from_data_base()
 
@@ -334,16 +499,16 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
         project_name = tool.Project.get().name
         file_name = cls.get_ifc_name()
 
-        query = f"""
+        query = """
         DELETE FROM issues
         WHERE short_description in (
         SELECT short_description from issues
         INNER JOIN entities  on issues.GUID = entities.GUID
-        where issues.creation_date = '{creation_date}'
-        AND entities.Project = '{project_name}'
-        AND entities.datei = '{file_name}')
+        where issues.creation_date = ?
+        AND entities.Project = ?
+        AND entities.datei = ?)
         """
-        cursor.execute(query)
+        cursor.execute(query, (str(creation_date), project_name, file_name))
         cls.commit_sql()
 
     @classmethod
@@ -367,23 +532,19 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
 
     @classmethod
     def add_issues(cls, guid, description, issue_type, attribute, pset_name="", attribute_name="", value=""):
-        cursor = cls.get_cursor()
         guid_zw = tool.Util.transform_guid(guid, True)
         date = datetime.date.today()
         if attribute is not None:
             pset_name = attribute.property_set.name
             attribute_name = attribute.name
-        request = f'''
-              INSERT INTO issues (GUID_ZWC,creation_date,GUID,short_description,issue_type,PropertySet,Attribut,Value)
-                    VALUES
-                    ('{guid_zw}','{date}','{guid}','{description}',{issue_type},'{pset_name}','{attribute_name}','{value}')
-              '''
-        cursor.execute(request)
-        cls.commit_sql()
+        row = (guid_zw, str(date), guid, description, issue_type, pset_name, attribute_name, str(value))
+        issue_buffer = cls.get_properties().issue_buffer
+        issue_buffer.append(row)
+        if len(issue_buffer) >= cls.get_properties().batch_size:
+            cls.flush_sql_buffer()
 
     @classmethod
     def db_create_entity(cls, element: entity_instance, bauteil_klasse):
-        cursor = cls.get_cursor()
         file_name = cls.get_ifc_name()
         project = tool.Project.get().name
         guid_zwc = tool.Util.transform_guid(element.GlobalId, True)
@@ -398,27 +559,88 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
             return
         else:
             guids[guid] = file_name
-        try:
-            cursor.execute(f'''
-                      INSERT INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
-                            VALUES
-                            ('{guid_zwc}','{guid}','{name}','{project}','{ifc_type}',{center[0]},{center[1]},{center[2]},'{file_name}','{bauteil_klasse}')
-                      ''')
-            cls.commit_sql()
-        except sqlite3.IntegrityError:
-            logging.warning("Integrity Error -> Element allready exists")
-            pass
+        row = (guid_zwc, guid, str(name), project, ifc_type, center[0], center[1], center[2], file_name,
+               str(bauteil_klasse))
+        entity_buffer = cls.get_properties().entity_buffer
+        entity_buffer.append(row)
+        if len(entity_buffer) >= cls.get_properties().batch_size:
+            cls.flush_sql_buffer()
+
+    @classmethod
+    def flush_sql_buffer(cls):
+        """
+        writes buffered entities and issues into the database using one transaction
+        """
+        prop = cls.get_properties()
+        if prop.connection is None or not (prop.entity_buffer or prop.issue_buffer):
+            return
+        cursor = cls.get_cursor()
+        if prop.entity_buffer:
+            cursor.executemany('''
+                      INSERT OR IGNORE INTO entities (GUID_ZWC,GUID,Name,Project,ifc_type,x_pos,y_pos,z_pos,datei,bauteilKlassifikation)
+                            VALUES (?,?,?,?,?,?,?,?,?,?)
+                      ''', prop.entity_buffer)
+            if cursor.rowcount < len(prop.entity_buffer):
+                logging.warning("Integrity Error -> Element allready exists")
+        if prop.issue_buffer:
+            cursor.executemany('''
+                  INSERT INTO issues (GUID_ZWC,creation_date,GUID,short_description,issue_type,PropertySet,Attribut,Value)
+                        VALUES (?,?,?,?,?,?,?,?)
+                  ''', prop.issue_buffer)
+        cls.commit_sql()
+        prop.entity_buffer = list()
+        prop.issue_buffer = list()
 
     ## Getter and Setter
+    @classmethod
+    def get_element_psets(cls, entity: entity_instance) -> dict[str, dict]:
+        """
+        cached replacement for ifcopenshell.util.element.get_psets
+        psets of IfcTypeObjects are resolved only once and shared by all occurrences
+        """
+        pset_cache = cls.get_properties().pset_cache
+        entity_id = entity.id()
+        if entity_id in pset_cache:
+            return pset_cache[entity_id]
+
+        from ifcopenshell.util import element as ifc_el  # ifcopenshell is loaded with the first modelcheck
+        element_type = ifc_el.get_type(entity)
+        if element_type is None or element_type == entity:
+            psets = ifc_el.get_psets(entity)
+        else:
+            psets = {name: dict(pset) for name, pset in cls.get_type_psets(element_type).items()}
+            for name, pset in ifc_el.get_psets(entity, should_inherit=False).items():
+                psets.setdefault(name, {}).update(pset)
+        pset_cache[entity_id] = psets
+        return psets
+
+    @classmethod
+    def get_type_psets(cls, element_type: entity_instance) -> dict[str, dict]:
+        type_pset_cache = cls.get_properties().type_pset_cache
+        type_id = element_type.id()
+        if type_id not in type_pset_cache:
+            from ifcopenshell.util import element as ifc_el
+            type_pset_cache[type_id] = ifc_el.get_psets(element_type)
+        return type_pset_cache[type_id]
+
+    @classmethod
+    def evict_element_psets(cls, entity: entity_instance):
+        cls.get_properties().pset_cache.pop(entity.id(), None)
+
+    @classmethod
+    def reset_pset_cache(cls):
+        cls.get_properties().pset_cache = dict()
+        cls.get_properties().type_pset_cache = dict()
+
     @classmethod
     def get_ident_value(cls, entity: entity_instance, main_pset_name=None, main_attribute_name=None):
         pset_name = cls.get_main_pset_name() if main_pset_name is None else main_pset_name
         attribute_name = cls.get_main_attribute_name() if main_attribute_name is None else main_attribute_name
-        return ifc_el.get_pset(entity, pset_name, attribute_name)
+        return cls.get_attribute_value(entity, pset_name, attribute_name)
 
     @classmethod
     def get_attribute_value(cls, entity: entity_instance, pset_name: str, attribute_name: str):
-        psets = ifc_el.get_psets(entity)
+        psets = cls.get_element_psets(entity)
         pset = psets.get(pset_name)
         if not pset:
             return None
@@ -426,12 +648,12 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
 
     @classmethod
     def is_pset_existing(cls, entity: entity_instance, pset_name: str):
-        psets = ifc_el.get_psets(entity)
+        psets = cls.get_element_psets(entity)
         return psets.get(pset_name) is not None
 
     @classmethod
     def is_attribute_existing(cls, entity: entity_instance, pset_name: str, attribute_name: str) -> bool:
-        psets = ifc_el.get_psets(entity)
+        psets = cls.get_element_psets(entity)
         pset = psets.get(pset_name)
         if not pset:
             return False
@@ -477,6 +699,14 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
     def set_ifc_name(cls, value):
         cls.get_properties().ifc_name = value
 
+    @classmethod
+    def get_ifc_path(cls) -> str:
+        return cls.get_properties().ifc_path
+
+    @classmethod
+    def set_ifc_path(cls, value: str):
+        cls.get_properties().ifc_path = value
+
     @classmethod
     def get_main_attribute_name(cls):
         return cls.get_properties().main_attribute_name
@@ -548,10 +778,14 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
     @classmethod
     def connect_to_data_base(cls, path):
         conn = sqlite3.connect(path)
+        conn.execute("PRAGMA synchronous=NORMAL")
         cls.get_properties().connection = conn
+        cls.get_properties().entity_buffer = list()
+        cls.get_properties().issue_buffer = list()
 
     @classmethod
     def disconnect_from_data_base(cls):
+        cls.flush_sql_buffer()
         cls.get_properties().connection.commit()
         cls.get_properties().connection.close()
         cls.get_properties().connection = None
@@ -8,9 +8,6 @@ from PySide6.QtWidgets import QMainWindow, QMenu, QMenuBar
 
 import SOMcreator
 import som_gui.core.tool
-from SOMcreator.exporter.IDS import main
-from SOMcreator.exporter.bim_collab_zoom import modelcheck as bc_modelcheck
-from SOMcreator.exporter.desite import modelcheck
 from som_gui import tool
 from som_gui.module.modelcheck_external import trigger, ui
 
@@ -102,6 +99,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         path = tool.Popups.get_save_path(file_format, cls.get_window())
         if not path:
             return
+        from SOMcreator.exporter.IDS import main  # lxml is loaded with the first export
         data_dict = cls.get_data_dict()
         main.export(tool.Project.get(), data_dict, path)
 
@@ -111,6 +109,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         path = tool.Popups.get_save_path(file_format, cls.get_window())
         if not path:
             return
+        from SOMcreator.exporter.bim_collab_zoom import modelcheck as bc_modelcheck
         data_dict = cls.get_data_dict()
         bc_modelcheck.export(data_dict, path, tool.Project.get().author)
 
@@ -122,6 +121,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         if not path:
             return
 
+        from SOMcreator.exporter.desite import modelcheck
         data_dict = cls.get_data_dict()
         modelcheck.fast_check(tool.Project.get(), pset_name, attribute_name, data_dict, path)
 
@@ -131,6 +131,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         path = tool.Popups.get_save_path(file_format, cls.get_window())
         if not path:
             return
+        from SOMcreator.exporter.desite import modelcheck
         data_dict = cls.get_data_dict()
         modelcheck.csv_export(data_dict, path)
 
@@ -142,6 +143,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         path = tool.Popups.get_save_path(file_format, cls.get_window())
         if not path:
             return
+        from SOMcreator.exporter.desite import modelcheck
         data_dict = cls.get_data_dict()
         object_structure = cls._build_tree()
         modelcheck.export(tool.Project.get(), data_dict, path, main_pset=pset_name,
@@ -156,6 +158,7 @@ class ModelcheckExternal(som_gui.core.tool.ModelcheckExternal):
         if not path:
             return
 
+        from SOMcreator.exporter.desite import modelcheck
         data_dict = cls.get_data_dict()
         project = tool.Project.get()
         modelcheck.export(project, data_dict, path, main_pset=pset_name, main_attribute=attribute_name,
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
+import csv
+import itertools
 import os
 import sqlite3
-from typing import TYPE_CHECKING
+from typing import Iterable, Iterator, TYPE_CHECKING
 
 import openpyxl
 from PySide6.QtCore import QCoreApplication
-from openpyxl.cell.cell import Cell
 from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
 from openpyxl.worksheet.table import Table, TableStyleInfo
-from openpyxl.worksheet.worksheet import Worksheet
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ModuleNotFoundError:
+    pyarrow = None
 
 import som_gui
 import som_gui.core.tool
 from som_gui import tool
 from som_gui.module.modelcheck_results import trigger
+from som_gui.module.modelcheck_results.constants import CSV, MAX_EXCEL_ROWS, PARQUET, XLSX
 
 if TYPE_CHECKING:
     from som_gui.module.modelcheck_results.prop import ModelcheckResultProperties
@@ -45,53 +52,95 @@ class ModelcheckResults(som_gui.core.tool.ModelcheckResults):
         trigger.last_modelcheck_finished(tool.Modelcheck.get_database_path())
 
     @classmethod
-    def autofit_column_width(cls, worksheet: Worksheet):
-        max_widths = cls.get_max_width(worksheet)
-        dim_holder = DimensionHolder(worksheet=worksheet)
-        for col in range(worksheet.min_column, worksheet.max_column + 1):
-            dim_holder[get_column_letter(col)] = ColumnDimension(worksheet, min=col, max=col,
-                                                                 width=max_widths[col - 1] * 1.1)
-        worksheet.column_dimensions = dim_holder
+    def set_column_widths(cls, worksheet: WriteOnlyWorksheet, widths: list[int]):
+        """
+        a write-only worksheet writes its column definitions together with the first row,
+        so the widths have to be set before anything is appended
+        """
+        for column_index, width in enumerate(widths, start=1):
+            worksheet.column_dimensions[get_column_letter(column_index)].width = width * 1.1
+
+    @classmethod
+    def get_column_widths(cls, rows: Iterable[Iterable]) -> list[int]:
+        col_widths = [0 for _ in cls.get_header()]
+        for row in rows:
+            for c_index, value in enumerate(row):
+                col_widths[c_index] = max(col_widths[c_index], len(str(value)))
+        return col_widths
 
     @classmethod
-    def create_table(cls, worksheet: Worksheet, last_cell: Cell):
-        table_zone = f"A1:{last_cell.coordinate}"
+    def create_table(cls, worksheet: WriteOnlyWorksheet, row_count: int):
+        header = cls.get_header()
+        table_zone = f"A1:{get_column_letter(len(header))}{row_count}"
         tab = Table(displayName="Issues", ref=table_zone)
+        # write-only worksheets can't read the header cells back, the table columns are named explicitly
+        tab._initialise_columns()
+        for table_column, name in zip(tab.tableColumns, header):
+            table_column.name = name
         style = TableStyleInfo(name="TableStyleMedium9", showFirstColumn=False, showLastColumn=False,
                                showRowStripes=True, showColumnStripes=True)
         tab.tableStyleInfo = style
         worksheet.add_table(tab)
 
     @classmethod
-    def fill_worksheet(cls, issues, ws: Worksheet):
-        last_cell = ws.cell(1, len(cls.get_header()) - 1)
-        for row_index, column in enumerate(issues, start=2):
-            for column_index, value in enumerate(column, start=1):
-                last_cell = ws.cell(row_index, column_index, value)  # remove Whitespace
-        return last_cell
+    def fill_worksheet(cls, issues: Iterator[tuple], ws: WriteOnlyWorksheet) -> int:
+        """
+        streams the issues into the worksheet. The column widths are estimated from the first rows
+        :return: number of written rows including the header
+        """
+        header = cls.get_header()
+        sample = list(itertools.islice(issues, cls.get_properties().width_sample_size))
+        cls.set_column_widths(ws, cls.get_column_widths([header] + sample))
+        ws.append(header)
+        row_count = 1
+        for row in itertools.chain(sample, issues):
+            ws.append(row)
+            row_count += 1
+        return row_count
 
     @classmethod
-    def create_workbook(cls) -> tuple[openpyxl.Workbook, Worksheet]:
-
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        for col_index, value in enumerate(cls.get_header(), start=1):
-            worksheet.cell(1, col_index, value)
+    def create_workbook(cls) -> tuple[openpyxl.Workbook, WriteOnlyWorksheet]:
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
         return workbook, worksheet
 
     @classmethod
-    def get_properties(cls) -> ModelcheckResultProperties:
-        return som_gui.ModelcheckResultProperties
+    def write_csv(cls, issues: Iterator[tuple], path: str):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file, delimiter=";")
+            writer.writerow(cls.get_header())
+            writer.writerows(issues)
 
     @classmethod
-    def get_max_width(cls, worksheet: Worksheet) -> list[int]:
-        col_widths = [0 for _ in range(worksheet.max_column)]
-        for row in worksheet:
-            for c_index, cell in enumerate(row):
-                length = len(str(cell.value))
-                if length > col_widths[c_index]:
-                    col_widths[c_index] = length
-        return col_widths
+    def is_parquet_available(cls) -> bool:
+        return pyarrow is not None
+
+    @classmethod
+    def write_parquet(cls, issues: Iterator[tuple], path: str):
+        header = cls.get_header()
+        schema = pyarrow.schema([(name, pyarrow.string()) for name in header])
+        chunk_size = cls.get_properties().chunk_size
+        with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+            while chunk := list(itertools.islice(issues, chunk_size)):
+                columns = [[None if value is None else str(value) for value in column] for column in zip(*chunk)]
+                writer.write_table(pyarrow.Table.from_arrays(columns, schema=schema))
+
+    @classmethod
+    def get_export_format(cls, path: str) -> str:
+        extension = os.path.splitext(path)[1].lower().lstrip(".")
+        return extension if extension in (CSV, PARQUET) else XLSX
+
+    @classmethod
+    def get_csv_path(cls, path: str) -> str:
+        return f"{os.path.splitext(path)[0]}.{CSV}"
+
+    @classmethod
+    def get_max_excel_rows(cls) -> int:
+        return MAX_EXCEL_ROWS
+
+    @classmethod
+    def get_properties(cls) -> ModelcheckResultProperties:
+        return som_gui.ModelcheckResultProperties
 
     @classmethod
     def get_export_path(cls):
@@ -102,12 +151,31 @@ class ModelcheckResults(som_gui.core.tool.ModelcheckResults):
         cls.get_properties().excel_export_path = value
 
     @classmethod
-    def query_issues(cls, path: os.PathLike | str) -> list:
+    def count_issues(cls, path: os.PathLike | str) -> int:
         conn = sqlite3.connect(path)
-        cursor = conn.cursor()
-        cursor.execute(
-            'SELECT i.creation_date, e.GUID,e.ifc_type,i.short_description,i.issue_type,e.Name,e.bauteilKlassifikation,'
-            'i.PropertySet,i.Attribut,i.Value, e.datei   FROM issues AS i JOIN entities e on i.GUID = e.GUID')
-        conn.commit()
-        query = cursor.fetchall()
-        return query
+        try:
+            return conn.execute("SELECT COUNT(*) FROM issues AS i JOIN entities e on i.GUID = e.GUID").fetchone()[0]
+        finally:
+            conn.close()
+
+    @classmethod
+    def iter_issues(cls, path: os.PathLike | str) -> Iterator[tuple]:
+        """
+        yields the issues in chunks of chunk_size rows instead of loading the whole result into memory
+        """
+        chunk_size = cls.get_properties().chunk_size
+        conn = sqlite3.connect(path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                'SELECT i.creation_date, e.GUID,e.ifc_type,i.short_description,i.issue_type,e.Name,'
+                'e.bauteilKlassifikation,i.PropertySet,i.Attribut,i.Value, e.datei'
+                '   FROM issues AS i JOIN entities e on i.GUID = e.GUID')
+            while rows := cursor.fetchmany(chunk_size):
+                yield from rows
+        finally:
+            conn.close()
+
+    @classmethod
+    def query_issues(cls, path: os.PathLike | str) -> list:
+        return list(cls.iter_issues(path))
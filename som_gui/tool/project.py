@@ -59,8 +59,7 @@ class Project(som_gui.core.tool.Project):
     def create_project(cls):
         logging.info("Create new Project")
         proj = SOMcreator.Project()
-        prop: ProjectProperties = cls.get_properties()
-        prop.active_project = proj
+        cls.set_active_project(proj)
         som_gui.on_new_project()
 
     @classmethod
@@ -71,8 +70,14 @@ class Project(som_gui.core.tool.Project):
 
     @classmethod
     def set_active_project(cls, proj: SOMcreator.Project):
+        """
+        closes the previous Project, so its items can be released
+        """
         prop = cls.get_properties()
+        if prop.active_project is not None and prop.active_project is not proj:
+            prop.active_project.close()
         prop.active_project = proj
+        SOMcreator.active_project = proj
 
     @classmethod
     def get(cls) -> SOMcreator.Project:
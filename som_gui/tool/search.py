@@ -1,22 +1,44 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import heapq
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
+from typing import Any, TYPE_CHECKING
 
-from PySide6.QtCore import QCoreApplication, Qt
-from PySide6.QtWidgets import QTableWidget, QTableWidgetItem
+from PySide6.QtCore import QCoreApplication, QModelIndex, QObject, QRunnable, QThreadPool, QTimer, Qt, Signal
 
 import som_gui
 import som_gui.core.tool
 from som_gui import __version__ as version
 from som_gui import tool
 from som_gui.module import search
-from som_gui.module.project.constants import CLASS_REFERENCE, UMLAUT_DICT
+from som_gui.module.project.constants import UMLAUT_DICT
+from som_gui.module.search.constants import SEARCH_DELAY, SEARCH_LIMIT
+from som_gui.module.search.prop import SearchIndex
 
 if TYPE_CHECKING:
     from som_gui.module.search.prop import SearchProperties
     from som_gui.module.search.ui import SearchWindow
 import SOMcreator
-from thefuzz import fuzz
+
+
+class SearchSignaller(QObject):
+    finished = Signal()
+
+
+class SearchRunner(QRunnable):
+    def __init__(self, search_id: int, search_index: SearchIndex, search_text: str, threshold: int):
+        super(SearchRunner, self).__init__()
+        self.search_id = search_id
+        self.search_index = search_index
+        self.search_text = search_text
+        self.threshold = threshold
+        self.results: list[tuple[int, int]] = list()
+        self.signaller = SearchSignaller()
+
+    def run(self):
+        self.results = Search.query_search_index(self.search_index, self.search_text, self.threshold, SEARCH_LIMIT)
+        self.signaller.finished.emit()
 
 
 class Search(som_gui.core.tool.Search):
@@ -55,7 +77,7 @@ class Search(som_gui.core.tool.Search):
         prop = cls.get_search_properties()
         prop.search_mode = 1
         prop.search_window = search.ui.SearchWindow()
-        prop.search_window.ui.tableWidget.itemDoubleClicked.connect(cls.activate_item)
+        cls.connect_dialog(prop.search_window)
         cls.fill_dialog()
         cls.retranslate_title(prop.search_window, prop.search_mode)
         if not prop.search_window.exec():
@@ -67,7 +89,7 @@ class Search(som_gui.core.tool.Search):
         prop = cls.get_search_properties()
         prop.search_mode = 2
         prop.search_window = search.ui.SearchWindow()
-        prop.search_window.ui.tableWidget.itemDoubleClicked.connect(cls.activate_item)
+        cls.connect_dialog(prop.search_window)
         cls.fill_dialog()
         cls.retranslate_title(prop.search_window, prop.search_mode)
 
@@ -75,72 +97,144 @@ class Search(som_gui.core.tool.Search):
             return None
         return prop.selected_info
 
+    @classmethod
+    def connect_dialog(cls, widget: SearchWindow):
+        widget.ui.tableView.doubleClicked.connect(cls.activate_item)
+        widget.ui.lineEdit.textChanged.connect(search.trigger.search_text_changed)
+
     @classmethod
     def fill_dialog(cls):
         dialog = cls.get_dialog()
-        table = dialog.ui.tableWidget
+        table = dialog.ui.tableView
         header_texts = cls.get_column_texts()
-        table.setColumnCount(len(header_texts) + 1)
-        table.setHorizontalHeaderLabels(header_texts)
-        for item_row in cls.create_table_items():
-            row = table.rowCount()
-            table.insertRow(row)
-            [table.setItem(row, col, item) for col, item in enumerate(item_row)]
+        search_index = cls.get_search_index(cls.create_table_items())
+        table.setModel(search.ui.SearchModel(search_index, header_texts))
+        table.sortByColumn(len(header_texts), Qt.SortOrder.DescendingOrder)
+        table.hideColumn(len(header_texts))
 
     @classmethod
-    def create_table_items(cls):
+    def create_table_items(cls) -> list[tuple[Any, list[str]]]:
+        """
+        returns the rows of the search table as (data, texts)
+        """
         item_dict = dict()
         project: SOMcreator.Project = tool.Project.get()
         if cls.get_search_mode() == 1:
             for obj in project.get_objects(filter=True):
                 item_dict[obj] = [obj.name, obj.ident_value, obj.abbreviation]
         elif cls.get_search_mode() == 2:
-            attributes = filter(lambda item: isinstance(item, SOMcreator.Attribute),
-                                project.get_hirarchy_items(filter=False))
-            for attribute in attributes:
+            for attribute in project.get_attributes(filter=False):
                 val = tuple([attribute.property_set.name, attribute.name])
-                item_dict[val] = val
-
-        item_list = list()
-        for data, values in item_dict.items():
-            items = [QTableWidgetItem(text) for text in values]
-            [i.setData(CLASS_REFERENCE, data) for i in items]
-            item_list.append(items)
-        return item_list
-
-    @classmethod
-    def refresh_dialog(cls, widget: SearchWindow, threshold):
-        widget_ui = widget.ui
-        widget_ui.tableWidget.setSortingEnabled(False)
-        search_text = widget_ui.lineEdit.text()
-        search_text = search_text.translate(UMLAUT_DICT)
-        column_count = len(cls.get_column_texts())
-        widget_ui.tableWidget.hideColumn(column_count)
-        for row in range(widget_ui.tableWidget.rowCount()):
-            ration = cls.check_row(widget_ui.tableWidget, search_text, row, column_count)
-            if ration > threshold:
-                widget_ui.tableWidget.showRow(row)
-            else:
-                widget_ui.tableWidget.hideRow(row)
-        widget_ui.tableWidget.setSortingEnabled(True)
-        widget_ui.tableWidget.resizeColumnsToContents()
-        widget_ui.tableWidget.sortByColumn(column_count, Qt.SortOrder.DescendingOrder)
-
-    @classmethod
-    def check_row(cls, table: QTableWidget, search_text: str, row: int, column_count: int) -> float:
-        model = table.model()
-        texts = [table.item(row, col).text().lower() for col in range(column_count)]
-        ratio = max(fuzz.ratio(search_text, text) for text in texts)
-        model.setData(model.index(row, column_count), ratio, Qt.ItemDataRole.DisplayRole)
-        return ratio
+                item_dict[val] = list(val)
+        return list(item_dict.items())
+
+    @classmethod
+    def normalize_text(cls, text: str) -> str:
+        return text.lower().translate(UMLAUT_DICT)
+
+    @classmethod
+    def create_search_index(cls, rows: list[tuple[Any, list[str]]]) -> SearchIndex:
+        text_dict: dict[str, list[int]] = dict()
+        for row, (data, texts) in enumerate(rows):
+            for text in texts:
+                text_rows = text_dict.setdefault(cls.normalize_text(text), list())
+                if not text_rows or text_rows[-1] != row:
+                    text_rows.append(row)
+        texts = sorted(text_dict, key=len)
+        return SearchIndex(rows, texts, [len(text) for text in texts], [tuple(text_dict[text]) for text in texts])
+
+    @classmethod
+    def get_search_index(cls, rows: list[tuple[Any, list[str]]]) -> SearchIndex:
+        """
+        the index of a search mode is reused as long as the rows of the project don't change
+        """
+        prop = cls.get_search_properties()
+        search_index = prop.search_indexes.get(prop.search_mode)
+        if search_index is None or search_index.rows != rows:
+            search_index = cls.create_search_index(rows)
+            prop.search_indexes[prop.search_mode] = search_index
+        return search_index
+
+    @classmethod
+    def reset_search_indexes(cls):
+        cls.get_search_properties().search_indexes = dict()
+
+    @classmethod
+    def query_search_index(cls, search_index: SearchIndex, search_text: str, threshold: int, limit: int) -> list[
+        tuple[int, int]]:
+        """
+        returns the best rows as (row, score) for the fuzz ratio of search_text and the texts of the row.
+        Only rows whose score is above the threshold are returned
+        """
+        from rapidfuzz import fuzz, process  # loaded with the first search instead of at startup
+        search_text = cls.normalize_text(search_text)
+        if not search_text:
+            return list()
+        lengths = search_index.lengths
+        start, stop = 0, len(lengths)
+        if 0 < threshold < 100:
+            # the ratio of two texts is at most 200 * shorter length / (sum of lengths)
+            factor = threshold / (200 - threshold)
+            start = bisect_left(lengths, len(search_text) * factor)
+            stop = bisect_right(lengths, len(search_text) / factor)
+        matches = process.extract(search_text, search_index.texts[start:stop], scorer=fuzz.ratio, limit=None,
+                                  score_cutoff=threshold)
+        scores: dict[int, int] = dict()
+        for text, score, text_index in matches:
+            score = int(round(score))
+            if score <= threshold:
+                continue
+            for row in search_index.text_rows[start + text_index]:
+                if scores.get(row, -1) < score:
+                    scores[row] = score
+        return heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+
+    @classmethod
+    def restart_search_timer(cls):
+        prop = cls.get_search_properties()
+        if prop.search_timer is None:
+            prop.search_timer = QTimer()
+            prop.search_timer.setSingleShot(True)
+            prop.search_timer.timeout.connect(search.trigger.refresh_window)
+        prop.search_timer.start(SEARCH_DELAY)
+
+    @classmethod
+    def get_thread_pool(cls) -> QThreadPool:
+        prop = cls.get_search_properties()
+        if prop.thread_pool is None:
+            prop.thread_pool = QThreadPool()
+            prop.thread_pool.setMaxThreadCount(1)
+        return prop.thread_pool
+
+    @classmethod
+    def create_search_runner(cls, widget: SearchWindow, threshold: int) -> SearchRunner:
+        prop = cls.get_search_properties()
+        prop.search_id += 1
+        search_index = widget.ui.tableView.model().search_index
+        return SearchRunner(prop.search_id, search_index, widget.ui.lineEdit.text(), threshold)
+
+    @classmethod
+    def connect_search_runner(cls, runner: SearchRunner):
+        runner.signaller.finished.connect(lambda: search.trigger.search_finished(runner))
+
+    @classmethod
+    def is_latest_search(cls, runner: SearchRunner) -> bool:
+        return runner.search_id == cls.get_search_properties().search_id
+
+    @classmethod
+    def set_search_results(cls, widget: SearchWindow, results: list[tuple[int, int]]):
+        table = widget.ui.tableView
+        table.model().set_results(results)
+        header = table.horizontalHeader()
+        table.sortByColumn(header.sortIndicatorSection(), header.sortIndicatorOrder())
+        table.resizeColumnsToContents()
 
     @classmethod
     def get_search_properties(cls) -> SearchProperties:
         return som_gui.SearchProperties
 
     @classmethod
-    def activate_item(cls):
-        item = cls.get_dialog().ui.tableWidget.selectedItems()[0]
+    def activate_item(cls, index: QModelIndex):
         prop = cls.get_search_properties()
-        prop.selected_info = item.data(CLASS_REFERENCE)
+        prop.selected_info = cls.get_dialog().ui.tableView.model().get_data(index.row())
         cls.get_dialog().accept()
@@ -141,13 +141,7 @@ class Util(som_gui.core.tool.Util):
 
     @classmethod
     def create_directory(cls, path: os.PathLike):
-        cur_path = list()
-        split_path = str(path).split(os.sep)
-        for path in split_path:
-            cur_path.append(path)
-            p = "/".join(cur_path)
-            if not os.path.exists(p):
-                os.mkdir(p)
+        os.makedirs(path, exist_ok=True)
 
     @classmethod
     def get_new_name(cls, standard_name: str, existing_names: list[str]) -> str:
@@ -0,0 +1,42 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+import SOMcreator
+from SOMcreator.constants import value_constants
+from som_gui.tool.modelcheck import AttributeChecker
+
+
+def create_format_attribute(formats: list[str]) -> SOMcreator.Attribute:
+    project = SOMcreator.Project()
+    obj = SOMcreator.Object("Object", "1", project=project)
+    property_set = SOMcreator.PropertySet("Pset", obj, project=project)
+    return SOMcreator.Attribute(property_set, "Attribute", formats, value_constants.FORMAT, project=project)
+
+
+def test_format_with_inline_global_flag():
+    checker = AttributeChecker(create_format_attribute(["abc", "(?i)def"]))
+    assert checker.is_value_allowed("abc")
+    assert checker.is_value_allowed("DEF")
+    assert not checker.is_value_allowed("xyz")
+
+
+def test_format_with_backreference():
+    checker = AttributeChecker(create_format_attribute(["(a)x", r"(b)\1"]))
+    assert checker.is_value_allowed("ax")
+    assert checker.is_value_allowed("bb")
+    assert not checker.is_value_allowed("ba")
+
+
+def test_formats_without_groups_are_combined():
+    checker = AttributeChecker(create_format_attribute(["a+", "b+"]))
+    assert checker.pattern is not None
+    assert checker.is_value_allowed("aaa")
+    assert checker.is_value_allowed("bb")
+    assert not checker.is_value_allowed("c")
+
+
+def test_invalid_format_is_ignored():
+    checker = AttributeChecker(create_format_attribute(["(", "a"]))
+    assert checker.is_value_allowed("a")
+    assert not checker.is_value_allowed("(")